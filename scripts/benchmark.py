@@ -0,0 +1,406 @@
+"""
+Throughput benchmark of process_pdf and PDFConverter over the samples in
+tests/test_data and generated documents of growing size (see
+tests/generate_samples.py).
+
+Every (document, api, mode, backend, workers) combination runs in a fresh
+process, so model loading and peak memory are measured independently;
+--mode text_only compares text-only mode (no page or picture images) against
+the default mode. --backend process converts on a ProcessPoolConverter (whose
+workers run process_pdf) instead of threads, and --workers sets how many
+conversions of the document run at the same time on either backend.
+The first round of conversions is reported as the cold latency (including
+building the converters or starting the worker processes and loading the
+models), the median of --warm-runs further rounds in the same process as the
+warm latency. Documents and pages per second are computed from the warm
+latency. Peak memory includes the worker processes of the process backend.
+
+Results can be written to a JSON file (--json) and compared against such a
+file saved earlier (--baseline): a warm latency or peak memory more than
+--threshold above the baseline is reported as a regression and makes the
+script exit with status 1.
+
+Usage:
+    python scripts/benchmark.py [--filter NAME] [--synthetic-pages 10,100]
+        [--synthetic-formats pdf,docx] [--api API] [--mode MODE]
+        [--backend BACKEND] [--workers 1,4] [--warm-runs N]
+        [--json results.json] [--baseline baseline.json]
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TEST_DATA_DIR = PROJECT_ROOT / "tests" / "test_data"
+sys.path.insert(0, str(PROJECT_ROOT / "tests"))
+SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".pptx", ".xlsx"}
+APIS = ("process_pdf", "PDFConverter")
+# Conversion modes, by their text_only option
+MODES = {"default": False, "text_only": True}
+# The process backend's workers run process_pdf, so it has no other api
+BACKENDS = ("thread", "process")
+# Metrics compared against the baseline (lower is better)
+COMPARED_METRICS = ("warm_seconds", "max_rss_mb")
+
+
+def _output_size(output_dir: Path) -> int:
+    return sum(p.stat().st_size for p in output_dir.rglob("*") if p.is_file())
+
+
+def _page_count(input_path: Path) -> int | None:
+    if input_path.suffix.lower() != ".pdf":
+        return None
+    from docling_lib.pages import count_pages
+
+    return count_pages(input_path)
+
+
+def _run_one(
+    input_path: Path,
+    api: str,
+    mode: str,
+    backend: str,
+    workers: int,
+    warm_runs: int,
+    queue,
+) -> None:
+    """
+    Converts input_path workers times at once, 1 + warm_runs times over, with
+    api in mode on backend and reports the measurements.
+    """
+    # Read by docling_lib.config: the converters the thread backend runs at once
+    os.environ["DOCLING_CONVERTER_WORKERS"] = str(workers)
+    from docling_lib.converter import (
+        DocumentConversionOptions,
+        PDFConverter,
+        process_pdf,
+    )
+    from docling_lib.memory import PeakRssSampler, rss_bytes
+    from docling_lib.process_pool import ProcessPoolConverter
+
+    options = DocumentConversionOptions(text_only=MODES[mode], use_cache=False)
+    pool: ProcessPoolConverter | None = None
+    local = threading.local()
+
+    def _convert(output_dir: Path) -> Path | None:
+        if backend == "process":
+            return pool.convert(input_path, output_dir, options)
+        if api == "PDFConverter":
+            # One converter per thread; the cold run includes building them
+            if not hasattr(local, "converter"):
+                local.converter = PDFConverter(options)
+            return local.converter.convert(input_path, output_dir)
+        return process_pdf(input_path, output_dir, options=options)
+
+    def _rss() -> int | None:
+        total = rss_bytes()
+        if total is None or pool is None:
+            return total
+        return total + sum(rss_bytes(pid) or 0 for pid in pool.worker_pids())
+
+    latencies = []
+    results = []
+    # process_pdf only writes below the working directory
+    with (
+        tempfile.TemporaryDirectory(dir=Path.cwd()) as tmp,
+        ThreadPoolExecutor(max_workers=workers) as threads,
+        PeakRssSampler(measure=_rss) as memory,
+    ):
+        for run in range(1 + warm_runs):
+            output_dirs = [Path(tmp) / str(run) / str(i) for i in range(workers)]
+            start = time.perf_counter()
+            if backend == "process" and pool is None:
+                # The cold run includes starting the workers and their models
+                pool = ProcessPoolConverter(workers=workers, preload_options=options)
+            results = list(threads.map(_convert, output_dirs))
+            latencies.append(time.perf_counter() - start)
+        size = _output_size(Path(tmp) / str(warm_runs) / "0")
+        if pool is not None:
+            pool.shutdown()
+
+    warm_seconds = statistics.median(latencies[1:]) if warm_runs else None
+    pages = _page_count(input_path)
+    queue.put(
+        {
+            "ok": all(result is not None for result in results),
+            "pages": pages,
+            "cold_seconds": latencies[0],
+            "warm_seconds": warm_seconds,
+            "docs_per_second": workers / warm_seconds if warm_seconds else None,
+            "pages_per_second": (
+                pages * workers / warm_seconds if pages and warm_seconds else None
+            ),
+            # ru_maxrss (KiB on Linux) misses the memory of worker processes
+            "max_rss_mb": max(
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                (memory.peak_bytes or 0) / 1024**2,
+            ),
+            "output_bytes": size,
+        }
+    )
+
+
+def benchmark(
+    input_path: Path, api: str, mode: str, backend: str, workers: int, warm_runs: int
+) -> dict:
+    """Runs _run_one in a fresh process and returns its measurements."""
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(
+        target=_run_one,
+        args=(input_path, api, mode, backend, workers, warm_runs, queue),
+    )
+    process.start()
+    process.join()
+    if process.exitcode != 0:
+        return {"ok": False}
+    return queue.get()
+
+
+def synthetic_documents(
+    page_counts: list[int], formats: list[str], directory: Path
+) -> list[Path]:
+    """
+    Generates documents with the given page counts: a table every other page,
+    and an image and a formula every fifth page.
+    """
+    from generate_samples import SampleSpec, generate
+
+    return [
+        generate(
+            SampleSpec(
+                format=file_format,
+                pages=pages,
+                tables_per_page=0.5,
+                images=pages // 5,
+                formulas=pages // 5,
+            ),
+            directory,
+        )
+        for file_format in formats
+        for pages in page_counts
+    ]
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """
+    Returns a description of every metric that is more than threshold
+    (a fraction) worse than in the baseline run of the same document, api and
+    mode.
+    """
+    previous = {_key(r): r for r in baseline}
+    regressions = []
+    for r in results:
+        base = previous.get(_key(r))
+        if base is None or not (r["ok"] and base.get("ok")):
+            continue
+        for metric in COMPARED_METRICS:
+            value, reference = r.get(metric), base.get(metric)
+            if value is None or not reference:
+                continue
+            if value > reference * (1 + threshold):
+                regressions.append(
+                    f"{r['file']} ({_describe(r)}): {metric} {value:.2f} vs "
+                    f"{reference:.2f} in the baseline (+{value / reference - 1:.0%})"
+                )
+    return regressions
+
+
+def _key(result: dict) -> tuple[str, str, str, str, int]:
+    # Results saved before modes and backends existed were all in the default
+    # mode, converting one document at a time on threads
+    return (
+        result["file"],
+        result["api"],
+        result.get("mode", "default"),
+        result.get("backend", "thread"),
+        result.get("workers", 1),
+    )
+
+
+def _describe(result: dict) -> str:
+    _, api, mode, backend, workers = _key(result)
+    return f"{api}, {mode}, {backend} x{workers}"
+
+
+def _format_value(value, spec: str) -> str:
+    return "" if value is None else format(value, spec)
+
+
+def _format_table(results: list[dict]) -> str:
+    lines = [
+        "| file | api | mode | backend | workers | pages | cold (s) | warm (s) "
+        "| docs/s | pages/s | max RSS (MB) | output (KB) |",
+        "|---|---|---|---|---:|---:|---:|---:|---:|---:|---:|---:|",
+    ]
+    for r in results:
+        columns = (
+            f"| {r['file']} | {r['api']} | {r['mode']} | {r['backend']} "
+            f"| {r['workers']} |"
+        )
+        if not r["ok"]:
+            lines.append(f"{columns} failed | | | | | | |")
+            continue
+        lines.append(
+            f"{columns} {_format_value(r['pages'], 'd')} | "
+            f"{r['cold_seconds']:.2f} | {_format_value(r['warm_seconds'], '.2f')} | "
+            f"{_format_value(r['docs_per_second'], '.2f')} | "
+            f"{_format_value(r['pages_per_second'], '.1f')} | {r['max_rss_mb']:.0f} | "
+            f"{r['output_bytes'] / 1024:.0f} |"
+        )
+    return "\n".join(lines)
+
+
+def _page_counts(value: str) -> list[int]:
+    return [int(pages) for pages in value.split(",") if pages.strip()]
+
+
+def _formats(value: str) -> list[str]:
+    return [
+        file_format.strip() for file_format in value.split(",") if file_format.strip()
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark conversion throughput.")
+    parser.add_argument(
+        "--filter", type=str, help="Only benchmark files containing this string."
+    )
+    parser.add_argument(
+        "--api",
+        choices=APIS,
+        action="append",
+        help="API to benchmark (repeatable, default: all).",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        action="append",
+        help="Conversion mode to benchmark (repeatable, default: default).",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        action="append",
+        help="Conversion backend to benchmark (repeatable, default: thread).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_page_counts,
+        default=[1],
+        help=("Conversions running at the same time, comma separated (default: 1)."),
+    )
+    parser.add_argument(
+        "--synthetic-pages",
+        type=_page_counts,
+        default=[1, 10, 50],
+        help=(
+            "Page counts of the generated documents, comma separated "
+            "(default: 1,10,50; empty for none)."
+        ),
+    )
+    parser.add_argument(
+        "--synthetic-formats",
+        type=_formats,
+        default=["pdf"],
+        help="Formats of the generated documents, comma separated (default: pdf).",
+    )
+    parser.add_argument(
+        "--warm-runs", type=int, default=2, help="Warm conversions per document."
+    )
+    parser.add_argument(
+        "--json", type=Path, help="Also write the results to this JSON file."
+    )
+    parser.add_argument(
+        "--baseline", type=Path, help="Compare against results saved with --json."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help=(
+            "Relative slowdown or memory growth reported as a regression "
+            "(default: 0.2)."
+        ),
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = sorted(
+            f for f in TEST_DATA_DIR.iterdir() if f.suffix in SUPPORTED_EXTENSIONS
+        )
+        files += synthetic_documents(
+            args.synthetic_pages, args.synthetic_formats, Path(tmp)
+        )
+        if args.filter:
+            files = [f for f in files if args.filter in f.name]
+        if not files:
+            logger.error(f"No matching test files found in {TEST_DATA_DIR}")
+            return 1
+
+        combinations = [
+            (api, mode, backend, workers)
+            for api in args.api or APIS
+            for mode in args.mode or ["default"]
+            for backend in args.backend or ["thread"]
+            for workers in args.workers
+            if backend == "thread" or api == "process_pdf"
+        ]
+        results = []
+        for input_path in files:
+            for api, mode, backend, workers in combinations:
+                result = {
+                    "file": input_path.name,
+                    "api": api,
+                    "mode": mode,
+                    "backend": backend,
+                    "workers": workers,
+                }
+                print(
+                    f"Benchmarking {input_path.name} ({_describe(result)})...",
+                    file=sys.stderr,
+                )
+                measurements = benchmark(
+                    input_path, api, mode, backend, workers, args.warm_runs
+                )
+                results.append(result | measurements)
+
+    print(_format_table(results))
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    status = 0 if all(r["ok"] for r in results) else 1
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        if regressions:
+            status = 1
+        else:
+            print(f"No regressions against {args.baseline}", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
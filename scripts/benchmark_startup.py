@@ -0,0 +1,89 @@
+"""
+Measures the startup time of the CLI and the server: the import time of
+docling_lib.cli and docling_lib.server, and a full `--help` run of the CLI.
+The import of docling_lib.converter (which loads Docling) is measured for
+reference.
+
+Every measurement runs in a fresh interpreter; the median of --runs runs is
+reported. tests/test_startup.py enforces the budgets.
+
+Usage:
+    python scripts/benchmark_startup.py [--runs N] [--json results.json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Prints the import time of a module, measured inside the child interpreter
+_IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - start)"
+)
+
+IMPORTS = ["docling_lib.cli", "docling_lib.server", "docling_lib.converter"]
+
+
+def measure_import(module: str) -> float:
+    """Returns the time needed to import module in a fresh interpreter."""
+    # Runs this interpreter on a fixed snippet, with no untrusted input
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _IMPORT_SNIPPET.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_cli_help() -> float:
+    """Returns the wall time of `python -m docling_lib.cli --help`."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "docling_lib.cli", "--help"],
+        check=True,
+        capture_output=True,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark CLI and server startup time."
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement.")
+    parser.add_argument(
+        "--json", type=Path, help="Also write the results to this JSON file."
+    )
+    args = parser.parse_args()
+
+    measurements = {f"import {module}": (measure_import, module) for module in IMPORTS}
+    measurements["cli --help"] = (measure_cli_help, None)
+
+    results = {}
+    for name, (measure, arg) in measurements.items():
+        print(f"Measuring {name}...", file=sys.stderr)
+        try:
+            runs = [measure(arg) if arg else measure() for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"  failed: {e.stderr}", file=sys.stderr)
+            results[name] = None
+            continue
+        results[name] = statistics.median(runs)
+
+    print("| measurement | median (s) |")
+    print("|---|---:|")
+    for name, seconds in results.items():
+        print(f"| {name} | {'failed' if seconds is None else f'{seconds:.3f}'} |")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from collections import deque
+
+from .overload import QueueFull, RetryAfterEstimator
+
+
+class AdmissionController:
+    """
+    Bounds the requests being served to max_in_flight, with at most
+    max_queue more waiting for a slot in arrival order. Further requests are
+    rejected at once with QueueFull, so that a burst degrades into quick rejections instead
+    of a growing pile of requests that all time out.
+
+    Waiters are plain futures of the running loop, so one controller can
+    serve several event loops (as the test client does).
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int):
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue = max(0, max_queue)
+        self.in_flight = 0
+        self.rejected = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._durations = RetryAfterEstimator(self.max_in_flight)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely to be free for a new request."""
+        return self._durations.retry_after(self.queue_depth + 1)
+
+    async def acquire(self) -> float:
+        """
+        Takes a slot, waiting in the queue if needed, and returns the seconds
+        waited. Raises QueueFull when the queue is full.
+        """
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            return 0.0
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise QueueFull("Admission queue", self.retry_after())
+
+        start = time.perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # release() hands its slot over by resolving the future
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.done() and not waiter.cancelled():
+                # The slot arrived together with the cancellation: pass it on
+                self.release()
+            raise
+        return time.perf_counter() - start
+
+    def release(self, held_seconds: float | None = None) -> None:
+        """Frees a slot, giving it to the longest waiting request if any."""
+        if held_seconds is not None:
+            self._durations.record(held_seconds)
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.get_loop().call_soon_threadsafe(self._hand_over, waiter)
+                return
+        self.in_flight -= 1
+
+    def _hand_over(self, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            # Cancelled since it left the queue: the slot goes to the next one
+            self.release()
+        else:
+            waiter.set_result(None)
@@ -0,0 +1,115 @@
+import tarfile
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:  # Optional: pip install zstandard
+    zstandard = None
+
+# Size of the pieces read from disk and sent to the client
+CHUNK_SIZE = 1024 * 1024
+# Already compressed formats are stored in ZIP archives as they are
+_COMPRESSED_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".zst", ".gz", ".zip"}
+
+
+def archive_files(root: Path) -> list[tuple[Path, str]]:
+    """
+    Lists the regular files below root with their archive names (POSIX paths
+    relative to root), in a stable order. Symbolic links are skipped so that
+    an archive never includes files from outside root.
+    """
+    files = []
+    for path in sorted(root.rglob("*")):
+        if path.is_symlink() or not path.is_file():
+            continue
+        files.append((path, path.relative_to(root).as_posix()))
+    return files
+
+
+class _Sink:
+    """Write-only, unseekable file object that collects what is written."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip(root: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yields a ZIP archive of the files below root while it is being built.
+    The archive goes to an unseekable sink, so zipfile writes the sizes and
+    checksums after each file (data descriptors) and nothing but the current
+    chunk is held in memory.
+    """
+    sink = _Sink()
+    with zipfile.ZipFile(sink, "w") as archive:
+        for path, name in archive_files(root):
+            info = zipfile.ZipInfo.from_file(path, name)
+            info.compress_type = (
+                zipfile.ZIP_STORED
+                if path.suffix.lower() in _COMPRESSED_SUFFIXES
+                else zipfile.ZIP_DEFLATED
+            )
+            with path.open("rb") as src, archive.open(info, "w") as dest:
+                while chunk := src.read(chunk_size):
+                    dest.write(chunk)
+                    if data := sink.drain():
+                        yield data
+            if data := sink.drain():
+                yield data
+    yield sink.drain()
+
+
+def iter_tar(root: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yields an uncompressed tar archive of the files below root, header by
+    header and chunk by chunk.
+    """
+    for path, name in archive_files(root):
+        stat = path.stat()
+        info = tarfile.TarInfo(name)
+        info.size = stat.st_size
+        info.mtime = int(stat.st_mtime)
+        info.mode = 0o644
+        yield info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+
+        # Exactly the announced size, even if the file changes meanwhile
+        remaining = info.size
+        with path.open("rb") as src:
+            while remaining and (chunk := src.read(min(chunk_size, remaining))):
+                remaining -= len(chunk)
+                yield chunk
+        padding = remaining + (-info.size % tarfile.BLOCKSIZE)
+        if padding:
+            yield tarfile.NUL * padding
+    # End-of-archive marker
+    yield tarfile.NUL * (2 * tarfile.BLOCKSIZE)
+
+
+def iter_tar_zst(
+    root: Path, chunk_size: int = CHUNK_SIZE, level: int = 3
+) -> Iterator[bytes]:
+    """
+    Yields a zstd-compressed tar archive of the files below root, compressing
+    the output of iter_tar as it is produced. Requires zstandard.
+    """
+    if zstandard is None:
+        raise RuntimeError("zstandard is not installed")
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    for data in iter_tar(root, chunk_size):
+        if compressed := compressor.compress(data):
+            yield compressed
+    yield compressor.flush()
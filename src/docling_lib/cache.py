@@ -0,0 +1,420 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .utils import sanitize_log_message
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024  # 1MB chunks
+_ENTRY_MARKDOWN = "document.md"
+_ENTRY_FILES = "files"
+_ENTRY_META = "meta.json"
+_ENTRY_PAGE = "page.json"
+_TRASH_PREFIX = ".del-"
+# Interval of the full rescans that pick up entries written by other processes
+_RESCAN_SECONDS = 300.0
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how the conversion cache has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    # Per-page results used by incremental conversion
+    page_hits: int = 0
+    page_misses: int = 0
+
+
+def _dir_size(path: Path) -> int:
+    """Returns the total size in bytes of all files below path."""
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+@dataclass
+class _IndexEntry:
+    """In-memory record of an entry on disk."""
+
+    created_at: float
+    size: int
+    # Readers currently copying the entry; pinned entries are never removed
+    pins: int = 0
+
+
+class ConversionCache:
+    """
+    Content-addressed on-disk cache of conversion outputs.
+
+    Entries are keyed by the SHA-256 of the input bytes combined with the
+    options that change the generated output. The store is bounded by a total
+    size cap (least recently used entries are evicted first) and a TTL.
+    It also holds the converted pages of incremental conversion, keyed by a
+    fingerprint of each page's content, under the same bounds.
+
+    Sizes and the access order are kept in an in-memory index, read from disk
+    once, so that eviction never has to scan the store. The lock only guards
+    the index: files are copied outside of it, with the entry pinned so that
+    it cannot be evicted meanwhile. Entries written by other processes (e.g.
+    the workers of the process backend) are picked up when they are first
+    read, and by a full rescan at most every _RESCAN_SECONDS.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int, ttl_seconds: float):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Least recently used first
+        self._index: OrderedDict[str, _IndexEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._scanned_at = 0.0
+        # Directories removed from the index, deleted outside of the lock
+        self._trash: list[Path] = []
+        self._rescan()
+
+    def make_key(self, input_path: Path, signature: dict[str, Any]) -> str:
+        """Hashes the input file and the output-affecting options into a key."""
+        file_digest = hashlib.sha256()
+        with input_path.open("rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                file_digest.update(chunk)
+
+        return self._combine_key(file_digest.digest(), signature)
+
+    def make_page_key(self, fingerprint: str, signature: dict[str, Any]) -> str:
+        """Combines a page content fingerprint and the pipeline options into a key."""
+        return self._combine_key(b"page:" + fingerprint.encode("ascii"), signature)
+
+    @staticmethod
+    def _combine_key(digest: bytes, signature: dict[str, Any]) -> str:
+        key_digest = hashlib.sha256(digest)
+        key_digest.update(json.dumps(signature, sort_keys=True).encode("utf-8"))
+        return key_digest.hexdigest()
+
+    def restore(self, key: str, output_dir: Path, md_output_name: str) -> Path | None:
+        """
+        Copies a cached entry into output_dir.
+        Returns the path of the restored Markdown file, or None on a miss.
+        """
+        entry_dir = self._pin(key)
+        if entry_dir is None:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            files_dir = entry_dir / _ENTRY_FILES
+            if files_dir.exists():
+                shutil.copytree(files_dir, output_dir, dirs_exist_ok=True)
+            md_path = output_dir / md_output_name
+            shutil.copyfile(entry_dir / _ENTRY_MARKDOWN, md_path)
+            # The meta file's mtime keeps the access order across restarts
+            os.utime(entry_dir / _ENTRY_META)
+        except OSError as e:
+            logger.warning(
+                f"Failed to restore cache entry {key}: {sanitize_log_message(e)}"
+            )
+            md_path = None
+        finally:
+            self._unpin(key)
+
+        with self._lock:
+            if md_path is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return md_path
+
+    def store(self, key: str, md_path: Path, artifacts: list[Path]) -> None:
+        """
+        Stores a conversion result. artifacts are extra files or directories
+        (e.g. the image directory) located next to md_path.
+        Failures are logged and never propagated to the caller.
+        """
+        output_dir = md_path.parent
+        tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.cache_dir))
+        try:
+            shutil.copyfile(md_path, tmp_dir / _ENTRY_MARKDOWN)
+            for artifact in artifacts:
+                if not artifact.exists():
+                    continue
+                target = tmp_dir / _ENTRY_FILES / artifact.relative_to(output_dir)
+                if artifact.is_dir():
+                    shutil.copytree(artifact, target)
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(artifact, target)
+
+            size = _dir_size(tmp_dir)
+            if size > self.max_bytes:
+                logger.info(f"Skipping cache store for {key}: entry exceeds size cap")
+                return
+
+            entry = _IndexEntry(created_at=time.time(), size=size)
+            self._write_meta(tmp_dir, entry)
+            self._commit([(key, tmp_dir, entry)])
+            with self._lock:
+                self.stats.stores += 1
+
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Failed to store cache entry {key}: {sanitize_log_message(e)}"
+            )
+        finally:
+            if tmp_dir.exists():
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def restore_page(self, key: str) -> str | None:
+        """Returns the stored page result for key, or None on a miss."""
+        entry_dir = self._pin(key)
+        if entry_dir is None:
+            with self._lock:
+                self.stats.page_misses += 1
+            return None
+
+        try:
+            data = (entry_dir / _ENTRY_PAGE).read_text(encoding="utf-8")
+            os.utime(entry_dir / _ENTRY_META)
+        except OSError:
+            data = None
+        finally:
+            self._unpin(key)
+
+        with self._lock:
+            if data is None:
+                self.stats.page_misses += 1
+            else:
+                self.stats.page_hits += 1
+        return data
+
+    def store_pages(self, pages: list[tuple[str, str]]) -> None:
+        """
+        Stores (key, page result) pairs, evicting once for the whole batch.
+        Failures are logged and never propagated to the caller.
+        """
+        if not pages:
+            return
+        stored = []
+        try:
+            for key, data in pages:
+                tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.cache_dir))
+                page_path = tmp_dir / _ENTRY_PAGE
+                page_path.write_text(data, encoding="utf-8")
+                entry = _IndexEntry(
+                    created_at=time.time(), size=page_path.stat().st_size
+                )
+                stored.append((key, tmp_dir, entry))
+                self._write_meta(tmp_dir, entry)
+
+            self._commit(stored)
+
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to store page results: {sanitize_log_message(e)}")
+        finally:
+            for _, tmp_dir, _ in stored:
+                if tmp_dir.exists():
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def clear(self) -> None:
+        """Removes every cache entry that is not being read."""
+        with self._lock:
+            for key, entry in list(self._index.items()):
+                if not entry.pins:
+                    self._discard_locked(key)
+        self._empty_trash()
+
+    def size_bytes(self) -> int:
+        """Returns the total size of all cache entries."""
+        with self._lock:
+            return self._total_bytes
+
+    @staticmethod
+    def _read_meta(entry_dir: Path) -> _IndexEntry | None:
+        """
+        Returns the index entry recorded in the meta file of entry_dir, or None
+        when the file is missing or malformed (e.g. only partly written).
+        """
+        try:
+            meta = json.loads((entry_dir / _ENTRY_META).read_text(encoding="utf-8"))
+            return _IndexEntry(
+                created_at=float(meta["created_at"]), size=int(meta["size"])
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _write_meta(entry_dir: Path, entry: _IndexEntry) -> None:
+        (entry_dir / _ENTRY_META).write_text(
+            json.dumps({"created_at": entry.created_at, "size": entry.size}),
+            encoding="utf-8",
+        )
+
+    def _is_expired(self, entry: _IndexEntry) -> bool:
+        return time.time() - entry.created_at > self.ttl_seconds
+
+    def _rescan(self) -> None:
+        """
+        Reconciles the index with the entries on disk and drops expired ones.
+        The directory is read without holding the lock; only the merge
+        happens under it.
+        """
+        found = []
+        for entry_dir in self.cache_dir.iterdir():
+            if entry_dir.name.startswith(_TRASH_PREFIX):
+                # Left behind by an interrupted deletion
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                continue
+            if entry_dir.name.startswith(".") or not entry_dir.is_dir():
+                continue
+            entry = self._read_meta(entry_dir)
+            if entry is None:
+                continue
+            try:
+                last_access = (entry_dir / _ENTRY_META).stat().st_mtime
+            except OSError:
+                continue
+            found.append((last_access, entry_dir.name, entry))
+        on_disk = {key for _, key, _ in found}
+
+        with self._lock:
+            for key, entry in list(self._index.items()):
+                if entry.pins:
+                    continue
+                if key not in on_disk:
+                    self._discard_locked(key, delete=False)
+                elif self._is_expired(entry):
+                    self._discard_locked(key)
+                    self.stats.expirations += 1
+            for _, key, entry in sorted(found, key=lambda f: f[0], reverse=True):
+                if key in self._index:
+                    continue
+                if self._is_expired(entry):
+                    self._trash_locked(key)
+                    self.stats.expirations += 1
+                    continue
+                self._add_locked(key, entry)
+                # Unknown entries are older than the ones in use: insert them
+                # at the front, keeping the access order of their files
+                self._index.move_to_end(key, last=False)
+            self._scanned_at = time.monotonic()
+            self._evict_locked()
+        self._empty_trash()
+
+    def _lookup_locked(self, key: str) -> _IndexEntry | None:
+        """
+        Returns the live index entry of key and marks it as recently used.
+        Entries unknown to the index are looked up on disk, as another process
+        may have stored them. Expired entries are discarded. The caller must
+        hold self._lock and call _empty_trash() after releasing it.
+        """
+        entry = self._index.get(key)
+        if entry is None:
+            entry = self._read_meta(self.cache_dir / key)
+            if entry is None:
+                return None
+            self._add_locked(key, entry)
+
+        if self._is_expired(entry) and not entry.pins:
+            self._discard_locked(key)
+            self.stats.expirations += 1
+            return None
+        self._index.move_to_end(key)
+        return entry
+
+    def _pin(self, key: str) -> Path | None:
+        """Pins a live entry against removal and returns its directory."""
+        with self._lock:
+            entry = self._lookup_locked(key)
+            if entry is not None:
+                entry.pins += 1
+        self._empty_trash()
+        return None if entry is None else self.cache_dir / key
+
+    def _unpin(self, key: str) -> None:
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is not None:
+                entry.pins -= 1
+
+    def _commit(self, stored: list[tuple[str, Path, _IndexEntry]]) -> None:
+        """
+        Moves freshly written entries into place and evicts once for the
+        batch. An entry that is being read is left as it is: keys are content
+        addressed, so it holds the same result.
+        """
+        with self._lock:
+            for key, tmp_dir, entry in stored:
+                existing = self._index.get(key)
+                if existing is not None and existing.pins:
+                    continue
+                if existing is not None:
+                    self._discard_locked(key)
+                else:
+                    # Possibly written by another process meanwhile
+                    self._trash_locked(key)
+                os.replace(tmp_dir, self.cache_dir / key)
+                self._add_locked(key, entry)
+            self._evict_locked()
+            rescan = time.monotonic() - self._scanned_at > _RESCAN_SECONDS
+        self._empty_trash()
+        if rescan:
+            self._rescan()
+
+    def _add_locked(self, key: str, entry: _IndexEntry) -> None:
+        self._index[key] = entry
+        self._total_bytes += entry.size
+
+    def _discard_locked(self, key: str, delete: bool = True) -> None:
+        """Drops key from the index and, with delete, its directory."""
+        entry = self._index.pop(key)
+        self._total_bytes -= entry.size
+        if delete:
+            self._trash_locked(key)
+
+    def _trash_locked(self, key: str) -> None:
+        """
+        Renames the directory of key out of the way, if it exists. It is
+        deleted by _empty_trash() once the lock is released.
+        """
+        trash = self.cache_dir / f"{_TRASH_PREFIX}{key}-{uuid.uuid4().hex}"
+        try:
+            os.replace(self.cache_dir / key, trash)
+        except OSError:
+            return
+        self._trash.append(trash)
+
+    def _empty_trash(self) -> None:
+        with self._lock:
+            trash, self._trash = self._trash, []
+        for path in trash:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _evict_locked(self) -> None:
+        """
+        Drops least recently used entries until the store fits into max_bytes,
+        skipping pinned ones. The caller must hold self._lock.
+        """
+        for key, entry in list(self._index.items()):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if entry.pins:
+                continue
+            self._discard_locked(key)
+            self.stats.evictions += 1
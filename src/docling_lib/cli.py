@@ -3,14 +3,17 @@ import logging
 import sys
 from pathlib import Path
 
-# Import from config and converter
+# Import from config and options; Docling is only imported once a conversion runs
 from .config import (
+    ADAPTIVE_OCR,
     IMAGE_DIR_NAME,
     IMAGE_RESOLUTION_SCALE,
     MD_OUTPUT_NAME,
+    STREAM_SPREADSHEETS,
     setup_logging,
 )
-from .converter import DocumentConversionOptions, process_pdf
+from .lazy import process_pdf, rerender
+from .options import DocumentConversionOptions
 
 # Configure logging for the CLI tool
 logger = logging.getLogger(__name__)
@@ -23,7 +26,13 @@ def setup_parser():
         description="Extract markdown, figures, and tables from documents (PDF, DOCX, PPTX) with high accuracy."
     )
     parser.add_argument(
-        "pdf_file", type=Path, help="Path to the input document file (PDF, DOCX, PPTX)."
+        "pdf_file",
+        type=Path,
+        nargs="?",
+        help=(
+            "Path to the input document file (PDF, DOCX, PPTX). "
+            "Not used with --rerender."
+        ),
     )
     parser.add_argument(
         "-o",
@@ -52,6 +61,77 @@ def setup_parser():
         default=IMAGE_RESOLUTION_SCALE,
         help=f"Image resolution scale (default: {IMAGE_RESOLUTION_SCALE}). Higher values mean better quality but larger files.",
     )
+    parser.add_argument(
+        "--table-format",
+        choices=["html", "markdown"],
+        default="html",
+        help="Output format of tables (default: 'html').",
+    )
+    parser.add_argument(
+        "--image-format",
+        choices=["png", "webp", "jpeg"],
+        default="png",
+        help="Encoding of extracted images (default: 'png').",
+    )
+    parser.add_argument(
+        "--image-quality",
+        type=int,
+        default=90,
+        help="Quality of WebP/JPEG images from 1 to 100 (default: 90).",
+    )
+    parser.add_argument(
+        "--text-only",
+        action="store_true",
+        help=(
+            "Skip page and picture image generation and write image placeholders "
+            "only (faster, less memory)."
+        ),
+    )
+    parser.add_argument(
+        "--adaptive-ocr",
+        action="store_true",
+        help="Only OCR the PDF pages without a usable text layer (scanned pages).",
+    )
+    parser.add_argument(
+        "--stream-spreadsheets",
+        action="store_true",
+        help=(
+            "Stream XLSX workbooks straight to Markdown without Docling "
+            "(faster, less memory; see docs/MARKDOWN_SPEC.md for the differences)."
+        ),
+    )
+    parser.add_argument(
+        "--save-document",
+        action="store_true",
+        help=(
+            "Also store the converted document as JSON so that it can be "
+            "re-rendered with --rerender."
+        ),
+    )
+    parser.add_argument(
+        "--timings",
+        choices=["frontmatter", "sidecar"],
+        help=(
+            "Also write the per-stage conversion timings into the Markdown "
+            "frontmatter or a timings.json file."
+        ),
+    )
+    parser.add_argument(
+        "--rerender",
+        action="store_true",
+        help=(
+            "Rebuild the Markdown in --output-dir from the stored document "
+            "instead of converting a file."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "Always run the conversion, bypassing the conversion cache "
+            "(enabled via DOCLING_CACHE_DIR)."
+        ),
+    )
     return parser
 
 
@@ -62,21 +142,35 @@ def main(args=None):
     """
     parser = setup_parser()
     parsed_args = parser.parse_args(args if args is not None else sys.argv[1:])
-
-    logger.info(f"Starting high-accuracy workflow for: {parsed_args.pdf_file}")
+    if parsed_args.pdf_file is None and not parsed_args.rerender:
+        parser.error("the following arguments are required: pdf_file")
 
     options = DocumentConversionOptions(
         image_dir_name=parsed_args.image_dir,
         md_output_name=parsed_args.output_name,
         image_scale=parsed_args.image_scale,
+        table_format=parsed_args.table_format,
+        image_format=parsed_args.image_format,
+        image_quality=parsed_args.image_quality,
+        text_only=parsed_args.text_only,
+        adaptive_ocr=parsed_args.adaptive_ocr or ADAPTIVE_OCR,
+        stream_spreadsheets=parsed_args.stream_spreadsheets or STREAM_SPREADSHEETS,
+        save_document_json=parsed_args.save_document,
+        timings_output=parsed_args.timings,
+        use_cache=not parsed_args.no_cache,
     )
 
-    # Call the new, unified processing function
-    result_path = process_pdf(
-        parsed_args.pdf_file,
-        parsed_args.output_dir,
-        options=options,
-    )
+    if parsed_args.rerender:
+        logger.info(f"Re-rendering the stored document in: {parsed_args.output_dir}")
+        result_path = rerender(parsed_args.output_dir, options)
+    else:
+        logger.info(f"Starting high-accuracy workflow for: {parsed_args.pdf_file}")
+        # Call the new, unified processing function
+        result_path = process_pdf(
+            parsed_args.pdf_file,
+            parsed_args.output_dir,
+            options=options,
+        )
 
     if result_path:
         logger.info(
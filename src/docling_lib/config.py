@@ -2,9 +2,18 @@ import logging
 import os
 from pathlib import Path
 
+
+def _env_flag(name: str, default: str) -> bool:
+    """Reads a boolean setting ("1", "true" or "yes" enable it)."""
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
 # --- Constants ---
 MD_OUTPUT_NAME = "processed_document.md"
 IMAGE_DIR_NAME = "images"
+DOCUMENT_JSON_NAME = "document.json"  # Stored DoclingDocument, used by rerender
+TIMINGS_JSON_NAME = "timings.json"  # Per-stage timings sidecar
+TIMINGS_OUTPUTS = (None, "frontmatter", "sidecar")
 IMAGE_RESOLUTION_SCALE = 2.0  # Higher value for better image quality
 
 # Directory configurations
@@ -14,6 +23,75 @@ OUTPUT_DIR = Path(os.getenv("DOCLING_OUTPUT_DIR", "output"))
 # Security configurations
 MAX_UPLOAD_SIZE = int(os.getenv("DOCLING_MAX_UPLOAD_SIZE", 20 * 1024 * 1024))  # Default 20MB
 
+# Number of differently configured converters (loaded models) kept in memory
+CONVERTER_CACHE_SIZE = int(os.getenv("DOCLING_CONVERTER_CACHE_SIZE", 4))
+# Number of documents converted concurrently within one process
+CONVERTER_WORKERS = int(os.getenv("DOCLING_CONVERTER_WORKERS", 1))
+
+# Threads used to encode and write extracted images
+IMAGE_EXPORT_WORKERS = int(os.getenv("DOCLING_IMAGE_WORKERS", 4))
+
+# Page sharding of large PDFs (0 = convert the whole PDF in one pass)
+SHARD_PAGES = int(os.getenv("DOCLING_SHARD_PAGES", 0))
+SHARD_WORKERS = int(os.getenv("DOCLING_SHARD_WORKERS", CONVERTER_WORKERS))
+
+# Adaptive OCR: only OCR the PDF pages whose text layer covers less than
+# OCR_MIN_TEXT_COVERAGE of the page area
+ADAPTIVE_OCR = _env_flag("DOCLING_ADAPTIVE_OCR", "false")
+OCR_MIN_TEXT_COVERAGE = float(os.getenv("DOCLING_OCR_MIN_TEXT_COVERAGE", 0.01))
+
+# Stream XLSX workbooks straight to Markdown instead of converting them with
+# Docling (lower memory and latency, see DocumentConversionOptions)
+STREAM_SPREADSHEETS = _env_flag("DOCLING_STREAM_SPREADSHEETS", "false")
+
+# Record the time of Docling's pipeline stages (layout, OCR, tables, ...)
+PROFILE_DOCLING_STAGES = _env_flag("DOCLING_PROFILE_STAGES", "true")
+
+# Conversion backend used by the server: "thread" (default) or "process"
+CONVERSION_BACKEND = os.getenv("DOCLING_BACKEND", "thread").lower()
+PROCESS_WORKERS = int(os.getenv("DOCLING_PROCESS_WORKERS", os.cpu_count() or 1))
+# torch/OpenMP threads of each worker process (0 = CPU cores / workers)
+PROCESS_WORKER_THREADS = int(os.getenv("DOCLING_PROCESS_WORKER_THREADS", 0))
+# Recycle a worker process after this many jobs to cap memory growth (0 = never)
+MAX_TASKS_PER_CHILD = int(os.getenv("DOCLING_MAX_TASKS_PER_CHILD", 0))
+# Convert a small generated document at server startup so that the models are
+# loaded before the first request (/ready reports when this has finished)
+WARMUP_ENABLED = _env_flag("DOCLING_WARMUP", "true")
+
+# Admission control of /convert/: requests served at the same time (0 = as
+# many as the backend converts at once) and requests waiting for a slot;
+# further requests are answered with 429 and Retry-After
+MAX_IN_FLIGHT = int(os.getenv("DOCLING_MAX_IN_FLIGHT", 0))
+MAX_QUEUED_REQUESTS = int(os.getenv("DOCLING_MAX_QUEUE", 16))
+
+# Asynchronous jobs (POST /jobs): conversions run concurrently by the job
+# workers (0 = as many as the backend converts at once), jobs waiting for a
+# worker (further submissions are answered with 429) and the number of
+# finished jobs whose status is kept for polling
+JOB_WORKERS = int(os.getenv("DOCLING_JOB_WORKERS", 0))
+JOB_QUEUE_SIZE = int(os.getenv("DOCLING_JOB_QUEUE_SIZE", 100))
+JOB_HISTORY_SIZE = int(os.getenv("DOCLING_JOB_HISTORY", 1000))
+
+# Memory budget of the server: while the resident memory of the conversion
+# processes is above DOCLING_MEMORY_BUDGET_MB, new conversions wait up to
+# DOCLING_MEMORY_BUDGET_WAIT seconds and are then rejected with 503 (0 = off)
+MEMORY_BUDGET_BYTES = int(os.getenv("DOCLING_MEMORY_BUDGET_MB", 0)) * 1024 * 1024
+MEMORY_BUDGET_WAIT = float(os.getenv("DOCLING_MEMORY_BUDGET_WAIT", 30))
+# Interval at which the resident memory is sampled during a conversion
+MEMORY_SAMPLE_INTERVAL = float(os.getenv("DOCLING_MEMORY_SAMPLE_INTERVAL", 0.1))
+
+# Conversion cache configurations (disabled unless DOCLING_CACHE_DIR is set)
+CACHE_DIR = (
+    Path(os.environ["DOCLING_CACHE_DIR"]) if os.getenv("DOCLING_CACHE_DIR") else None
+)
+# Default 1GB
+CACHE_MAX_BYTES = int(os.getenv("DOCLING_CACHE_MAX_BYTES", 1024 * 1024 * 1024))
+# Default 7 days
+CACHE_TTL_SECONDS = int(os.getenv("DOCLING_CACHE_TTL", 7 * 24 * 60 * 60))
+# Incremental conversion: PDFs are converted page by page and unchanged pages
+# of a new revision are reused from the cache (requires DOCLING_CACHE_DIR)
+INCREMENTAL_CONVERSION = _env_flag("DOCLING_INCREMENTAL", "false")
+
 def setup_logging():
     """Configures global logging for the library/CLI."""
     logging.basicConfig(
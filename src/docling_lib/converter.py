@@ -1,17 +1,26 @@
+import contextvars
+import json
 import logging
 import threading
-from dataclasses import dataclass
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.base_models import ConversionStatus, InputFormat
 from docling.datamodel.pipeline_options import PdfPipelineOptions
+from docling.datamodel.settings import settings
 from docling.document_converter import (
     DocumentConverter,
     PdfFormatOption,
     PowerpointFormatOption,
     WordFormatOption,
 )
+from docling_core.transforms.serializer.common import _iterate_items, _PageBreakNode
 from docling_core.transforms.serializer.markdown import (
     MarkdownDocSerializer,
     MarkdownParams,
@@ -21,27 +30,44 @@ from docling_core.transforms.serializer.markdown import (
 )
 from docling_core.types.doc import (
     DoclingDocument,
+    ImageRef,
     ImageRefMode,
+    PictureItem,
+    Size,
     TableItem,
 )
+from PIL import Image
+from pydantic import PrivateAttr, SkipValidation
 
-from .config import IMAGE_DIR_NAME, IMAGE_RESOLUTION_SCALE, MD_OUTPUT_NAME
+from .cache import ConversionCache
+from .config import (
+    CACHE_DIR,
+    CACHE_MAX_BYTES,
+    CACHE_TTL_SECONDS,
+    CONVERTER_CACHE_SIZE,
+    CONVERTER_WORKERS,
+    DOCUMENT_JSON_NAME,
+    PROFILE_DOCLING_STAGES,
+    TIMINGS_JSON_NAME,
+    TIMINGS_OUTPUTS,
+)
+from .images import ImageExporter
+from .memory import PeakRssSampler
+from .ocr import OcrCostModel, OcrStats, pages_needing_ocr
+from .options import DocumentConversionOptions, PipelineConfig, RenderConfig
+from .pages import count_pages, page_fingerprints, page_ranges, page_runs, text_coverage
+from .progress import advance_pages
+from .spreadsheet import write_spreadsheet_markdown
+from .timings import StageTimings, collect_timings, current_timings, stage, timed_iter
 from .utils import sanitize_log_message
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class DocumentConversionOptions:
-    """Options for document conversion and serialization."""
-
-    image_dir_name: str = IMAGE_DIR_NAME
-    md_output_name: str = MD_OUTPUT_NAME
-    image_scale: float = IMAGE_RESOLUTION_SCALE
-    table_format: str = "html"
-    do_formula: bool = True
-    do_ocr: bool = True
+# Docling records the time of its pipeline stages (layout, OCR, table
+# structure, ...) in every conversion result; they are reported as
+# "docling.<stage>" timings.
+settings.debug.profile_pipeline_timings = PROFILE_DOCLING_STAGES
 
 
 class HTMLTableMarkdownSerializer(MarkdownTableSerializer):
@@ -82,13 +108,24 @@ class HTMLTableMarkdownSerializer(MarkdownTableSerializer):
         return create_ser_result(text=text_res, span_source=res_parts)
 
 
+# Stands in for the body while iter_chunks() streams its parts
+_STREAMED_BODY = "\x00docling_lib:body\x00"
+
+
 class EnhancedMarkdownSerializer(MarkdownDocSerializer):
     """
     Custom Markdown Serializer that:
     1. Exports tables as HTML to preserve complex structures.
     2. Provides a foundation for future image alt-text enhancement (OCR/VLM).
+    3. Can stream the Markdown item by item (see iter_chunks).
     """
 
+    # Documents are validated when they are built; validating them again
+    # here would collect every ref of the document into a set
+    doc: SkipValidation[DoclingDocument]
+    # Arguments of the body walk while iter_chunks() streams it
+    _streamed_body: dict[str, Any] | None = PrivateAttr(default=None)
+
     def __init__(self, doc: DoclingDocument, table_format: str = "html", **kwargs):
         # In tests, doc might be a MagicMock. Pydantic models (like
         # MarkdownDocSerializer) may fail validation if they don't see a real
@@ -104,6 +141,76 @@ class EnhancedMarkdownSerializer(MarkdownDocSerializer):
         if table_format.lower() == "html":
             self.table_serializer = HTMLTableMarkdownSerializer()
 
+    def _serialize_body(self, **kwargs: Any) -> SerializationResult:
+        if self._streamed_body is None:
+            return super()._serialize_body(**kwargs)
+        # Streaming (see iter_chunks): the body is walked afterwards
+        self._streamed_body = kwargs
+        return create_ser_result(text=_STREAMED_BODY)
+
+    def _iter_parts(
+        self,
+        *,
+        traverse_pictures: bool = False,
+        list_level: int = 0,
+        is_inline_scope: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[SerializationResult]:
+        """
+        Serializes the body item by item, like get_parts() but lazily. The
+        refs of visited items are only kept within the current top-level
+        subtree: the walk never returns to a subtree it has left. The one
+        exception is a page break, which is repeated by the first item of a
+        group that starts on a new page.
+        """
+        visited: set[str] = set()
+        last_break: str | None = None
+        params = self.params.merge_with_patch(patch=kwargs)
+        for node, level in _iterate_items(
+            doc=self.doc,
+            layers=params.layers,
+            traverse_pictures=params.traverse_pictures,
+            add_page_breaks=self.requires_page_break(),
+        ):
+            if isinstance(node, _PageBreakNode):
+                last_break = node.self_ref
+            elif level <= 1:
+                visited = {last_break} if last_break else set()
+            if node.self_ref in visited or self._skip_in_walk(node=node, root=None):
+                continue
+            visited.add(node.self_ref)
+            yield self.serialize(
+                item=node,
+                list_level=list_level,
+                is_inline_scope=is_inline_scope,
+                visited=visited,
+                **(dict(level=level) | kwargs),
+            )
+
+    def iter_chunks(self) -> Iterator[str]:
+        """
+        Yields the Markdown in chunks that, joined with blank lines, equal
+        serialize().text. Each body item is serialized and combined by
+        serialize_doc() (which also replaces page breaks) just before it is
+        yielded, so memory does not grow with the length of the document.
+        """
+        self._streamed_body = {}
+        try:
+            # Anything serialize() puts around the body, such as its metadata
+            text = self.serialize().text
+            body_kwargs = self._streamed_body
+        finally:
+            self._streamed_body = None
+        before, _, after = text.partition(_STREAMED_BODY)
+
+        if before:
+            yield before.removesuffix("\n\n")
+        for part in self._iter_parts(**body_kwargs):
+            if part.text:
+                yield self.serialize_doc(parts=[part]).text
+        if after:
+            yield after.removeprefix("\n\n")
+
 
 class PDFConverter:
     """
@@ -115,13 +222,16 @@ class PDFConverter:
         options: DocumentConversionOptions | None = None,
     ):
         self.options = options or DocumentConversionOptions()
+        pipeline_config = self.options.pipeline
 
         # Configure pipeline options
         pipeline_options = PdfPipelineOptions()
-        pipeline_options.generate_picture_images = True
-        pipeline_options.images_scale = self.options.image_scale
-        pipeline_options.do_formula_enrichment = self.options.do_formula
-        pipeline_options.do_ocr = self.options.do_ocr
+        # Text-only mode never renders page or picture bitmaps
+        pipeline_options.generate_page_images = False
+        pipeline_options.generate_picture_images = not pipeline_config.text_only
+        pipeline_options.images_scale = pipeline_config.image_scale
+        pipeline_options.do_formula_enrichment = pipeline_config.do_formula
+        pipeline_options.do_ocr = pipeline_config.do_ocr
 
         # Configure DocumentConverter with multi-format support
         self.doc_converter = DocumentConverter(
@@ -146,10 +256,15 @@ class PDFConverter:
         # Use provided options or fall back to the instance's initialization options
         actual_options = options or self.options
         try:
-            # Perform conversion
-            result = self.doc_converter.convert(input_path)
-            doc = result.document
+            if _is_streamed_spreadsheet(input_path, actual_options):
+                return _save_spreadsheet(input_path, output_dir, actual_options.render)
 
+            segments = _plan_segments(input_path, actual_options)
+            if segments:
+                # Segments run in parallel on pooled converters
+                doc, _ = _convert_segments(input_path, segments, actual_options)
+            else:
+                doc = self.convert_document(input_path)
             return self._save_markdown(doc, output_dir, actual_options)
 
         except (OSError, PermissionError) as e:
@@ -161,6 +276,29 @@ class PDFConverter:
             )
             return None
 
+    def preload(self) -> None:
+        """
+        Initializes the PDF pipeline so that its models are loaded before the
+        first conversion instead of during it.
+        """
+        self.doc_converter.initialize_pipeline(InputFormat.PDF)
+
+    def convert_document(
+        self, input_path: Path, page_range: tuple[int, int] | None = None
+    ) -> DoclingDocument:
+        """
+        Runs the Docling pipeline and returns the converted document, optionally
+        restricted to a 1-based inclusive page_range.
+        This is the only step that uses the underlying DocumentConverter.
+        """
+        with stage("convert"):
+            if page_range:
+                result = self.doc_converter.convert(input_path, page_range=page_range)
+            else:
+                result = self.doc_converter.convert(input_path)
+        _record_docling_timings(result)
+        return result.document
+
     def _save_markdown(
         self,
         doc: DoclingDocument,
@@ -170,71 +308,597 @@ class PDFConverter:
         """
         Helper method to save the document as Markdown and images.
         Uses an enhanced custom serializer based on the provided or instance configuration.
+        Only the render part of the options is used, so callers may pass options
+        whose pipeline part differs from this converter's.
         """
-        actual_options = options or self.options
-        image_dir_name = actual_options.image_dir_name
-        md_output_name = actual_options.md_output_name
+        return _save_document(doc, output_dir, (options or self.options).render)
 
-        # Security Check: Path Traversal
-        try:
-            resolved_output_dir = output_dir.resolve()
-            resolved_images_dir = (output_dir / image_dir_name).resolve()
-            resolved_md_path = (output_dir / md_output_name).resolve()
-
-            if not resolved_images_dir.is_relative_to(resolved_output_dir):
-                logger.error(
-                    "Security Error: Traversal detected in image directory %s",
-                    sanitize_log_message(image_dir_name),
-                )
-                raise ValueError("Traversal detected in image directory")
 
-            if not resolved_md_path.is_relative_to(resolved_output_dir):
-                logger.error(
-                    "Security Error: Traversal detected in markdown output name %s",
-                    sanitize_log_message(md_output_name),
-                )
-                raise ValueError("Traversal detected in markdown output name")
+def _save_document(
+    doc: DoclingDocument, output_dir: Path, render: RenderConfig
+) -> Path:
+    """Saves doc as Markdown (and images) in output_dir according to render."""
+    # Security Check: Path Traversal
+    resolved_images_dir, resolved_md_path = _resolve_output_paths(output_dir, render)
 
-        except Exception as e:
-            logger.error(f"Security Error during path resolution: {e}")
-            raise
+    # Create output directory
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create output directory
-        output_dir.mkdir(parents=True, exist_ok=True)
+    if render.text_only:
+        # Pictures embedded by the Word/PowerPoint backends are not written either
+        image_mode = ImageRefMode.PLACEHOLDER
+    else:
         resolved_images_dir.mkdir(parents=True, exist_ok=True)
+        # Write pictures first so that the serializer can reference the files
+        with stage("images"):
+            _export_images(doc, output_dir, resolved_images_dir, render)
+        image_mode = ImageRefMode.REFERENCED
 
-        # Configure enhanced custom serializer
-        serializer = EnhancedMarkdownSerializer(
-            doc=doc,
-            table_format=actual_options.table_format,
-            params=MarkdownParams(
-                image_mode=ImageRefMode.REFERENCED,
-                image_placeholder="<!-- image -->",
-            ),
-        )
+    if render.save_document_json:
+        # Written after the image export so that pictures reference their
+        # files instead of embedding the pixels
+        with stage("document_json"):
+            _save_document_json(doc, output_dir / DOCUMENT_JSON_NAME)
 
-        # Serialize
-        ser_res = serializer.serialize()
-        md_content = ser_res.text
+    # Configure enhanced custom serializer
+    serializer = EnhancedMarkdownSerializer(
+        doc=doc,
+        table_format=render.table_format,
+        params=MarkdownParams(
+            image_mode=image_mode,
+            image_placeholder="<!-- image -->",
+        ),
+    )
 
+    with _open_markdown(resolved_md_path) as md_file:
         # Add Metadata as YAML Frontmatter if available
-        meta = []
-        if doc.name:
-            meta.append(f"title: {doc.name}")
+        _write_frontmatter(md_file, doc.name, _frontmatter_timings(render))
+        # Serialization and writes interleave, so they are timed per chunk
+        chunks = timed_iter(serializer.iter_chunks(), "serialize")
+        for i, chunk in enumerate(chunks):
+            with stage("markdown_write"):
+                if i:
+                    md_file.write("\n\n")
+                md_file.write(chunk)
+
+    return output_dir / render.md_output_name
 
-        if meta:
-            frontmatter = "---\n" + "\n".join(meta) + "\n---\n\n"
-            md_content = frontmatter + md_content
 
-        # Save as markdown file
-        resolved_md_path.write_text(md_content, encoding="utf-8")
+def _save_spreadsheet(input_path: Path, output_dir: Path, render: RenderConfig) -> Path:
+    """
+    Spreadsheet fast path: streams the tables of an XLSX workbook straight
+    into Markdown, row by row, without building a DoclingDocument.
+    """
+    # Security Check: Path Traversal
+    _, resolved_md_path = _resolve_output_paths(output_dir, render)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-        return output_dir / md_output_name
+    with _open_markdown(resolved_md_path) as md_file, stage("spreadsheet"):
+        # Docling names the document after the file stem
+        _write_frontmatter(md_file, input_path.stem, _frontmatter_timings(render))
+        write_spreadsheet_markdown(input_path, md_file, render.table_format)
 
+    return output_dir / render.md_output_name
 
-# Global shared converter instance for reuse
-_default_pdf_converter: PDFConverter | None = None
-_converter_lock = threading.Lock()
+
+def _is_streamed_spreadsheet(
+    input_path: Path, options: DocumentConversionOptions
+) -> bool:
+    # The fast path builds no DoclingDocument that could be stored
+    return (
+        options.stream_spreadsheets
+        and not options.save_document_json
+        and input_path.suffix.lower() == ".xlsx"
+    )
+
+
+@contextmanager
+def _open_markdown(md_path: Path) -> Iterator[TextIO]:
+    """
+    Opens a temporary file next to md_path and moves it into place once the
+    block completes. Markdown is streamed into it so that memory does not grow
+    with the output size, and a failure never leaves a partial file behind.
+    """
+    tmp_md_path = md_path.with_name(f".{md_path.name}.tmp")
+    try:
+        with tmp_md_path.open("w", encoding="utf-8") as md_file:
+            yield md_file
+        tmp_md_path.replace(md_path)
+    finally:
+        tmp_md_path.unlink(missing_ok=True)
+
+
+def _write_frontmatter(
+    md_file: TextIO, title: str | None, timings: dict[str, float] | None = None
+) -> None:
+    """Writes the YAML frontmatter (only when there is metadata)."""
+    meta = []
+    if title:
+        meta.append(f"title: {title}")
+    if timings:
+        meta.append("timings:")
+        meta.extend(f"  {name}: {seconds}" for name, seconds in timings.items())
+    if meta:
+        md_file.write("---\n" + "\n".join(meta) + "\n---\n\n")
+
+
+def _frontmatter_timings(render: RenderConfig) -> dict[str, float] | None:
+    """
+    The stages timed so far, when they go into the frontmatter. Stages after
+    the frontmatter (serialization, Markdown writes, caching) are only in the
+    result, the log record and the sidecar.
+    """
+    timings = current_timings()
+    if render.timings_output != "frontmatter" or timings is None:
+        return None
+    return timings.as_dict()
+
+
+def _record_docling_timings(result: Any) -> None:
+    """
+    Adds the pipeline timings of a Docling ConversionResult to the current
+    conversion.
+    """
+    timings = current_timings()
+    if timings is not None and result.timings:
+        timings.add_docling(result.timings)
+
+
+def _export_images(
+    doc: DoclingDocument, output_dir: Path, images_dir: Path, render: RenderConfig
+) -> None:
+    """
+    Image export stage: encodes the pictures of doc in parallel, skipping
+    duplicates, and points their image references at the written files
+    (relative to the Markdown file).
+    """
+    exporter = ImageExporter(
+        images_dir, image_format=render.image_format, quality=render.image_quality
+    )
+    pictures: list[PictureItem] = []
+    images = []
+    for item, _ in doc.iterate_items():
+        if not isinstance(item, PictureItem):
+            continue
+        if item.image is not None and not str(item.image.uri).startswith("data:"):
+            # Already exported by an earlier run (a re-rendered document).
+            # Files in the requested directory and format are kept as they are.
+            uri = Path(str(item.image.uri))
+            in_place = uri.parent == Path(render.image_dir_name)
+            if in_place and uri.suffix == f".{exporter.extension}":
+                continue
+            image = _load_exported_image(output_dir, uri)
+        else:
+            image = item.get_image(doc)
+        if image is not None:
+            pictures.append(item)
+            images.append(image)
+
+    if not images:
+        return
+
+    paths = exporter.export(images)
+    for item, image, path in zip(pictures, images, paths, strict=True):
+        item.image = ImageRef(
+            mimetype=exporter.mimetype,
+            dpi=item.image.dpi if item.image else 72,
+            size=Size(width=image.width, height=image.height),
+            uri=Path(render.image_dir_name) / path.name,
+        )
+
+    logger.info(
+        f"Exported {exporter.stats.written} images "
+        f"({exporter.stats.deduplicated} duplicates skipped)"
+    )
+
+
+def _load_exported_image(output_dir: Path, uri: Path) -> Image.Image | None:
+    """Loads a previously exported picture, which must lie inside output_dir."""
+    resolved_output_dir = output_dir.resolve()
+    image_path = (resolved_output_dir / uri).resolve()
+    if not image_path.is_relative_to(resolved_output_dir) or not image_path.is_file():
+        logger.warning(f"Skipping missing or invalid image {sanitize_log_message(uri)}")
+        return None
+    with Image.open(image_path) as image:
+        image.load()
+        return image
+
+
+def _save_document_json(doc: DoclingDocument, json_path: Path) -> None:
+    """Stores doc as compact JSON so that it can be re-rendered later."""
+    tmp_json_path = json_path.with_name(f".{json_path.name}.tmp")
+    try:
+        tmp_json_path.write_text(
+            doc.model_dump_json(by_alias=True, exclude_none=True), encoding="utf-8"
+        )
+        tmp_json_path.replace(json_path)
+    finally:
+        tmp_json_path.unlink(missing_ok=True)
+
+
+def _resolve_output_paths(output_dir: Path, render: RenderConfig) -> tuple[Path, Path]:
+    """
+    Resolves the image directory and Markdown file paths for output_dir.
+    Raises ValueError if either of them escapes output_dir.
+    """
+    image_dir_name = render.image_dir_name
+    md_output_name = render.md_output_name
+    try:
+        resolved_output_dir = output_dir.resolve()
+        resolved_images_dir = (output_dir / image_dir_name).resolve()
+        resolved_md_path = (output_dir / md_output_name).resolve()
+
+        if not resolved_images_dir.is_relative_to(resolved_output_dir):
+            logger.error(
+                "Security Error: Traversal detected in image directory %s",
+                sanitize_log_message(image_dir_name),
+            )
+            raise ValueError("Traversal detected in image directory")
+
+        if not resolved_md_path.is_relative_to(resolved_output_dir):
+            logger.error(
+                "Security Error: Traversal detected in markdown output name %s",
+                sanitize_log_message(md_output_name),
+            )
+            raise ValueError("Traversal detected in markdown output name")
+
+    except Exception as e:
+        logger.error(f"Security Error during path resolution: {e}")
+        raise
+
+    return resolved_images_dir, resolved_md_path
+
+
+@dataclass
+class ConverterPoolStats:
+    """Counters describing how the converter pool has been used."""
+
+    builds: int = 0
+    hits: int = 0
+    evictions: int = 0
+    checkouts: int = 0
+    wait_seconds: float = 0.0
+
+
+class ConverterPool:
+    """
+    Bounded pool of PDFConverter instances keyed by pipeline configuration.
+
+    At most `workers` converters are checked out at the same time, so up to
+    `workers` documents convert concurrently. Idle converters are kept per
+    pipeline configuration; once more than `max_configs` configurations are
+    known, the least recently used one is evicted with its idle converters, so
+    clients alternating between a few option sets never reload models.
+    """
+
+    def __init__(
+        self,
+        workers: int = CONVERTER_WORKERS,
+        max_configs: int = CONVERTER_CACHE_SIZE,
+    ):
+        self.workers = max(1, workers)
+        self.max_configs = max(1, max_configs)
+        self.stats = ConverterPoolStats()
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._idle: OrderedDict[PipelineConfig, list[PDFConverter]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(options: DocumentConversionOptions) -> PipelineConfig:
+        """
+        Returns the options that require a new PDFConverter when changed.
+        Render options (file names, table format) are deliberately excluded:
+        they are applied per call by _save_markdown.
+        """
+        return options.pipeline
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Holds one of the `workers` conversion slots without checking out a
+        converter, for conversions that bring their own converter.
+        """
+        wait_start = time.perf_counter()
+        with stage("checkout_wait"):
+            self._slots.acquire()
+        try:
+            with self._lock:
+                self.stats.checkouts += 1
+                self.stats.wait_seconds += time.perf_counter() - wait_start
+            yield
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def checkout(self, options: DocumentConversionOptions) -> Iterator[PDFConverter]:
+        """
+        Checks out a converter for options, blocking while all workers are busy.
+        The converter is checked back in when the context exits.
+        """
+        with self.slot(), self.borrow(options) as converter:
+            yield converter
+
+    @contextmanager
+    def borrow(self, options: DocumentConversionOptions) -> Iterator[PDFConverter]:
+        """
+        Checks out a converter for options without taking a slot, for callers
+        that hold a slot() only while the converter is actually converting.
+        """
+        key = self.make_key(options)
+        converter = self._acquire(key, options)
+        try:
+            yield converter
+        finally:
+            self._release(key, converter)
+
+    def _acquire(
+        self, key: PipelineConfig, options: DocumentConversionOptions
+    ) -> PDFConverter:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle is None:
+                self._idle[key] = []
+                self._evict_locked()
+            else:
+                self._idle.move_to_end(key)
+                if idle:
+                    self.stats.hits += 1
+                    return idle.pop()
+
+        # Build outside the lock so that other configurations are not blocked
+        # while the models load.
+        with stage("converter_init"):
+            converter = PDFConverter(options=options)
+        with self._lock:
+            self.stats.builds += 1
+        return converter
+
+    def _release(self, key: PipelineConfig, converter: PDFConverter) -> None:
+        with self._lock:
+            idle = self._idle.get(key)
+            # Converters of an evicted configuration are dropped on check-in
+            if idle is not None and len(idle) < self.workers:
+                idle.append(converter)
+
+    def _evict_locked(self) -> None:
+        while len(self._idle) > self.max_configs:
+            self._idle.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drops every idle converter."""
+        with self._lock:
+            self._idle.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of idle converters."""
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+
+# Global shared converter pool for reuse
+_converter_pool = ConverterPool()
+
+# A 1-based inclusive page range and the options to convert it with
+PageSegment = tuple[tuple[int, int], DocumentConversionOptions]
+
+
+def _plan_segments(
+    input_path: Path, options: DocumentConversionOptions
+) -> list[PageSegment]:
+    """
+    Returns the page ranges to convert separately, or an empty list when the
+    input should be converted in a single pass. Large PDFs are split into
+    shards; with adaptive OCR, pages are also grouped by whether they need OCR.
+    Incremental conversion splits PDFs into single pages.
+    """
+    if input_path.suffix.lower() != ".pdf":
+        return []
+
+    incremental = _page_cache(options) is not None
+    max_pages = 1 if incremental else options.shard_pages
+
+    if options.adaptive_ocr and options.do_ocr:
+        with stage("plan"):
+            coverages = text_coverage(input_path)
+        flags = pages_needing_ocr(coverages, options.ocr_min_coverage)
+        return [
+            (page_range, replace(options, do_ocr=needs_ocr))
+            for page_range, needs_ocr in page_runs(flags, max_pages)
+        ]
+
+    if max_pages <= 0:
+        return []
+    with stage("plan"):
+        page_count = count_pages(input_path)
+    if page_count <= max_pages and not incremental:
+        return []
+    return [(shard, options) for shard in page_ranges(page_count, max_pages)]
+
+
+def _page_cache(options: DocumentConversionOptions) -> ConversionCache | None:
+    """Returns the cache holding page results when incremental conversion is on."""
+    if options.incremental and options.use_cache:
+        return _default_cache
+    return None
+
+
+def _restore_pages(
+    cache: ConversionCache, input_path: Path, segments: list[PageSegment]
+) -> tuple[list[str], dict[int, DoclingDocument]]:
+    """
+    Looks up single-page segments by page content. Returns the key of every
+    segment and the cached documents by segment index, renumbered to the
+    page they now occupy.
+    """
+    fingerprints = page_fingerprints(input_path)
+    keys = [
+        cache.make_page_key(fingerprints[first - 1], asdict(segment_options.pipeline))
+        for (first, _), segment_options in segments
+    ]
+    cached = {}
+    for index, key in enumerate(keys):
+        data = cache.restore_page(key)
+        if data is None:
+            continue
+        doc = DoclingDocument.model_validate_json(data)
+        # The page may come from an earlier revision with another name or
+        # at another position
+        doc.name = input_path.stem
+        _renumber_page(doc, segments[index][0][0])
+        cached[index] = doc
+    return keys, cached
+
+
+def _renumber_page(doc: DoclingDocument, page_no: int) -> None:
+    """Moves the content of a single-page document to page page_no."""
+    for old_page_no in list(doc.pages):
+        page = doc.pages.pop(old_page_no)
+        page.page_no = page_no
+        doc.pages[page_no] = page
+    for item in [
+        *doc.texts,
+        *doc.tables,
+        *doc.pictures,
+        *doc.key_value_items,
+        *doc.form_items,
+    ]:
+        for prov in item.prov:
+            prov.page_no = page_no
+
+
+def _merge_documents(docs: list[DoclingDocument]) -> DoclingDocument:
+    """
+    Concatenates shard documents in page order. Docling renumbers the item
+    references (texts, pictures, tables), so numbering stays consistent.
+    """
+    merged = DoclingDocument.concatenate(docs)
+    merged.name = docs[0].name
+    return merged
+
+
+def _convert_segments(
+    input_path: Path,
+    segments: list[PageSegment],
+    options: DocumentConversionOptions,
+) -> tuple[DoclingDocument, OcrStats | None]:
+    """
+    Converts page segments in parallel on pooled converters and merges them.
+    With incremental conversion, pages found in the cache are not converted
+    and the converted ones are stored for the next revision.
+    Returns the document and, with adaptive OCR, its OCR statistics.
+    """
+    logger.info(
+        f"Converting {sanitize_log_message(input_path.name)} "
+        f"in {len(segments)} segments"
+    )
+
+    def _convert_segment(segment: PageSegment) -> tuple[DoclingDocument, float]:
+        page_range, segment_options = segment
+        with _converter_pool.checkout(segment_options) as converter:
+            start = time.perf_counter()
+            doc = converter.convert_document(input_path, page_range=page_range)
+            seconds = time.perf_counter() - start
+        advance_pages(page_range[1] - page_range[0] + 1)
+        return doc, seconds
+
+    def _convert_in_context(segment: PageSegment) -> tuple[DoclingDocument, float]:
+        # Stage timings and pages of the worker threads go to the calling
+        # conversion
+        return context.copy().run(_convert_segment, segment)
+
+    page_cache = _page_cache(options)
+    page_keys, cached = [], {}
+    if page_cache:
+        with stage("page_cache"):
+            page_keys, cached = _restore_pages(page_cache, input_path, segments)
+        # Only single pages are cached
+        advance_pages(len(cached))
+    pending = [index for index in range(len(segments)) if index not in cached]
+
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=max(1, options.shard_workers)) as executor:
+        # map() preserves the order of the segments
+        results = list(
+            executor.map(_convert_in_context, (segments[i] for i in pending))
+        )
+    converted = dict(zip(pending, results, strict=True))
+
+    if page_cache:
+        with stage("page_cache"):
+            page_cache.store_pages(
+                [
+                    (
+                        page_keys[index],
+                        doc.model_dump_json(by_alias=True, exclude_none=True),
+                    )
+                    for index, (doc, _) in converted.items()
+                ]
+            )
+        logger.info(
+            f"Incremental conversion of {sanitize_log_message(input_path.name)}: "
+            f"reused {len(cached)}/{len(segments)} pages"
+        )
+
+    docs = [
+        cached[index] if index in cached else converted[index][0]
+        for index in range(len(segments))
+    ]
+    if len(docs) == 1:
+        doc = docs[0]
+    else:
+        with stage("merge"):
+            doc = _merge_documents(docs)
+
+    ocr_stats = None
+    if options.adaptive_ocr and options.do_ocr:
+        ocr_stats = OcrStats()
+        # Only the pages converted in this run, not those reused from the cache
+        for index, (_, seconds) in converted.items():
+            (first, last), segment_options = segments[index]
+            ocr_stats.pages += last - first + 1
+            if segment_options.do_ocr:
+                ocr_stats.ocr_pages += last - first + 1
+                ocr_stats.ocr_seconds += seconds
+            else:
+                ocr_stats.text_seconds += seconds
+        _ocr_cost_model.record(ocr_stats)
+        saved = ocr_stats.estimated_seconds_saved
+        logger.info(
+            f"Adaptive OCR for {sanitize_log_message(input_path.name)}: "
+            f"OCR on {ocr_stats.ocr_pages}/{ocr_stats.pages} pages, "
+            f"estimated time saved: {'unknown' if saved is None else f'{saved:.1f}s'}"
+        )
+    return doc, ocr_stats
+
+
+def _convert_with_pool(
+    input_path: Path,
+    options: DocumentConversionOptions,
+    segments: list[PageSegment] | None = None,
+) -> tuple[DoclingDocument, OcrStats | None]:
+    """
+    Converts input_path on pooled converters, splitting large PDFs into shards
+    and, with adaptive OCR, into ranges of pages with and without a text layer.
+    segments are planned here unless the caller has already planned them.
+    """
+    if segments is None:
+        segments = _plan_segments(input_path, options)
+    if segments:
+        return _convert_segments(input_path, segments, options)
+    with _converter_pool.checkout(options) as converter:
+        return converter.convert_document(input_path), None
+
+
+# Process-wide OCR timings, used to estimate the time adaptive OCR saves
+_ocr_cost_model = OcrCostModel()
+
+# Global conversion cache, enabled by setting DOCLING_CACHE_DIR
+_default_cache: ConversionCache | None = (
+    ConversionCache(CACHE_DIR, CACHE_MAX_BYTES, CACHE_TTL_SECONDS)
+    if CACHE_DIR
+    else None
+)
 
 
 def _validate_input_path(pdf_path: Path) -> bool:
@@ -269,26 +933,198 @@ def _validate_output_security(output_dir: Path) -> bool:
     return True
 
 
-def _get_or_create_converter(
+def _restore_from_cache(
+    cache: ConversionCache,
+    pdf_path: Path,
+    output_dir: Path,
     options: DocumentConversionOptions,
-) -> PDFConverter:
-    """
-    Manages and re-initializes the global _default_pdf_converter instance
-    if the core (heavy) configuration has changed.
-    NOTE: This function does not handle locking; the caller must acquire
-    _converter_lock.
-    """
-    global _default_pdf_converter
-    # Re-initialize only if "heavy" options that affect model/pipeline initialization
-    # have changed. Document-specific options like filenames are ignored here.
-    if _default_pdf_converter is None or (
-        _default_pdf_converter.options.image_scale != options.image_scale
-        or _default_pdf_converter.options.table_format != options.table_format
-        or _default_pdf_converter.options.do_formula != options.do_formula
-        or _default_pdf_converter.options.do_ocr != options.do_ocr
-    ):
-        _default_pdf_converter = PDFConverter(options=options)
-    return _default_pdf_converter
+) -> tuple[str, Path | None]:
+    """Returns the cache key of pdf_path and, on a hit, the restored Markdown path."""
+    # Reject traversal in the output names before restoring anything
+    _resolve_output_paths(output_dir, options.render)
+    with stage("cache_lookup"):
+        cache_key = cache.make_key(pdf_path, options.output_signature())
+        cached_path = cache.restore(cache_key, output_dir, options.md_output_name)
+    if cached_path:
+        logger.info(
+            f"Cache hit for {sanitize_log_message(pdf_path.name)}, skipping conversion"
+        )
+    return cache_key, cached_path
+
+
+def _convert_and_save(
+    pdf_path: Path,
+    output_dir: Path,
+    options: DocumentConversionOptions,
+    segments: list[PageSegment] | None = None,
+) -> tuple[Path, OcrStats | None]:
+    """
+    Converts a single document on the converter pool and saves it.
+    Returns the Markdown path and, with adaptive OCR, the OCR statistics.
+    """
+    if _is_streamed_spreadsheet(pdf_path, options):
+        # Needs no Docling converter at all
+        return _save_spreadsheet(pdf_path, output_dir, options.render), None
+
+    # Only the conversion itself occupies pooled converters
+    doc, ocr_stats = _convert_with_pool(pdf_path, options, segments)
+    # Disk writes run after the converters are checked back in
+    return _save_document(doc, output_dir, options.render), ocr_stats
+
+
+@dataclass
+class ProcessResult:
+    """
+    Outcome of converting one document with process_document() or
+    process_many(): the output and where the time went.
+    """
+
+    input_path: Path
+    output_path: Path | None = None
+    error: str | None = None
+    cache_hit: bool = False
+    total_seconds: float = 0.0
+    # Seconds per stage, see timings.StageTimings
+    timings: dict[str, float] = field(default_factory=dict)
+    ocr: OcrStats | None = None
+    # Peak resident memory of the process during the conversion (None where
+    # it cannot be measured)
+    peak_rss_bytes: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.output_path is not None
+
+    def timing_record(self) -> dict[str, Any]:
+        """The timings as one JSON-serializable record (log line, sidecar)."""
+        return {
+            "input": self.input_path.name,
+            "ok": self.ok,
+            "cache_hit": self.cache_hit,
+            "total_seconds": round(self.total_seconds, 4),
+            "peak_rss_mb": (
+                None
+                if self.peak_rss_bytes is None
+                else round(self.peak_rss_bytes / (1024 * 1024), 1)
+            ),
+            "stages": self.timings,
+        }
+
+
+def process_document(
+    pdf_path: Path,
+    output_dir: Path,
+    options: DocumentConversionOptions | None = None,
+    converter: DocumentConverter | None = None,
+) -> ProcessResult:
+    """
+    Processes a document like process_pdf and reports how long each stage
+    took (validation, converter checkout, Docling's pipeline stages, image
+    export, serialization, Markdown write, caching) and the peak resident
+    memory of the process while it ran.
+
+    The timings are logged as one structured record and, depending on
+    options.timings_output, written into the Markdown frontmatter or into a
+    timings.json sidecar file.
+    """
+    result = ProcessResult(pdf_path)
+    start = time.perf_counter()
+    with collect_timings() as timings, PeakRssSampler() as memory:
+        try:
+            result.output_path, result.cache_hit, result.ocr = _process(
+                pdf_path, output_dir, options, converter
+            )
+        except (OSError, PermissionError) as e:
+            logger.error(f"Could not create output directory: {e}")
+            result.error = str(e)
+        except Exception as e:
+            logger.error(f"Workflow Error: {e}")
+            result.error = str(e)
+    result.total_seconds = time.perf_counter() - start
+    result.timings = timings.as_dict()
+    result.peak_rss_bytes = memory.peak_bytes
+    if result.error is None and result.output_path is None:
+        result.error = "Invalid input or output path"
+
+    _report_timings(
+        result.timing_record(), output_dir, options or DocumentConversionOptions()
+    )
+    return result
+
+
+def _process(
+    pdf_path: Path,
+    output_dir: Path,
+    options: DocumentConversionOptions | None,
+    converter: DocumentConverter | None,
+) -> tuple[Path | None, bool, OcrStats | None]:
+    """
+    The steps of process_document(). Returns the Markdown path (None when
+    validation failed), whether it came from the cache, and the OCR statistics.
+    """
+    with stage("validate"):
+        # 1. Input Validation
+        if not _validate_input_path(pdf_path):
+            return None, False, None
+
+        # 2. Security Check: Path Traversal
+        if not _validate_output_security(output_dir):
+            return None, False, None
+
+    # 3. Processing
+    actual_options = options or DocumentConversionOptions()
+    if actual_options.timings_output not in TIMINGS_OUTPUTS:
+        raise ValueError(
+            f"Unsupported timings output: {actual_options.timings_output}. "
+            f"Supported: {TIMINGS_OUTPUTS}"
+        )
+
+    # An explicit converter may be configured differently from what the
+    # options describe, so its results are never cached.
+    cache = _default_cache if actual_options.use_cache and converter is None else None
+    cache_key = None
+    if cache:
+        cache_key, cached_path = _restore_from_cache(
+            cache, pdf_path, output_dir, actual_options
+        )
+        if cached_path:
+            return cached_path, True, None
+
+    ocr_stats = None
+    if converter:
+        # Use explicit converter (already configured) but still use our
+        # saving logic. It occupies a pool slot to respect the worker limit.
+        with _converter_pool.slot():
+            with stage("convert"):
+                conv_result = converter.convert(pdf_path)
+            _record_docling_timings(conv_result)
+        result_path = _save_document(
+            conv_result.document, output_dir, actual_options.render
+        )
+    else:
+        result_path, ocr_stats = _convert_and_save(pdf_path, output_dir, actual_options)
+
+    if cache and result_path:
+        _store_in_cache(cache, cache_key, output_dir, result_path, actual_options)
+    return result_path, False, ocr_stats
+
+
+def _report_timings(
+    record: dict[str, Any], output_dir: Path, options: DocumentConversionOptions
+) -> None:
+    """Logs a timing record and writes it to the sidecar file if requested."""
+    logger.info(
+        f"Conversion timings: {json.dumps(record)}",
+        extra={"conversion_timings": record},
+    )
+    if not record["ok"] or options.timings_output != "sidecar":
+        return
+    try:
+        (output_dir / TIMINGS_JSON_NAME).write_text(
+            json.dumps(record, indent=2), encoding="utf-8"
+        )
+    except OSError as e:
+        logger.warning(f"Failed to write timings: {sanitize_log_message(e)}")
 
 
 def process_pdf(
@@ -308,34 +1144,309 @@ def process_pdf(
 
     Returns:
         Path to the generated Markdown file, or None if processing failed.
+        Use process_document() to also get the per-stage timings.
     """
-    # 1. Input Validation
-    if not _validate_input_path(pdf_path):
-        return None
+    return process_document(pdf_path, output_dir, options, converter).output_path
+
 
-    # 2. Security Check: Path Traversal
+def rerender(
+    output_dir: Path, options: DocumentConversionOptions | None = None
+) -> Path | None:
+    """
+    Rebuilds the Markdown (and images) in output_dir from the DoclingDocument
+    stored by an earlier conversion with save_document_json=True, without
+    running the Docling pipeline. Only the render part of options applies
+    (table format, image format and directory, Markdown name, text-only).
+
+    Returns:
+        Path to the generated Markdown file, or None if re-rendering failed.
+    """
     if not _validate_output_security(output_dir):
         return None
 
-    # 3. Processing
-    try:
-        actual_options = options or DocumentConversionOptions()
-        with _converter_lock:
-            # Get or initialize the shared converter
-            shared_converter = _get_or_create_converter(actual_options)
-
-            if converter:
-                # Use explicit converter (already configured) but still use our
-                # saving logic
-                result = converter.convert(pdf_path)
-                doc = result.document
-                return shared_converter._save_markdown(doc, output_dir, actual_options)
-
-            return shared_converter.convert(pdf_path, output_dir, actual_options)
-
-    except (OSError, PermissionError) as e:
-        logger.error(f"Could not create output directory: {e}")
+    json_path = output_dir / DOCUMENT_JSON_NAME
+    if not json_path.is_file():
+        logger.error(
+            f"No stored document in {sanitize_log_message(output_dir)}; "
+            "convert with save_document_json=True first"
+        )
         return None
+
+    actual_options = options or DocumentConversionOptions()
+    try:
+        start = time.perf_counter()
+        doc = DoclingDocument.load_from_json(json_path)
+        # The stored document stays untouched and keeps referencing the
+        # original images, so re-rendering never compounds lossy re-encoding.
+        render = replace(actual_options.render, save_document_json=False)
+        result_path = _save_document(doc, output_dir, render)
+        elapsed = time.perf_counter() - start
+        logger.info(f"Re-rendered {result_path.name} in {elapsed:.3f}s")
+        return result_path
     except Exception as e:
-        logger.error(f"Workflow Error: {e}")
+        logger.error(f"Re-render Error: {sanitize_log_message(e)}")
         return None
+
+
+def _batch_output_dirs(
+    paths: Iterable[Path], output_root: Path
+) -> Iterator[tuple[Path, Path]]:
+    """Assigns each input its own directory, output_root/<stem>, made unique."""
+    used: set[str] = set()
+    for path in paths:
+        name = path.stem
+        suffix = 1
+        while name in used:
+            suffix += 1
+            name = f"{path.stem}_{suffix}"
+        used.add(name)
+        yield path, output_root / name
+
+
+def process_many(
+    paths: Iterable[Path],
+    output_root: Path,
+    options: DocumentConversionOptions | None = None,
+) -> Iterator[ProcessResult]:
+    """
+    Converts many documents, yielding a ProcessResult for each one as it
+    finishes. Each document is written to its own directory below output_root
+    (named after the file stem).
+
+    Documents are fed through Docling's batched convert_all() on one pooled
+    converter, and each converted document is serialized and written on a
+    writer thread while the next one is being converted. Cache hits, XLSX
+    workbooks and PDFs that are split into segments (sharding, adaptive OCR)
+    are handled one by one. Failures are reported in the results and never
+    stop the batch.
+    """
+    actual_options = options or DocumentConversionOptions()
+    cache = _default_cache if actual_options.use_cache else None
+
+    batch: list[tuple[Path, Path, str | None]] = []
+    individual: list[tuple[Path, Path, str | None, list[PageSegment]]] = []
+    for input_path, output_dir in _batch_output_dirs(paths, output_root):
+        if not _validate_input_path(input_path):
+            yield ProcessResult(input_path, error="Input file not found")
+            continue
+        if not _validate_output_security(output_dir):
+            yield ProcessResult(input_path, error="Invalid output directory")
+            continue
+        try:
+            cache_key = None
+            if cache:
+                lookup_start = time.perf_counter()
+                with collect_timings() as timings:
+                    cache_key, cached_path = _restore_from_cache(
+                        cache, input_path, output_dir, actual_options
+                    )
+                if cached_path:
+                    yield ProcessResult(
+                        input_path,
+                        output_path=cached_path,
+                        cache_hit=True,
+                        total_seconds=time.perf_counter() - lookup_start,
+                        timings=timings.as_dict(),
+                    )
+                    continue
+            # Planned once: text coverage detection reads every page
+            segments = _plan_segments(input_path, actual_options)
+            if segments or _is_streamed_spreadsheet(input_path, actual_options):
+                individual.append((input_path, output_dir, cache_key, segments))
+            else:
+                batch.append((input_path, output_dir, cache_key))
+        except Exception as e:
+            yield _failed(input_path, e)
+
+    if batch:
+        yield from _convert_batch(batch, actual_options, cache)
+
+    for input_path, output_dir, cache_key, segments in individual:
+        start = time.perf_counter()
+        with collect_timings() as timings, PeakRssSampler() as memory:
+            try:
+                result_path, ocr_stats = _convert_and_save(
+                    input_path, output_dir, actual_options, segments
+                )
+                _store_in_cache(
+                    cache, cache_key, output_dir, result_path, actual_options
+                )
+                result = ProcessResult(
+                    input_path, output_path=result_path, ocr=ocr_stats
+                )
+            except Exception as e:
+                result = _failed(input_path, e)
+        result.total_seconds = time.perf_counter() - start
+        result.peak_rss_bytes = memory.peak_bytes
+        yield _with_timings(result, timings, output_dir, actual_options)
+
+
+def _convert_batch(
+    items: list[tuple[Path, Path, str | None]],
+    options: DocumentConversionOptions,
+    cache: ConversionCache | None,
+) -> Iterator[ProcessResult]:
+    """
+    Runs convert_all() over items, saving each document on a writer thread.
+    The batch keeps one pooled converter, but holds a conversion slot only
+    while a document converts, so other requests interleave with the batch.
+    """
+    logger.info(f"Converting a batch of {len(items)} documents")
+
+    def _save(
+        input_path: Path,
+        output_dir: Path,
+        cache_key: str | None,
+        doc: DoclingDocument,
+        timings: StageTimings,
+        convert_seconds: float,
+        peak_rss_bytes: int | None,
+    ) -> ProcessResult:
+        save_start = time.perf_counter()
+        with collect_timings(timings):
+            try:
+                result_path = _save_document(doc, output_dir, options.render)
+                _store_in_cache(cache, cache_key, output_dir, result_path, options)
+                result = ProcessResult(input_path, output_path=result_path)
+            except Exception as e:
+                result = _failed(input_path, e)
+        result.total_seconds = convert_seconds + time.perf_counter() - save_start
+        # The peak of the conversion: saving overlaps the next document's
+        result.peak_rss_bytes = peak_rss_bytes
+        return _with_timings(result, timings, output_dir, options)
+
+    saves: deque = deque()
+    with (
+        _converter_pool.borrow(options) as converter,
+        ThreadPoolExecutor(max_workers=1) as writer,
+    ):
+        results = converter.doc_converter.convert_all(
+            [input_path for input_path, _, _ in items], raises_on_error=False
+        )
+        # Results are matched to their inputs by path, never by position
+        pending: dict[Path, deque] = {}
+        for item in items:
+            pending.setdefault(item[0].resolve(), deque()).append(item)
+
+        # convert_all() yields one result per input: stop after as many, so
+        # that results for unexpected inputs cannot keep the loop going
+        for _ in range(len(items)):
+            if not pending:
+                break
+            timings = StageTimings()
+            try:
+                # convert_all() converts lazily, one document per next()
+                with (
+                    collect_timings(timings),
+                    _converter_pool.slot(),
+                    PeakRssSampler() as memory,
+                ):
+                    convert_start = time.perf_counter()
+                    conv_result = next(results)
+                    convert_seconds = time.perf_counter() - convert_start
+            except StopIteration:
+                break
+            except Exception as e:
+                # The batch cannot continue: report all remaining files
+                for failed_path, _, _ in _unmatched(items, pending):
+                    saves.append(_completed(_failed(failed_path, e)))
+                pending.clear()
+                break
+
+            result_key = Path(conv_result.input.file).resolve()
+            queue = pending.get(result_key)
+            if not queue:
+                logger.warning(
+                    "Ignoring a batch result for an unexpected input: "
+                    f"{sanitize_log_message(conv_result.input.file)}"
+                )
+                continue
+            input_path, output_dir, cache_key = queue.popleft()
+            if not queue:
+                del pending[result_key]
+
+            if conv_result.status not in (
+                ConversionStatus.SUCCESS,
+                ConversionStatus.PARTIAL_SUCCESS,
+            ):
+                errors = "; ".join(err.error_message for err in conv_result.errors)
+                error = errors or f"Conversion {conv_result.status.value}"
+                saves.append(_completed(_failed(input_path, error)))
+            else:
+                timings.add("convert", convert_seconds)
+                if conv_result.timings:
+                    timings.add_docling(conv_result.timings)
+                doc = conv_result.document
+                saves.append(
+                    writer.submit(
+                        _save,
+                        input_path,
+                        output_dir,
+                        cache_key,
+                        doc,
+                        timings,
+                        convert_seconds,
+                        memory.peak_bytes,
+                    )
+                )
+
+            # Hand out whatever has been written while this document converted
+            while saves and saves[0].done():
+                yield saves.popleft().result()
+
+        # Inputs that convert_all() never returned a result for
+        for input_path, _, _ in _unmatched(items, pending):
+            result = _failed(input_path, "No conversion result returned")
+            saves.append(_completed(result))
+
+        while saves:
+            yield saves.popleft().result()
+
+
+def _unmatched(
+    items: list[tuple[Path, Path, str | None]], pending: dict[Path, deque]
+) -> list[tuple[Path, Path, str | None]]:
+    """The items still waiting for a result, in their original order."""
+    waiting = {id(item) for queue in pending.values() for item in queue}
+    return [item for item in items if id(item) in waiting]
+
+
+def _store_in_cache(
+    cache: ConversionCache | None,
+    cache_key: str | None,
+    output_dir: Path,
+    result_path: Path,
+    options: DocumentConversionOptions,
+) -> None:
+    if cache and cache_key:
+        with stage("cache_store"):
+            cache.store(
+                cache_key,
+                result_path,
+                [output_dir / options.image_dir_name, output_dir / DOCUMENT_JSON_NAME],
+            )
+
+
+def _with_timings(
+    result: ProcessResult,
+    timings: StageTimings,
+    output_dir: Path,
+    options: DocumentConversionOptions,
+) -> ProcessResult:
+    result.timings = timings.as_dict()
+    _report_timings(result.timing_record(), output_dir, options)
+    return result
+
+
+def _completed(result: ProcessResult) -> Future:
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+
+def _failed(input_path: Path, error: Any) -> ProcessResult:
+    logger.error(
+        f"Failed to convert {sanitize_log_message(input_path.name)}: "
+        f"{sanitize_log_message(error)}"
+    )
+    return ProcessResult(input_path, error=str(error))
@@ -0,0 +1,119 @@
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image
+
+from .config import IMAGE_EXPORT_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# Supported output formats: name -> (Pillow format, MIME type, file extension)
+IMAGE_FORMATS = {
+    "png": ("PNG", "image/png", "png"),
+    "webp": ("WEBP", "image/webp", "webp"),
+    "jpeg": ("JPEG", "image/jpeg", "jpg"),
+}
+
+# Pillow image modes each format can store without conversion
+_NATIVE_MODES = {
+    "PNG": {"1", "L", "LA", "P", "RGB", "RGBA", "I", "I;16"},
+    "WEBP": {"RGB", "RGBA"},
+    "JPEG": {"L", "RGB"},
+}
+
+
+@dataclass
+class ImageExportStats:
+    """Counters describing the images an exporter has handled."""
+
+    written: int = 0
+    deduplicated: int = 0
+
+
+def _content_hash(image: Image.Image) -> str:
+    """Hashes the decoded pixels, so identical pictures hash equally."""
+    digest = hashlib.sha256(f"{image.mode}:{image.size}".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+class ImageExporter:
+    """
+    Encodes and writes pictures on a thread pool.
+
+    Identical pictures (e.g. a logo repeated on every slide) are detected by a
+    hash of their pixels and written only once. PNG, WebP and JPEG are
+    supported; quality applies to the lossy formats.
+    """
+
+    def __init__(
+        self,
+        images_dir: Path,
+        image_format: str = "png",
+        quality: int = 90,
+        workers: int = IMAGE_EXPORT_WORKERS,
+    ):
+        if image_format.lower() not in IMAGE_FORMATS:
+            raise ValueError(
+                f"Unsupported image format: {image_format}. "
+                f"Supported: {sorted(IMAGE_FORMATS)}"
+            )
+        self.images_dir = images_dir
+        self.pil_format, self.mimetype, self.extension = IMAGE_FORMATS[
+            image_format.lower()
+        ]
+        self.quality = quality
+        self.workers = max(1, workers)
+        self.stats = ImageExportStats()
+
+    def export(self, images: list[Image.Image]) -> list[Path]:
+        """
+        Writes images into images_dir and returns the file path of each one,
+        in input order. Duplicates share the same path.
+        """
+        if not images:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            hashes = list(executor.map(_content_hash, images))
+
+            unique: dict[str, Image.Image] = {}
+            for content_hash, image in zip(hashes, images, strict=True):
+                unique.setdefault(content_hash, image)
+
+            paths = {
+                content_hash: self._path_for(content_hash) for content_hash in unique
+            }
+            # list() propagates the first encoding error, if any
+            list(
+                executor.map(
+                    self._write, unique.values(), (paths[h] for h in unique)
+                )
+            )
+
+        self.stats.written += len(unique)
+        self.stats.deduplicated += len(images) - len(unique)
+        return [paths[content_hash] for content_hash in hashes]
+
+    def _path_for(self, content_hash: str) -> Path:
+        return self.images_dir / f"image_{content_hash[:16]}.{self.extension}"
+
+    def _write(self, image: Image.Image, path: Path) -> None:
+        if path.exists():
+            # Same content from an earlier run into the same directory
+            return
+
+        if image.mode not in _NATIVE_MODES[self.pil_format]:
+            has_alpha = "A" in image.getbands() and self.pil_format != "JPEG"
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        save_kwargs = {} if self.pil_format == "PNG" else {"quality": self.quality}
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            image.save(tmp_path, format=self.pil_format, **save_kwargs)
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from .options import DocumentConversionOptions
+from .overload import QueueFull, RetryAfterEstimator
+from .progress import ConversionProgress
+from .utils import sanitize_log_message
+
+logger = logging.getLogger(__name__)
+
+_SHUTDOWN_ERROR = "The server shut down before the job finished."
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+# Progress stage reported for each status; finished jobs are "done"
+_STAGES = {"queued": "queued", "running": "converting"}
+
+
+@dataclass
+class Job:
+    """A conversion submitted through POST /jobs."""
+
+    id: str
+    filename: str
+    file_type: str
+    input_path: Path = field(repr=False)
+    output_dir: Path = field(repr=False)
+    options: DocumentConversionOptions | None = field(default=None, repr=False)
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    # The /convert/ response body once the job has succeeded
+    result: dict[str, str] | None = None
+    error: str | None = None
+    # Pages converted so far (PDFs only)
+    progress: ConversionProgress = field(default_factory=ConversionProgress, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def timings(self) -> dict[str, float]:
+        """Seconds spent queued and converting (so far, for unfinished jobs)."""
+        now = time.time()
+        started = self.started_at or now
+        timings = {"queued_seconds": round(started - self.created_at, 4)}
+        if self.started_at is not None:
+            timings["conversion_seconds"] = round(
+                (self.finished_at or now) - self.started_at, 4
+            )
+        if self.finished_at is not None:
+            timings["total_seconds"] = round(self.finished_at - self.created_at, 4)
+        return timings
+
+
+def _isoformat(timestamp: float | None) -> str | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, UTC).isoformat()
+
+
+class JobManager:
+    """
+    Runs submitted jobs on a fixed number of asyncio worker tasks, in
+    submission order. Jobs do not belong to the request that submitted them,
+    so they keep running when the client disconnects. At most max_queued
+    jobs wait for a worker; further submissions raise QueueFull. The most
+    recent finished jobs are remembered so that their status can still be
+    polled.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Job], Awaitable[dict[str, str]]],
+        workers: int,
+        history_size: int,
+        max_queued: int,
+    ):
+        self._runner = runner
+        self.workers = max(1, workers)
+        self._history_size = history_size
+        self.max_queued = max(1, max_queued)
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=self.max_queued)
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._tasks: list[asyncio.Task] = []
+        self._durations = RetryAfterEstimator(self.workers)
+
+    def start(self) -> None:
+        """Starts the worker tasks on the running event loop."""
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{index}")
+            for index in range(self.workers)
+        ]
+
+    async def stop(self) -> list[Job]:
+        """
+        Cancels the workers; running jobs are interrupted. Returns the jobs
+        that never started, marked as failed, so that their uploads can be
+        removed.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        abandoned = []
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            job.status = "failed"
+            job.error = _SHUTDOWN_ERROR
+            job.finished_at = time.time()
+            abandoned.append(job)
+        return abandoned
+
+    @property
+    def full(self) -> bool:
+        return self._queue.full()
+
+    def submit(self, job: Job) -> Job:
+        """Queues job, or raises QueueFull when max_queued jobs are waiting."""
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFull("Job queue", self.retry_after()) from None
+        self._jobs[job.id] = job
+        return job
+
+    def retry_after(self) -> int:
+        """Seconds until the queue is likely to have room again."""
+        # One queued job starts whenever one of the workers finishes
+        return self._durations.retry_after()
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def counts(self) -> dict[str, int]:
+        """Number of remembered jobs per status."""
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return counts
+
+    def queue_position(self, job: Job) -> int | None:
+        """1-based position of a queued job among the queued jobs."""
+        if job.status != "queued":
+            return None
+        queued = [j for j in self._jobs.values() if j.status == "queued"]
+        return queued.index(job) + 1
+
+    def describe(self, job: Job) -> dict[str, Any]:
+        """The GET /jobs/{id} response body."""
+        return {
+            "job_id": job.id,
+            "status": job.status,
+            "filename": job.filename,
+            "created_at": _isoformat(job.created_at),
+            "started_at": _isoformat(job.started_at),
+            "finished_at": _isoformat(job.finished_at),
+            "progress": {
+                "stage": _STAGES.get(job.status, "done"),
+                "queue_position": self.queue_position(job),
+                **job.progress.as_dict(),
+            },
+            "timings": job.timings(),
+            "result": job.result,
+            "error": job.error,
+        }
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            job.started_at = time.time()
+            try:
+                job.result = await self._runner(job)
+                job.status = "succeeded"
+            except asyncio.CancelledError:
+                job.status = "failed"
+                job.error = _SHUTDOWN_ERROR
+                raise
+            except Exception as e:
+                job.status = "failed"
+                # HTTPException carries its message in detail
+                job.error = str(getattr(e, "detail", e))
+                logger.error(f"Job {job.id} failed: {sanitize_log_message(job.error)}")
+            finally:
+                job.finished_at = time.time()
+                self._durations.record(job.finished_at - job.started_at)
+                self._queue.task_done()
+                self._forget_old_jobs()
+
+    def _forget_old_jobs(self) -> None:
+        """Drops the oldest finished jobs beyond the history size."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[: max(0, len(finished) - self._history_size)]:
+            del self._jobs[job_id]
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from .options import DocumentConversionOptions
+
+# Entry points into converter.py that import Docling (and with it docling_core
+# and torch) on their first call. The CLI and the server use these so that
+# --help, argument errors and server startup never pay that import time.
+
+
+def process_pdf(
+    pdf_path: Path,
+    output_dir: Path,
+    options: DocumentConversionOptions | None = None,
+) -> Path | None:
+    """See converter.process_pdf."""
+    from .converter import process_pdf as _process_pdf
+
+    return _process_pdf(pdf_path, output_dir, options=options)
+
+
+def rerender(
+    output_dir: Path, options: DocumentConversionOptions | None = None
+) -> Path | None:
+    """See converter.rerender."""
+    from .converter import rerender as _rerender
+
+    return _rerender(output_dir, options)
@@ -0,0 +1,103 @@
+import gc
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from .config import MEMORY_BUDGET_BYTES, MEMORY_SAMPLE_INTERVAL
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_bytes(pid: int | None = None) -> int | None:
+    """
+    Returns the resident set size of a process (this one by default), or None
+    where /proc is not available. RSS is used rather than tracemalloc because
+    most of a conversion's memory (model weights, tensors, page bitmaps) is
+    allocated outside the Python allocator.
+    """
+    statm = Path(f"/proc/{pid or 'self'}/statm")
+    try:
+        return int(statm.read_text().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class PeakRssSampler:
+    """
+    Samples memory usage in a background thread while a block runs and keeps
+    the peak. RSS belongs to the whole process, so with conversions running
+    concurrently the peak includes the memory of the others.
+    """
+
+    def __init__(
+        self,
+        measure: Callable[[], int | None] = rss_bytes,
+        interval: float = MEMORY_SAMPLE_INTERVAL,
+    ):
+        self._measure = measure
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.start_bytes: int | None = None
+        self.peak_bytes: int | None = None
+
+    def _sample(self) -> None:
+        usage = self._measure()
+        if usage is not None and (self.peak_bytes is None or usage > self.peak_bytes):
+            self.peak_bytes = usage
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._sample()
+
+    def __enter__(self) -> "PeakRssSampler":
+        self.start_bytes = self.peak_bytes = self._measure()
+        if self.start_bytes is not None:
+            self._thread = threading.Thread(
+                target=self._run, name="rss-sampler", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._sample()
+
+
+class MemoryBudget:
+    """
+    Admission check against a memory limit: conversions should only start
+    while the measured usage is at or below limit_bytes (0 disables it).
+    """
+
+    def __init__(
+        self,
+        limit_bytes: int = MEMORY_BUDGET_BYTES,
+        measure: Callable[[], int | None] = rss_bytes,
+    ):
+        self.limit_bytes = limit_bytes
+        self._measure = measure
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit_bytes > 0
+
+    def usage_bytes(self) -> int | None:
+        return self._measure()
+
+    def has_headroom(self) -> bool:
+        """
+        Whether a new conversion may start. When over the limit, unreachable
+        Python objects are collected first and the usage is measured again.
+        """
+        if not self.enabled:
+            return True
+        usage = self._measure()
+        if usage is None or usage <= self.limit_bytes:
+            return True
+        gc.collect()
+        usage = self._measure()
+        return usage is None or usage <= self.limit_bytes
@@ -0,0 +1,53 @@
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class OcrStats:
+    """Per-document report of adaptive OCR."""
+
+    pages: int = 0
+    ocr_pages: int = 0
+    # Conversion time of the page ranges converted with and without OCR
+    ocr_seconds: float = 0.0
+    text_seconds: float = 0.0
+    # None until pages of both kinds have been converted in this process
+    estimated_seconds_saved: float | None = None
+
+    @property
+    def skipped_pages(self) -> int:
+        return self.pages - self.ocr_pages
+
+
+def pages_needing_ocr(coverages: list[float], min_coverage: float) -> list[bool]:
+    """Flags the pages whose text layer covers less than min_coverage."""
+    return [coverage < min_coverage for coverage in coverages]
+
+
+class OcrCostModel:
+    """
+    Learns the average conversion time per page with and without OCR from
+    every document converted in this process, to estimate how much time
+    skipping OCR saved.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ocr_pages = 0
+        self._ocr_seconds = 0.0
+        self._text_pages = 0
+        self._text_seconds = 0.0
+
+    def record(self, stats: OcrStats) -> None:
+        """Adds the timings of a document and fills in its estimated saving."""
+        with self._lock:
+            self._ocr_pages += stats.ocr_pages
+            self._ocr_seconds += stats.ocr_seconds
+            self._text_pages += stats.skipped_pages
+            self._text_seconds += stats.text_seconds
+            if self._ocr_pages and self._text_pages:
+                overhead = (
+                    self._ocr_seconds / self._ocr_pages
+                    - self._text_seconds / self._text_pages
+                )
+                stats.estimated_seconds_saved = max(0.0, overhead) * stats.skipped_pages
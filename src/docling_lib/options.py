@@ -0,0 +1,126 @@
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .config import (
+    ADAPTIVE_OCR,
+    IMAGE_DIR_NAME,
+    IMAGE_RESOLUTION_SCALE,
+    INCREMENTAL_CONVERSION,
+    MD_OUTPUT_NAME,
+    OCR_MIN_TEXT_COVERAGE,
+    SHARD_PAGES,
+    SHARD_WORKERS,
+    STREAM_SPREADSHEETS,
+)
+
+# Kept free of Docling imports: the CLI and the server build options at
+# startup, long before (and often without) running a conversion.
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """
+    Options that configure the Docling pipeline and its models.
+    Changing any of them requires a different PDFConverter.
+    """
+
+    image_scale: float = IMAGE_RESOLUTION_SCALE
+    do_formula: bool = True
+    do_ocr: bool = True
+    text_only: bool = False
+
+
+@dataclass(frozen=True)
+class RenderConfig:
+    """
+    Options that only affect how a converted document is serialized.
+    Changing them never touches the Docling models.
+    """
+
+    image_dir_name: str = IMAGE_DIR_NAME
+    md_output_name: str = MD_OUTPUT_NAME
+    table_format: str = "html"
+    image_format: str = "png"
+    image_quality: int = 90
+    text_only: bool = False
+    save_document_json: bool = False
+    timings_output: str | None = None
+
+
+@dataclass
+class DocumentConversionOptions:
+    """
+    Options for document conversion and serialization.
+    See the pipeline and render properties for how they are split.
+    """
+
+    image_dir_name: str = IMAGE_DIR_NAME
+    md_output_name: str = MD_OUTPUT_NAME
+    image_scale: float = IMAGE_RESOLUTION_SCALE
+    table_format: str = "html"
+    do_formula: bool = True
+    do_ocr: bool = True
+    # With do_ocr, only OCR the PDF pages whose text layer covers less than
+    # ocr_min_coverage of the page (born-digital pages skip OCR).
+    adaptive_ocr: bool = ADAPTIVE_OCR
+    ocr_min_coverage: float = OCR_MIN_TEXT_COVERAGE
+    image_format: str = "png"  # png, webp or jpeg
+    image_quality: int = 90  # Only used by the lossy formats
+    # Skips page and picture image generation; pictures become placeholders
+    text_only: bool = False
+    # Stores the DoclingDocument as JSON next to the Markdown (see rerender)
+    save_document_json: bool = False
+    # Where to write the per-stage timings besides the log and the result:
+    # "frontmatter", "sidecar" (timings.json) or None
+    timings_output: str | None = None
+    # XLSX workbooks are streamed sheet by sheet instead of going through
+    # Docling. Opt-in: the output matches Docling's only for plain tables in
+    # HTML format (see tests/test_spreadsheet.py)
+    stream_spreadsheets: bool = STREAM_SPREADSHEETS
+    use_cache: bool = True
+    # With the cache enabled, PDFs are converted page by page and the pages of
+    # a new revision whose content is unchanged are reused from the cache.
+    incremental: bool = INCREMENTAL_CONVERSION
+    # PDFs longer than shard_pages are converted in page-range shards on up to
+    # shard_workers pooled converters and merged in page order (0 disables).
+    shard_pages: int = SHARD_PAGES
+    shard_workers: int = SHARD_WORKERS
+
+    @property
+    def pipeline(self) -> PipelineConfig:
+        """The part of the options that configures the Docling pipeline."""
+        return PipelineConfig(
+            image_scale=self.image_scale,
+            do_formula=self.do_formula,
+            do_ocr=self.do_ocr,
+            text_only=self.text_only,
+        )
+
+    @property
+    def render(self) -> RenderConfig:
+        """The part of the options that only affects serialization."""
+        return RenderConfig(
+            image_dir_name=self.image_dir_name,
+            md_output_name=self.md_output_name,
+            table_format=self.table_format,
+            image_format=self.image_format,
+            image_quality=self.image_quality,
+            text_only=self.text_only,
+            save_document_json=self.save_document_json,
+            timings_output=self.timings_output,
+        )
+
+    def output_signature(self) -> dict[str, Any]:
+        """Returns the options that change the generated output (cache key)."""
+        signature = asdict(self.pipeline) | asdict(self.render)
+        # The Markdown file name does not change its content
+        del signature["md_output_name"]
+        # Shard boundaries may affect cross-page structures such as paragraphs
+        signature["shard_pages"] = self.shard_pages
+        signature["stream_spreadsheets"] = self.stream_spreadsheets
+        if self.adaptive_ocr:
+            signature["ocr_min_coverage"] = self.ocr_min_coverage
+        # Page-by-page conversion may split cross-page structures, like shards
+        if self.incremental:
+            signature["incremental"] = True
+        return signature
@@ -0,0 +1,43 @@
+import math
+
+# Assumed duration of a unit of work before any has finished, for Retry-After
+_DEFAULT_SECONDS = 5.0
+_MAX_RETRY_AFTER = 600
+# Weight of the latest duration in the average
+_SMOOTHING = 0.2
+
+
+class QueueFull(Exception):
+    """
+    Raised when work is rejected because its wait queue is full; retry_after
+    is the Retry-After estimate in seconds.
+    """
+
+    def __init__(self, queue: str, retry_after: int):
+        super().__init__(f"{queue} full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class RetryAfterEstimator:
+    """
+    Estimates Retry-After from the smoothed duration of finished work, the
+    work queued ahead of a new request and the number of workers serving
+    the queue.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self.average_seconds: float | None = None
+
+    def record(self, seconds: float) -> None:
+        """Adds the duration of a finished unit of work to the average."""
+        if self.average_seconds is None:
+            self.average_seconds = seconds
+        else:
+            self.average_seconds += _SMOOTHING * (seconds - self.average_seconds)
+
+    def retry_after(self, ahead: int = 1) -> int:
+        """Seconds until `ahead` units of work have likely finished."""
+        average = self.average_seconds or _DEFAULT_SECONDS
+        estimate = average * ahead / self.workers
+        return max(1, min(math.ceil(estimate), _MAX_RETRY_AFTER))
@@ -0,0 +1,144 @@
+import ctypes
+import hashlib
+from pathlib import Path
+
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+
+
+def count_pages(pdf_path: Path) -> int:
+    """Returns the number of pages of a PDF without converting it."""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def text_coverage(pdf_path: Path) -> list[float]:
+    """
+    Returns, for each page, the fraction of the page area covered by the
+    rectangles of its text layer (0.0 for scanned pages without one).
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        coverages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                text_area = 0.0
+                for i in range(textpage.count_rects()):
+                    left, bottom, right, top = textpage.get_rect(i)
+                    text_area += abs(right - left) * abs(top - bottom)
+            finally:
+                textpage.close()
+            width, height = page.get_size()
+            page.close()
+            area = width * height
+            coverages.append(min(1.0, text_area / area) if area else 0.0)
+        return coverages
+    finally:
+        pdf.close()
+
+
+def page_fingerprints(pdf_path: Path) -> list[str]:
+    """
+    Returns, for each page, a hash of its content: page size and rotation,
+    and the type and bounds of every page object, plus the text of text
+    objects and the raw data of images. The hash does not depend on the
+    page's position or on the rest of the file, so a page keeps its hash
+    across revisions of a document that leave it unchanged.
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        fingerprints = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                digest = hashlib.sha256(
+                    repr((page.get_size(), page.get_rotation())).encode()
+                )
+                for obj in page.get_objects():
+                    bounds = tuple(round(v, 2) for v in obj.get_bounds())
+                    digest.update(repr((obj.type, bounds)).encode())
+                    if obj.type == pdfium_c.FPDF_PAGEOBJ_TEXT:
+                        digest.update(_object_text(obj, textpage))
+                    elif obj.type == pdfium_c.FPDF_PAGEOBJ_IMAGE:
+                        digest.update(obj.get_data(decode_simple=False))
+            finally:
+                textpage.close()
+            page.close()
+            fingerprints.append(digest.hexdigest())
+        return fingerprints
+    finally:
+        pdf.close()
+
+
+def _object_text(obj, textpage) -> bytes:
+    """Returns the UTF-16 text of a text object (raw API, stable across versions)."""
+    size = pdfium_c.FPDFTextObj_GetText(obj.raw, textpage.raw, None, 0)
+    buffer = ctypes.create_string_buffer(size)
+    pointer = ctypes.cast(buffer, ctypes.POINTER(pdfium_c.FPDF_WCHAR))
+    pdfium_c.FPDFTextObj_GetText(obj.raw, textpage.raw, pointer, size)
+    return buffer.raw
+
+
+def write_sample_pdf(pdf_path: Path, text: str, pages: int = 1) -> None:
+    """
+    Writes a PDF with the text on each of its pages, one text line per line
+    of text (e.g. for warming up models or generating benchmark inputs).
+    """
+    pdf = pdfium.PdfDocument.new()
+    try:
+        for _ in range(pages):
+            page = pdf.new_page(595, 842)  # A4 in points
+            for index, line in enumerate(text.splitlines() or [""]):
+                obj = pdfium_c.FPDFPageObj_NewTextObj(pdf.raw, b"Helvetica", 12)
+                encoded = (line + "\x00").encode("utf-16-le")
+                buffer = ctypes.create_string_buffer(encoded)
+                pdfium_c.FPDFText_SetText(
+                    obj, ctypes.cast(buffer, ctypes.POINTER(pdfium_c.FPDF_WCHAR))
+                )
+                pdfium_c.FPDFPageObj_Transform(obj, 1, 0, 0, 1, 72, 770 - 16 * index)
+                pdfium_c.FPDFPage_InsertObject(page.raw, obj)
+            pdfium_c.FPDFPage_GenerateContent(page.raw)
+            page.close()
+        pdf.save(pdf_path)
+    finally:
+        pdf.close()
+
+
+def page_runs(
+    flags: list[bool], max_pages: int = 0
+) -> list[tuple[tuple[int, int], bool]]:
+    """
+    Groups consecutive pages with the same flag into 1-based inclusive page
+    ranges, each at most max_pages long (0 = unlimited).
+    """
+    runs: list[tuple[tuple[int, int], bool]] = []
+    start = 1
+    for page, flag in enumerate(flags, start=1):
+        is_last = page == len(flags)
+        if is_last or flags[page] != flag:
+            if max_pages > 0:
+                runs.extend(
+                    ((first + start - 1, last + start - 1), flag)
+                    for first, last in page_ranges(page - start + 1, max_pages)
+                )
+            else:
+                runs.append(((start, page), flag))
+            start = page + 1
+    return runs
+
+
+def page_ranges(page_count: int, shard_pages: int) -> list[tuple[int, int]]:
+    """
+    Splits page_count pages into consecutive shards of at most shard_pages.
+    Ranges are 1-based and inclusive, as expected by Docling's page_range.
+    """
+    if shard_pages <= 0:
+        raise ValueError("shard_pages must be positive")
+    return [
+        (start, min(start + shard_pages - 1, page_count))
+        for start in range(1, page_count + 1, shard_pages)
+    ]
@@ -0,0 +1,174 @@
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.sharedctypes import Synchronized
+from pathlib import Path
+
+from .config import MAX_TASKS_PER_CHILD, PROCESS_WORKER_THREADS, PROCESS_WORKERS
+from .lazy import process_pdf
+from .options import DocumentConversionOptions
+
+logger = logging.getLogger(__name__)
+
+# Thread pools sized by these variables are created when torch (or NumPy) is
+# first imported, so they are set before the worker imports the converter
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+_STARTUP_POLL_SECONDS = 0.05
+
+# Workers of the pool that have loaded their models (set by _init_worker)
+_started_workers: "Synchronized[int] | None" = None
+
+
+def _limit_threads(threads: int) -> None:
+    """Caps the intra-op threads of torch and the BLAS/OpenMP libraries."""
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(threads)
+
+
+def _init_worker(
+    options: DocumentConversionOptions,
+    threads: int,
+    started: "Synchronized[int]",
+) -> None:
+    """
+    Runs once in every worker process: builds the worker's converter and loads
+    its models so that jobs never pay the initialization cost.
+    """
+    global _started_workers
+    # Every worker would otherwise start one thread per core
+    _limit_threads(threads)
+    from .converter import _converter_pool
+
+    with _converter_pool.checkout(options) as converter:
+        converter.preload()
+    _started_workers = started
+    with started.get_lock():
+        started.value += 1
+    logger.info(f"Conversion worker {multiprocessing.current_process().name} ready")
+
+
+def _await_workers(count: int) -> int:
+    """
+    Startup task: returns (the worker's PID) once count workers have loaded
+    their models. Blocking until then keeps every worker busy with one of
+    these tasks, so that all of them start instead of the first one taking
+    every task.
+    """
+    while _started_workers is None or _started_workers.value < count:
+        time.sleep(_STARTUP_POLL_SECONDS)
+    return os.getpid()
+
+
+def _run_job(
+    pdf_path: Path, output_dir: Path, options: DocumentConversionOptions | None
+) -> Path | None:
+    """Converts one document inside a worker process."""
+    return process_pdf(pdf_path, output_dir, options=options)
+
+
+class ProcessPoolConverter:
+    """
+    Process-pool conversion backend.
+
+    Docling inference and the Python parts of serialization are limited by the
+    GIL when run on threads. Here every worker process builds its converter once
+    at startup, receives jobs as paths plus options, and returns the path of
+    the generated Markdown file (or None), exactly like process_pdf.
+
+    ProcessPoolExecutor only starts workers as jobs arrive, so all of them are
+    started at construction with one startup task each; unless wait is False,
+    the constructor returns once every worker has loaded its models (see
+    wait_until_started). Each worker runs torch with threads_per_worker
+    threads (0: the CPU cores shared among the workers).
+    """
+
+    def __init__(
+        self,
+        workers: int = PROCESS_WORKERS,
+        max_tasks_per_child: int = MAX_TASKS_PER_CHILD,
+        preload_options: DocumentConversionOptions | None = None,
+        threads_per_worker: int = PROCESS_WORKER_THREADS,
+        wait: bool = True,
+    ):
+        self.workers = max(1, workers)
+        self.threads_per_worker = threads_per_worker or max(
+            1, (os.cpu_count() or 1) // self.workers
+        )
+        # "spawn" starts clean interpreters, which is safe with the threads that
+        # torch and the converter pool create, and is required for
+        # max_tasks_per_child.
+        context = multiprocessing.get_context("spawn")
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(
+                preload_options or DocumentConversionOptions(),
+                self.threads_per_worker,
+                context.Value("i", 0),
+            ),
+            max_tasks_per_child=max_tasks_per_child or None,
+        )
+        # Each submission starts a worker while none is idle
+        self._startup = [
+            self._executor.submit(_await_workers, self.workers)
+            for _ in range(self.workers)
+        ]
+        if wait:
+            self.wait_until_started()
+
+    @property
+    def startup(self) -> "list[Future[int]]":
+        """Futures of the startup tasks, done once every worker has its models."""
+        return list(self._startup)
+
+    def wait_until_started(self, timeout: float | None = None) -> None:
+        """
+        Waits until every worker has loaded its models. Raises the error of a
+        worker that failed to start (BrokenProcessPool) or TimeoutError.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in self._startup:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            future.result(timeout=remaining)
+
+    def submit(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        options: DocumentConversionOptions | None = None,
+    ) -> "Future[Path | None]":
+        """Queues a conversion and returns a future for the Markdown path."""
+        return self._executor.submit(_run_job, pdf_path, output_dir, options)
+
+    def convert(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        options: DocumentConversionOptions | None = None,
+    ) -> Path | None:
+        """Converts a document on a worker process and waits for the result."""
+        return self.submit(pdf_path, output_dir, options).result()
+
+    def worker_pids(self) -> list[int]:
+        """Process IDs of the running workers (used for memory accounting)."""
+        # ProcessPoolExecutor does not expose its processes publicly
+        processes = getattr(self._executor, "_processes", None) or {}
+        return list(processes)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the worker processes."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> "ProcessPoolConverter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
@@ -0,0 +1,64 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+# Progress of the conversion running in the current context (thread or task)
+_current: ContextVar["ConversionProgress | None"] = ContextVar(
+    "conversion_progress", default=None
+)
+
+
+class ConversionProgress:
+    """
+    Pages of one PDF conversion: how many there are and how many have been
+    converted (or restored from the page cache) so far. Page segments
+    (shards, adaptive OCR runs) report their pages as each of them finishes;
+    a conversion in a single pass only completes as a whole.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.pages_total: int | None = None
+        self.pages_done = 0
+
+    def plan(self, pages: int) -> None:
+        with self._lock:
+            self.pages_total = pages
+
+    def advance(self, pages: int) -> None:
+        with self._lock:
+            self.pages_done += pages
+
+    def complete(self) -> None:
+        """Marks every planned page as done (cache hits, other processes)."""
+        with self._lock:
+            if self.pages_total is not None:
+                self.pages_done = self.pages_total
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            total, done = self.pages_total, self.pages_done
+        return {
+            "pages_done": done if total is not None else None,
+            "pages_total": total,
+            "percent": round(100 * done / total, 1) if total else None,
+        }
+
+
+@contextmanager
+def collect_progress(progress: ConversionProgress) -> Iterator[ConversionProgress]:
+    """Makes progress receive the converted pages of this context."""
+    token = _current.set(progress)
+    try:
+        yield progress
+    finally:
+        _current.reset(token)
+
+
+def advance_pages(pages: int) -> None:
+    """Reports pages of the current conversion as converted."""
+    progress = _current.get()
+    if progress is not None:
+        progress.advance(pages)
@@ -1,21 +1,409 @@
+import asyncio
 import logging
 import os
+import shutil
+import sys
 import tempfile
+import time
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from fastapi import FastAPI, File, Header, HTTPException, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, File, Header, HTTPException, Request, UploadFile
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    PlainTextResponse,
+    StreamingResponse,
+)
 from starlette.concurrency import run_in_threadpool
 
-from .config import MAX_UPLOAD_SIZE, OUTPUT_DIR, UPLOAD_DIR, setup_logging
-from .converter import process_pdf
+from .admission import AdmissionController
+from .archive import iter_tar, iter_tar_zst, iter_zip, zstandard
+from .config import (
+    CONVERSION_BACKEND,
+    CONVERTER_WORKERS,
+    JOB_HISTORY_SIZE,
+    JOB_QUEUE_SIZE,
+    JOB_WORKERS,
+    MAX_IN_FLIGHT,
+    MAX_QUEUED_REQUESTS,
+    MAX_UPLOAD_SIZE,
+    MEMORY_BUDGET_BYTES,
+    MEMORY_BUDGET_WAIT,
+    OUTPUT_DIR,
+    PROCESS_WORKERS,
+    UPLOAD_DIR,
+    WARMUP_ENABLED,
+    setup_logging,
+)
+from .jobs import Job, JobManager
+from .lazy import process_pdf
+from .memory import MemoryBudget, PeakRssSampler, rss_bytes
+from .metrics import CONTENT_TYPE, Counter, Gauge, Histogram, Registry
+from .options import DocumentConversionOptions
+from .overload import QueueFull
+from .progress import ConversionProgress, collect_progress
 from .utils import sanitize_log_message
 
+if TYPE_CHECKING:
+    # Imports converter.py (and Docling); loaded on first use instead
+    from .process_pool import ProcessPoolConverter
+
 # --- Logging Setup ---
 setup_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Docling Markdown Conversion Server")
+# Process-pool backend, created on first use when DOCLING_BACKEND=process
+_process_backend: "ProcessPoolConverter | None" = None
+
+
+def _backend_workers() -> int:
+    """Number of documents the configured backend converts at the same time."""
+    return PROCESS_WORKERS if CONVERSION_BACKEND == "process" else CONVERTER_WORKERS
+
+
+def _get_process_backend(wait: bool = True) -> "ProcessPoolConverter":
+    """
+    Returns the process-pool backend, starting its workers if needed (and
+    unless wait is False, waiting until they have loaded their models).
+    """
+    global _process_backend
+    if _process_backend is None:
+        from .process_pool import ProcessPoolConverter
+
+        _process_backend = ProcessPoolConverter(wait=wait)
+    return _process_backend
+
+
+# --- Metrics ---
+ALLOWED_EXTENSIONS = {".pdf", ".docx", ".pptx", ".xlsx"}
+
+metrics = Registry()
+CONVERSION_SECONDS = metrics.register(
+    Histogram(
+        "docling_conversion_duration_seconds",
+        "Time spent converting an uploaded document.",
+        ["file_type"],
+    )
+)
+PAGES_PER_SECOND = metrics.register(
+    Histogram(
+        "docling_conversion_pages_per_second",
+        "Conversion throughput of PDF documents.",
+        ["file_type"],
+        buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100),
+    )
+)
+UPLOAD_BYTES = metrics.register(
+    Histogram(
+        "docling_upload_size_bytes",
+        "Size of the uploaded documents.",
+        ["file_type"],
+        buckets=tuple(2**n * 1024 for n in range(0, 16, 2)),
+    )
+)
+PEAK_RSS_BYTES = metrics.register(
+    Histogram(
+        "docling_conversion_peak_rss_bytes",
+        "Peak resident memory of the conversion processes during a conversion.",
+        ["file_type"],
+        buckets=tuple(2**n * 1024 * 1024 for n in range(7, 16)),
+    )
+)
+CONVERSIONS_IN_PROGRESS = metrics.register(
+    Gauge("docling_conversions_in_progress", "Conversions currently running.")
+)
+CONVERSIONS = metrics.register(
+    Counter(
+        "docling_conversions_total",
+        "Finished conversions by outcome (success or failure).",
+        ["file_type", "status"],
+    )
+)
+MEMORY_DEFERRED = metrics.register(
+    Counter(
+        "docling_memory_deferred_total",
+        "Conversions that waited because the memory budget was exceeded.",
+    )
+)
+MEMORY_REJECTED = metrics.register(
+    Counter(
+        "docling_memory_rejected_total",
+        "Conversions rejected because the memory budget stayed exceeded.",
+    )
+)
+ADMISSION_WAIT_SECONDS = metrics.register(
+    Histogram(
+        "docling_admission_wait_seconds",
+        "Time /convert/ requests waited for a slot.",
+        buckets=(0.01, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+    )
+)
+ERRORS = metrics.register(
+    Counter(
+        "docling_errors_total",
+        "Rejected or failed /convert/ and /jobs requests by HTTP status code.",
+        ["status_code"],
+    )
+)
+
+
+def _file_type(filename: str | None) -> str:
+    """Label value for a file name; unsupported extensions share one value."""
+    file_ext = Path(filename or "").suffix.lower()
+    return file_ext.lstrip(".") if file_ext in ALLOWED_EXTENSIONS else "other"
+
+
+def _counter(name: str, documentation: str, value: float):
+    return (name, "counter", documentation, [(name, {}, value)])
+
+
+def _gauge(name: str, documentation: str, value: float):
+    return (name, "gauge", documentation, [(name, {}, value)])
+
+
+def _collect_pool_metrics():
+    """
+    Reports the converter pool and cache counters of the thread backend.
+    Nothing is reported until the converter module has been loaded by a
+    conversion (the process backend keeps these counters in its workers).
+    """
+    converter = sys.modules.get("docling_lib.converter")
+    if converter is None:
+        return []
+
+    pool = converter._converter_pool.stats
+    families = [
+        _counter(
+            "docling_converter_builds_total",
+            "Converters built (models loaded), including rebuilds after eviction.",
+            pool.builds,
+        ),
+        _counter(
+            "docling_converter_evictions_total",
+            "Converters evicted from the pool.",
+            pool.evictions,
+        ),
+        _counter(
+            "docling_converter_checkouts_total",
+            "Converters checked out of the pool.",
+            pool.checkouts,
+        ),
+        _counter(
+            "docling_converter_wait_seconds_total",
+            "Time spent waiting for a free converter.",
+            pool.wait_seconds,
+        ),
+    ]
+    cache = converter._default_cache
+    if cache is not None:
+        families += [
+            _counter(
+                "docling_cache_hits_total",
+                "Conversions served from the cache.",
+                cache.stats.hits,
+            ),
+            _counter(
+                "docling_cache_misses_total",
+                "Conversions not found in the cache.",
+                cache.stats.misses,
+            ),
+            _counter(
+                "docling_cache_page_hits_total",
+                "Pages reused from the cache by incremental conversion.",
+                cache.stats.page_hits,
+            ),
+            _counter(
+                "docling_cache_page_misses_total",
+                "Pages converted by incremental conversion.",
+                cache.stats.page_misses,
+            ),
+            _counter(
+                "docling_cache_evictions_total",
+                "Cache entries evicted to stay within the size limit.",
+                cache.stats.evictions,
+            ),
+        ]
+    return families
+
+
+def _conversion_rss() -> int | None:
+    """
+    Resident memory of the processes running conversions: the server itself,
+    plus the workers of the process backend.
+    """
+    total = rss_bytes()
+    if total is None or _process_backend is None:
+        return total
+    return total + sum(rss_bytes(pid) or 0 for pid in _process_backend.worker_pids())
+
+
+_memory_budget = MemoryBudget(MEMORY_BUDGET_BYTES, measure=_conversion_rss)
+
+
+def _collect_memory_metrics():
+    usage = _conversion_rss()
+    families = []
+    if usage is not None:
+        families.append(
+            _gauge(
+                "docling_process_rss_bytes",
+                "Resident memory of the conversion processes.",
+                usage,
+            )
+        )
+    if _memory_budget.enabled:
+        families.append(
+            _gauge(
+                "docling_memory_budget_bytes",
+                "Memory budget above which new conversions are deferred.",
+                _memory_budget.limit_bytes,
+            )
+        )
+    return families
+
+
+def _collect_admission_metrics():
+    return [
+        _gauge(
+            "docling_admission_in_flight",
+            "/convert/ requests being served.",
+            _admission.in_flight,
+        ),
+        _gauge(
+            "docling_admission_queue_depth",
+            "/convert/ requests waiting for a slot.",
+            _admission.queue_depth,
+        ),
+        _counter(
+            "docling_admission_rejected_total",
+            "/convert/ requests rejected with 429 because the queue was full.",
+            _admission.rejected,
+        ),
+    ]
+
+
+def _collect_job_metrics():
+    if _jobs is None:
+        return []
+    samples = [
+        ("docling_jobs", {"status": status}, count)
+        for status, count in _jobs.counts().items()
+    ]
+    return [
+        ("docling_jobs", "gauge", "Remembered asynchronous jobs by status.", samples)
+    ]
+
+
+metrics.register_collector(_collect_pool_metrics)
+metrics.register_collector(_collect_memory_metrics)
+metrics.register_collector(_collect_job_metrics)
+metrics.register_collector(_collect_admission_metrics)
+
+
+@dataclass
+class _Readiness:
+    """Warm-up state reported by /ready."""
+
+    ready: bool = False
+    warmup_seconds: float | None = None
+    error: str | None = None
+
+
+_readiness = _Readiness()
+
+# Asynchronous job queue, running while the application is
+_jobs: JobManager | None = None
+
+# Admission control of /convert/
+_admission = AdmissionController(
+    MAX_IN_FLIGHT or _backend_workers(), MAX_QUEUED_REQUESTS
+)
+
+
+async def _warm_up(convert: bool = True) -> None:
+    """
+    Waits until every worker of the process backend has loaded its models,
+    then (if convert) converts a generated one-page PDF on the configured
+    backend, so that the converter is built and its models are loaded before
+    the first request.
+    """
+    start = time.perf_counter()
+    try:
+        if CONVERSION_BACKEND == "process":
+            # A single conversion only reaches one worker: wait for all of them
+            startup = _get_process_backend(wait=False).startup
+            await asyncio.gather(*map(asyncio.wrap_future, startup))
+        if convert:
+            await _convert_warm_up_document()
+        _readiness.warmup_seconds = time.perf_counter() - start
+        _readiness.ready = True
+        logger.info(f"Warm-up finished in {_readiness.warmup_seconds:.1f}s")
+    except Exception as e:
+        _readiness.error = str(e) or type(e).__name__
+        logger.error(f"Warm-up failed: {sanitize_log_message(e)}")
+
+
+async def _convert_warm_up_document() -> None:
+    token = os.urandom(4).hex()
+    input_path = UPLOAD_DIR / f"warmup-{token}.pdf"
+    output_dir = OUTPUT_DIR / f"warmup-{token}"
+    try:
+        from .pages import write_sample_pdf
+
+        await run_in_threadpool(
+            write_sample_pdf, input_path, "Docling warm-up document"
+        )
+        # The cache would skip the conversion, and with it the model loading
+        result_path = await _run_conversion(
+            input_path, output_dir, DocumentConversionOptions(use_cache=False)
+        )
+        if result_path is None:
+            raise RuntimeError("the warm-up conversion failed")
+    finally:
+        await _cleanup_temp_file(input_path)
+        await run_in_threadpool(shutil.rmtree, output_dir, ignore_errors=True)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    global _readiness, _jobs
+    _readiness = _Readiness()
+    if CONVERSION_BACKEND == "process":
+        # Start the workers and their model preloading; /ready waits for them
+        _get_process_backend(wait=False)
+
+    _jobs = JobManager(
+        _run_conversion_job,
+        JOB_WORKERS or _backend_workers(),
+        JOB_HISTORY_SIZE,
+        JOB_QUEUE_SIZE,
+    )
+    _jobs.start()
+
+    warmup_task = None
+    if WARMUP_ENABLED or CONVERSION_BACKEND == "process":
+        # Runs in the background: / answers at once, /ready once warmed up
+        warmup_task = asyncio.create_task(_warm_up(convert=WARMUP_ENABLED))
+    else:
+        _readiness.ready = True
+    yield
+    if warmup_task is not None:
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
+    for job in await _jobs.stop():
+        # Queued jobs never ran: drop their uploads and empty output dirs
+        await _cleanup_temp_file(job.input_path)
+        await run_in_threadpool(shutil.rmtree, job.output_dir, ignore_errors=True)
+    _jobs = None
+    if _process_backend is not None:
+        await run_in_threadpool(_process_backend.shutdown)
+
+
+app = FastAPI(title="Docling Markdown Conversion Server", lifespan=_lifespan)
 
 # Ensure directories exist
 UPLOAD_DIR.mkdir(exist_ok=True)
@@ -33,12 +421,11 @@ def _validate_content_length(content_length: int | None):
 
 def _validate_extension(filename: str) -> str:
     """Validate the file extension and return it if valid."""
-    allowed_extensions = {".pdf", ".docx", ".pptx", ".xlsx"}
     file_ext = Path(filename).suffix.lower()
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file format. Supported: {allowed_extensions}",
+            detail=f"Unsupported file format. Supported: {ALLOWED_EXTENSIONS}",
         )
     return file_ext
 
@@ -92,6 +479,122 @@ async def _create_output_dir() -> tuple[str, Path]:
     return request_id, request_output_dir
 
 
+def _conversion_options(text_only: bool) -> DocumentConversionOptions | None:
+    """Builds the options for a request, or None when the defaults apply."""
+    if text_only:
+        return DocumentConversionOptions(text_only=True)
+    return None
+
+
+async def _run_conversion(
+    input_path: Path,
+    output_dir: Path,
+    options: DocumentConversionOptions | None = None,
+    progress: ConversionProgress | None = None,
+) -> Path | None:
+    """
+    Runs process_pdf on the configured backend (thread or process pool).
+    With the thread backend, progress receives the pages as they are
+    converted; a process reports nothing until it has finished.
+    """
+    if CONVERSION_BACKEND == "process":
+        future = _get_process_backend().submit(input_path, output_dir, options)
+        return await asyncio.wrap_future(future)
+
+    # process_pdf is thread-safe because converters are checked out of a pool.
+    return await run_in_threadpool(
+        _process_with_progress,
+        input_path,
+        output_dir,
+        options,
+        progress or ConversionProgress(),
+    )
+
+
+def _process_with_progress(
+    input_path: Path,
+    output_dir: Path,
+    options: DocumentConversionOptions | None,
+    progress: ConversionProgress,
+) -> Path | None:
+    """Runs process_pdf, reporting the converted pages to progress."""
+    with collect_progress(progress):
+        if options is None:
+            return process_pdf(input_path, output_dir)
+        return process_pdf(input_path, output_dir, options=options)
+
+
+# Interval at which a deferred conversion checks the memory budget again
+_MEMORY_POLL_SECONDS = 0.5
+
+
+async def _wait_for_memory_budget() -> None:
+    """
+    Defers the conversion while the conversion processes use more memory than
+    the budget, so that a burst of large documents queues up instead of
+    getting the container OOM-killed. Raises 503 after MEMORY_BUDGET_WAIT.
+    """
+    if await run_in_threadpool(_memory_budget.has_headroom):
+        return
+
+    MEMORY_DEFERRED.inc()
+    logger.warning("Memory budget exceeded, deferring conversion")
+    deadline = time.monotonic() + MEMORY_BUDGET_WAIT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(_MEMORY_POLL_SECONDS)
+        if await run_in_threadpool(_memory_budget.has_headroom):
+            return
+
+    MEMORY_REJECTED.inc()
+    raise HTTPException(
+        status_code=503,
+        detail="The server is low on memory. Please retry later.",
+        headers={"Retry-After": str(max(1, round(MEMORY_BUDGET_WAIT)))},
+    )
+
+
+async def _measure_conversion(
+    input_path: Path,
+    output_dir: Path,
+    options: DocumentConversionOptions | None,
+    file_type: str,
+    progress: ConversionProgress | None = None,
+) -> Path | None:
+    """
+    Runs the conversion, recording its latency, throughput, peak memory and
+    outcome.
+    """
+    CONVERSIONS_IN_PROGRESS.inc()
+    start = time.perf_counter()
+    result_path = None
+    memory = PeakRssSampler(measure=_conversion_rss)
+    try:
+        with memory:
+            result_path = await _run_conversion(
+                input_path, output_dir, options, progress
+            )
+    finally:
+        elapsed = time.perf_counter() - start
+        CONVERSIONS_IN_PROGRESS.dec()
+        CONVERSION_SECONDS.observe(elapsed, file_type=file_type)
+        if memory.peak_bytes is not None:
+            PEAK_RSS_BYTES.observe(memory.peak_bytes, file_type=file_type)
+        status = "success" if result_path is not None else "failure"
+        CONVERSIONS.inc(file_type=file_type, status=status)
+
+    if result_path is not None and file_type == "pdf" and elapsed > 0:
+        try:
+            from .pages import count_pages
+
+            pages = await run_in_threadpool(count_pages, input_path)
+            PAGES_PER_SECOND.observe(pages / elapsed, file_type=file_type)
+        except Exception as e:
+            logger.warning(
+                f"Could not count pages for metrics: {sanitize_log_message(e)}"
+            )
+    return result_path
+
+
 async def _validate_and_format_response(
     result_path: Path | None, request_id: str
 ) -> dict[str, str]:
@@ -107,28 +610,193 @@ async def _validate_and_format_response(
     }
 
 
+# Archive formats of the whole output directory, with their media type and
+# streaming writer: /convert/?response_format={format} and
+# /download/{request_id}.{format} accept the same names
+_ARCHIVE_FORMATS = {
+    "zip": ("application/zip", iter_zip),
+    "tar": ("application/x-tar", iter_tar),
+    "tar.zst": ("application/zstd", iter_tar_zst),
+}
+# Response formats of /convert/: the JSON result with download links, the
+# Markdown itself, or an archive of the whole output directory
+RESPONSE_FORMATS = ("json", "markdown", *_ARCHIVE_FORMATS)
+
+
+def _validate_response_format(response_format: str) -> str:
+    """Validate the requested response format and return it normalized."""
+    response_format = response_format.lower()
+    if response_format not in RESPONSE_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported response format. Supported: {RESPONSE_FORMATS}",
+        )
+    _check_archive_support(response_format)
+    return response_format
+
+
+def _check_archive_support(archive_format: str) -> None:
+    """Raises 501 for tar.zst when the zstandard package is not installed."""
+    if archive_format == "tar.zst" and zstandard is None:
+        raise HTTPException(
+            status_code=501,
+            detail="zstd compression is not available on this server.",
+        )
+
+
+def _archive_response(
+    output_dir: Path, archive_format: str, filename: str
+) -> StreamingResponse:
+    """Streams output_dir as an archive, built while it is being sent."""
+    media_type, write_archive = _ARCHIVE_FORMATS[archive_format]
+    return StreamingResponse(
+        write_archive(output_dir),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Output-Id": output_dir.name,
+        },
+    )
+
+
+def _result_response(result: dict[str, str], response_format: str):
+    """Returns a conversion result in the requested response format."""
+    if response_format == "json":
+        return result
+
+    output_dir = OUTPUT_DIR / result["output_id"]
+    if response_format == "markdown":
+        return FileResponse(
+            output_dir / result["markdown_file"],
+            media_type="text/markdown; charset=utf-8",
+            headers={"X-Output-Id": result["output_id"]},
+        )
+    return _archive_response(
+        output_dir, response_format, f"{result['output_id']}.{response_format}"
+    )
+
+
+class _AdmissionSlot:
+    """A granted /convert/ slot. release() may be called more than once."""
+
+    def __init__(self, controller: AdmissionController):
+        self._controller = controller
+        self._start = time.perf_counter()
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._controller.release(time.perf_counter() - self._start)
+
+
+async def _acquire_admission_slot() -> _AdmissionSlot:
+    """Waits for one of the /convert/ slots, or raises 429 if the queue is full."""
+    try:
+        waited = await _admission.acquire()
+    except QueueFull as e:
+        logger.warning("Too many conversion requests, rejecting with 429")
+        raise _too_many_requests(
+            e, "Too many conversions in progress. Please retry later."
+        ) from e
+    ADMISSION_WAIT_SECONDS.observe(waited)
+    return _AdmissionSlot(_admission)
+
+
+@app.middleware("http")
+async def _admit_conversions(request: Request, call_next):
+    """
+    Takes a /convert/ slot before the endpoint runs. FastAPI reads the whole
+    multipart body before any endpoint code or dependency, so this is the
+    only place where a saturated server can reject an upload without
+    receiving it. The endpoint releases the slot once the conversion is done.
+    """
+    if request.method != "POST" or request.url.path != "/convert/":
+        return await call_next(request)
+    try:
+        slot = await _acquire_admission_slot()
+    except HTTPException as e:
+        ERRORS.inc(status_code=str(e.status_code))
+        return JSONResponse(
+            {"detail": e.detail}, status_code=e.status_code, headers=e.headers
+        )
+    request.state.admission_slot = slot
+    try:
+        return await call_next(request)
+    finally:
+        slot.release()
+
+
 @app.post("/convert/")
 async def convert_file(
-    file: UploadFile = File(...), content_length: int | None = Header(None)
+    request: Request,
+    file: UploadFile = File(...),
+    content_length: int | None = Header(None),
+    text_only: bool = False,
+    response_format: str = "json",
 ):
     """
     Endpoint to upload a document and convert it to Markdown.
     Includes validation for file size (via Content-Length header and read loop).
+    With text_only=true, no images are generated and pictures become placeholders.
+    With response_format=markdown the Markdown is returned in the response
+    body; with zip, tar or tar.zst, an archive of the Markdown and its images is
+    streamed, so that one request is enough.
+    When the server is saturated the request waits for a slot before its
+    body is read, or gets 429 with Retry-After if too many requests are
+    already waiting (see _admit_conversions).
+    """
+    try:
+        try:
+            response_format = _validate_response_format(response_format)
+            result = await _convert_upload(file, content_length, text_only)
+        finally:
+            request.state.admission_slot.release()
+    except HTTPException as e:
+        ERRORS.inc(status_code=str(e.status_code))
+        raise
+    return _result_response(result, response_format)
+
+
+async def _receive_upload(
+    file: UploadFile, content_length: int | None, wait_for_memory: bool = True
+) -> tuple[Path, str]:
+    """
+    Validates an upload and stores it in UPLOAD_DIR.
+    Returns the stored file and its file type label. With wait_for_memory,
+    the memory budget is checked before; jobs check it when they start.
     """
     _validate_content_length(content_length)
 
     file_ext = _validate_extension(file.filename)
+    file_type = _file_type(file.filename)
+    if wait_for_memory:
+        await _wait_for_memory_budget()
+    tmp_path = await _save_upload_temp(file, file_ext)
+    try:
+        upload_size = (await run_in_threadpool(tmp_path.stat)).st_size
+    except OSError:
+        await _cleanup_temp_file(tmp_path)
+        raise
+    UPLOAD_BYTES.observe(upload_size, file_type=file_type)
+    return tmp_path, file_type
+
+
+async def _convert_upload(
+    file: UploadFile, content_length: int | None, text_only: bool
+) -> dict[str, str]:
+    """Validates, stores and converts an upload (the body of /convert/)."""
     tmp_path = None
     try:
-        tmp_path = await _save_upload_temp(file, file_ext)
+        tmp_path, file_type = await _receive_upload(file, content_length)
         request_id, request_output_dir = await _create_output_dir()
 
         sanitized_filename = sanitize_log_message(file.filename)
         logger.info(f"Processing file: {sanitized_filename}")
 
-        # Use our process_pdf function wrapped in run_in_threadpool for concurrency.
-        # It's now thread-safe due to the internal lock in converter.py.
-        result_path = await run_in_threadpool(process_pdf, tmp_path, request_output_dir)
+        result_path = await _measure_conversion(
+            tmp_path, request_output_dir, _conversion_options(text_only), file_type
+        )
 
         return await _validate_and_format_response(result_path, request_id)
 
@@ -136,7 +804,9 @@ async def convert_file(
         # Re-raise already formed HTTP exceptions
         raise
     except Exception as e:
-        logger.exception(f"An error occurred during conversion: {sanitize_log_message(e)}")
+        logger.exception(
+            f"An error occurred during conversion: {sanitize_log_message(e)}"
+        )
         raise HTTPException(
             status_code=500, detail="An internal error occurred during conversion."
         ) from e
@@ -144,29 +814,197 @@ async def convert_file(
         await _cleanup_temp_file(tmp_path)
 
 
-@app.get("/download/{request_id}/{filename}")
-async def download_file(request_id: str, filename: str):
+async def _run_conversion_job(job: Job) -> dict[str, str]:
+    """Converts the upload of a job (run by the job workers)."""
+    try:
+        if job.file_type == "pdf":
+            await _plan_job_pages(job)
+        await _wait_for_memory_budget()
+        result_path = await _measure_conversion(
+            job.input_path, job.output_dir, job.options, job.file_type, job.progress
+        )
+        response = await _validate_and_format_response(result_path, job.id)
+        # Also covers cache hits and conversions in another process
+        job.progress.complete()
+        return response
+    except BaseException:
+        # A failed job has nothing to download: drop its output dir if empty
+        with suppress(OSError):
+            job.output_dir.rmdir()
+        raise
+    finally:
+        await _cleanup_temp_file(job.input_path)
+
+
+async def _plan_job_pages(job: Job) -> None:
+    """Counts the pages of a PDF job so that its progress has a total."""
+    from .pages import count_pages
+
+    try:
+        job.progress.plan(await run_in_threadpool(count_pages, job.input_path))
+    except Exception as e:
+        # The conversion reports unreadable PDFs
+        logger.warning(
+            f"Could not count pages of job {job.id}: {sanitize_log_message(e)}"
+        )
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(
+    file: UploadFile = File(...),
+    content_length: int | None = Header(None),
+    text_only: bool = False,
+):
     """
-    Endpoint to download converted files.
+    Endpoint to upload a document and queue its conversion. Returns at once
+    with a job ID; the conversion continues even if the client disconnects.
+    Poll GET /jobs/{job_id} for its status and result. When too many jobs
+    are queued, the upload is rejected with 429 and Retry-After.
+    """
+    try:
+        return await _submit_upload(file, content_length, text_only)
+    except HTTPException as e:
+        ERRORS.inc(status_code=str(e.status_code))
+        raise
+
+
+async def _submit_upload(
+    file: UploadFile, content_length: int | None, text_only: bool
+) -> dict[str, str]:
+    """Validates and stores an upload and queues it (the body of /jobs)."""
+    if _jobs is None:
+        raise HTTPException(status_code=503, detail="The job queue is not running.")
+    # Checked before storing the upload, and again when queuing it
+    if _jobs.full:
+        raise _job_queue_full(QueueFull("Job queue", _jobs.retry_after()))
+
+    tmp_path = None
+    try:
+        tmp_path, file_type = await _receive_upload(
+            file, content_length, wait_for_memory=False
+        )
+        # The job ID is also the output ID used by /download/
+        request_id, request_output_dir = await _create_output_dir()
+    except Exception as e:
+        await _cleanup_temp_file(tmp_path)
+        if isinstance(e, HTTPException):
+            raise
+        logger.exception(
+            f"An error occurred while queuing a job: {sanitize_log_message(e)}"
+        )
+        raise HTTPException(
+            status_code=500, detail="An internal error occurred while queuing the job."
+        ) from e
+
+    try:
+        job = _jobs.submit(
+            Job(
+                id=request_id,
+                filename=file.filename,
+                file_type=file_type,
+                input_path=tmp_path,
+                output_dir=request_output_dir,
+                options=_conversion_options(text_only),
+            )
+        )
+    except QueueFull as e:
+        await _cleanup_temp_file(tmp_path)
+        await run_in_threadpool(shutil.rmtree, request_output_dir, ignore_errors=True)
+        raise _job_queue_full(e) from e
+    logger.info(f"Queued job {job.id} for file: {sanitize_log_message(file.filename)}")
+    return {"job_id": job.id, "status": job.status, "status_url": f"/jobs/{job.id}"}
+
+
+def _job_queue_full(e: QueueFull) -> HTTPException:
+    logger.warning("Job queue full, rejecting with 429")
+    return _too_many_requests(e, "Too many jobs are queued. Please retry later.")
+
+
+def _too_many_requests(e: QueueFull, detail: str) -> HTTPException:
+    """The 429 response to a full queue, with its Retry-After estimate."""
+    return HTTPException(
+        status_code=429, detail=detail, headers={"Retry-After": str(e.retry_after)}
+    )
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Endpoint to poll a job: its status (queued, running, succeeded, failed),
+    progress, timings and, once succeeded, the same result as /convert/.
     """
+    job = _jobs.get(job_id) if _jobs is not None else None
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return _jobs.describe(job)
 
-    def _get_safe_path():
-        # Security: Prevent path traversal
-        # Resolve to absolute paths and verify anchoring to OUTPUT_DIR
-        resolved_output_dir = OUTPUT_DIR.resolve()
-        safe_dir = (resolved_output_dir / request_id).resolve()
-        file_path = (safe_dir / filename).resolve()
-        return resolved_output_dir, safe_dir, file_path
+
+@app.get("/download/{archive_name}")
+async def download_bundle(archive_name: str):
+    """
+    Endpoint to download the whole output of a conversion as
+    {request_id}.zip, .tar or .tar.zst, streamed while it is built.
+    """
+    archive_format = next(
+        (name for name in _ARCHIVE_FORMATS if archive_name.endswith(f".{name}")),
+        None,
+    )
+    if archive_format is None:
+        raise HTTPException(status_code=404, detail="File not found.")
+    request_id = archive_name.removesuffix(f".{archive_format}")
+    _check_archive_support(archive_format)
 
     try:
-        resolved_output_dir, safe_dir, file_path = await run_in_threadpool(
-            _get_safe_path
+        safe_dir = await run_in_threadpool(_anchor_in_output_dir, request_id)
+        if safe_dir is None:
+            logger.warning(
+                f"Unauthorized download attempt: {sanitize_log_message(archive_name)}"
+            )
+            raise HTTPException(status_code=404, detail="File not found.")
+
+        if not await run_in_threadpool(safe_dir.is_dir):
+            raise HTTPException(status_code=404, detail="File not found.")
+
+        return _archive_response(safe_dir, archive_format, archive_name)
+    except (OSError, ValueError, HTTPException) as e:
+        if isinstance(e, HTTPException):
+            raise e
+        logger.error(
+            f"Error during bundle download path resolution: {sanitize_log_message(e)}"
         )
+        raise HTTPException(
+            status_code=400, detail="Invalid request parameters."
+        ) from e
+
+
+def _anchor_in_output_dir(request_id: str, filename: str | None = None) -> Path | None:
+    """
+    Security: prevents path traversal. Resolves the request directory
+    OUTPUT_DIR/request_id (or filename inside it) to an absolute path, or
+    returns None unless the directory is strictly inside OUTPUT_DIR and the
+    file inside the directory.
+    """
+    resolved_output_dir = OUTPUT_DIR.resolve()
+    safe_dir = (resolved_output_dir / request_id).resolve()
+    if safe_dir == resolved_output_dir or not safe_dir.is_relative_to(
+        resolved_output_dir
+    ):
+        return None
+    if filename is None:
+        return safe_dir
+    file_path = (safe_dir / filename).resolve()
+    return file_path if file_path.is_relative_to(safe_dir) else None
+
 
-        # Check if the file is within its assigned request directory and OUTPUT_DIR
-        in_output = file_path.is_relative_to(resolved_output_dir)
-        in_safe = file_path.is_relative_to(safe_dir)
-        if not in_output or not in_safe:
+@app.get("/download/{request_id}/{filename}")
+async def download_file(request_id: str, filename: str):
+    """
+    Endpoint to download converted files.
+    """
+
+    try:
+        file_path = await run_in_threadpool(_anchor_in_output_dir, request_id, filename)
+        if file_path is None:
             logger.warning(
                 f"Unauthorized download attempt: "
                 f"{sanitize_log_message(request_id)}/{sanitize_log_message(filename)}"
@@ -193,3 +1031,25 @@ async def download_file(request_id: str, filename: str):
 @app.get("/")
 async def root():
     return {"message": "Welcome to the Docling Markdown Conversion Server"}
+
+
+@app.get("/ready")
+async def ready():
+    """
+    Readiness probe: 200 once every worker of the process backend has loaded
+    its models and the startup warm-up conversion has finished, 503 while
+    they are running or if one of them failed.
+    """
+    if _readiness.ready:
+        return {"status": "ready", "warmup_seconds": _readiness.warmup_seconds}
+    if _readiness.error is not None:
+        return JSONResponse(
+            status_code=503, content={"status": "failed", "error": _readiness.error}
+        )
+    return JSONResponse(status_code=503, content={"status": "warming_up"})
+
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Conversion metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,571 @@
+import heapq
+import html
+import logging
+import posixpath
+import re
+import tempfile
+import zipfile
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import IO, Any, NamedTuple
+
+from docling_core.transforms.serializer.markdown import (
+    MarkdownDocSerializer,
+    MarkdownTextSerializer,
+)
+from docling_core.types.doc.utils import get_text_direction
+from openpyxl import load_workbook
+from openpyxl.utils.cell import range_boundaries
+
+logger = logging.getLogger(__name__)
+
+_MERGE_CELL_RE = re.compile(
+    rb'<(?:\w+:)?mergeCell\s[^>]*?ref="([A-Z]+[0-9]+:[A-Z]+[0-9]+)"'
+)
+_SHEET_RE = re.compile(rb"<(?:\w+:)?sheet\s[^>]*>")
+_RELATIONSHIP_RE = re.compile(rb"<(?:\w+:)?Relationship\s[^>]*>")
+_ATTRIBUTE_RE = re.compile(rb'([\w:]+)="([^"]*)"')
+_SCAN_CHUNK_SIZE = 1024 * 1024
+_SCAN_OVERLAP = 256
+# Tables up to this size are buffered in memory, larger ones on disk
+_SPOOL_MAX_BYTES = 1024 * 1024
+# Writes section labels the way Docling writes text items
+_TEXT_SERIALIZER = MarkdownTextSerializer()
+
+
+@dataclass(frozen=True)
+class _MergedRange:
+    """A merged cell range (0-based, inclusive)."""
+
+    min_row: int
+    min_col: int
+    max_row: int
+    max_col: int
+
+    @property
+    def row_span(self) -> int:
+        return self.max_row - self.min_row + 1
+
+    @property
+    def col_span(self) -> int:
+        return self.max_col - self.min_col + 1
+
+    def starts_at(self, row: int, col: int) -> bool:
+        return (self.min_row, self.min_col) == (row, col)
+
+
+def _attributes(element: bytes) -> dict[str, str]:
+    """Attributes of an XML start tag, by local name."""
+    return {
+        name.decode("ascii").rpartition(":")[2]: html.unescape(value.decode("utf-8"))
+        for name, value in _ATTRIBUTE_RE.findall(element)
+    }
+
+
+def _relationships(archive: zipfile.ZipFile, part: str) -> list[dict[str, str]]:
+    """
+    Reads the relationships of a package part ("" for the package itself),
+    with targets resolved to paths in the archive.
+    """
+    directory, name = posixpath.split(part)
+    try:
+        data = archive.read(posixpath.join(directory, "_rels", f"{name}.rels"))
+    except KeyError:
+        return []
+    relationships = []
+    for element in _RELATIONSHIP_RE.findall(data):
+        attributes = _attributes(element)
+        target = attributes.get("Target", "")
+        attributes["Target"] = (
+            target.lstrip("/")
+            if target.startswith("/")
+            else posixpath.normpath(posixpath.join(directory, target))
+        )
+        relationships.append(attributes)
+    return relationships
+
+
+def _worksheet_parts(archive: zipfile.ZipFile) -> dict[str, str]:
+    """
+    Maps sheet names to the XML parts holding the sheets, following the
+    package relationships (the OOXML layout, not openpyxl internals).
+    """
+    workbook_part = next(
+        (
+            rel["Target"]
+            for rel in _relationships(archive, "")
+            if rel.get("Type", "").endswith("/officeDocument")
+        ),
+        "xl/workbook.xml",
+    )
+    targets = {
+        rel.get("Id"): rel["Target"]
+        for rel in _relationships(archive, workbook_part)
+        if rel.get("Type", "").endswith("/worksheet")
+    }
+    parts = {}
+    for element in _SHEET_RE.findall(archive.read(workbook_part)):
+        attributes = _attributes(element)
+        if target := targets.get(attributes.get("id")):
+            parts[attributes.get("name", "")] = target
+    return parts
+
+
+def _read_merged_ranges(
+    archive: zipfile.ZipFile, part: str | None
+) -> list[_MergedRange]:
+    """
+    Reads the merged ranges of a sheet. Read-only worksheets do not expose
+    them, so the sheet XML is scanned for <mergeCell> elements chunk by
+    chunk (much faster than parsing every row a second time).
+    """
+    if part is None:
+        return []
+
+    ranges = []
+    tail = b""
+    with archive.open(part) as src:
+        while chunk := src.read(_SCAN_CHUNK_SIZE):
+            data = tail + chunk
+            end = 0
+            for match in _MERGE_CELL_RE.finditer(data):
+                min_col, min_row, max_col, max_row = range_boundaries(
+                    match.group(1).decode("ascii")
+                )
+                ranges.append(
+                    _MergedRange(min_row - 1, min_col - 1, max_row - 1, max_col - 1)
+                )
+                end = match.end()
+            # Keep enough bytes to match an element split across chunks
+            tail = data[max(end, len(data) - _SCAN_OVERLAP) :]
+    return ranges
+
+
+@dataclass
+class _MergedRow:
+    """The merged cells of one row."""
+
+    # Spans (rows, columns) of the merged ranges starting in the row
+    anchors: dict[int, tuple[int, int]] = field(default_factory=dict)
+    # Anchors (row, column) of the ranges covering the other merged cells
+    shadows: dict[int, tuple[int, int]] = field(default_factory=dict)
+
+
+class _MergeIndex:
+    """Answers merged-range lookups for rows visited in ascending order."""
+
+    def __init__(self, ranges: list[_MergedRange]):
+        self._pending = sorted(ranges, key=lambda r: r.min_row, reverse=True)
+        self._active: list[_MergedRange] = []
+
+    def row(self, row: int) -> _MergedRow:
+        """The merged cells of row, making the ranges overlapping it active."""
+        self._active = [r for r in self._active if r.max_row >= row]
+        while self._pending and self._pending[-1].min_row <= row:
+            merged = self._pending.pop()
+            if merged.max_row >= row:
+                self._active.append(merged)
+
+        cells = _MergedRow()
+        for merged in self._active:
+            for col in range(merged.min_col, merged.max_col + 1):
+                if merged.starts_at(row, col):
+                    cells.anchors.setdefault(col, (merged.row_span, merged.col_span))
+                else:
+                    cells.shadows.setdefault(col, (merged.min_row, merged.min_col))
+        return cells
+
+
+def _filled_runs(values: Sequence[Any], merged: _MergedRow) -> list[list[int]]:
+    """The runs [first, last] of columns holding a value or a merged cell."""
+    cols = {col for col, value in enumerate(values) if value is not None}
+    cols.update(merged.anchors)
+    cols.update(merged.shadows)
+    runs: list[list[int]] = []
+    for col in sorted(cols):
+        if runs and runs[-1][1] == col - 1:
+            runs[-1][1] = col
+        else:
+            runs.append([col, col])
+    return runs
+
+
+@dataclass(frozen=True)
+class _Region:
+    """The bounding rectangle of a region of filled cells (0-based, inclusive)."""
+
+    top: int
+    left: int
+    bottom: int
+    right: int
+
+    @property
+    def num_rows(self) -> int:
+        return self.bottom - self.top + 1
+
+    @property
+    def num_cols(self) -> int:
+        return self.right - self.left + 1
+
+
+class _RegionLabels:
+    """
+    Labels the regions of filled cells connected through their edges (the
+    cells Docling's flood fill reaches) row by row: every run of filled cells
+    joins the regions of the runs it touches in the row above. Labelling the
+    same rows again hands out the same labels.
+    """
+
+    def __init__(self):
+        self._parent: list[int] = []
+        # Bounds [top, left, bottom, right] of the regions, by root label
+        self._bounds: list[list[int]] = []
+        self._previous: list[tuple[int, int, int]] = []
+
+    def _find(self, label: int) -> int:
+        while self._parent[label] != label:
+            self._parent[label] = self._parent[self._parent[label]]
+            label = self._parent[label]
+        return label
+
+    def _union(self, a: int, b: int) -> int:
+        a, b = sorted((self._find(a), self._find(b)))
+        if a != b:
+            self._parent[b] = a
+            bounds, other = self._bounds[a], self._bounds[b]
+            bounds[0] = min(bounds[0], other[0])
+            bounds[1] = min(bounds[1], other[1])
+            bounds[2] = max(bounds[2], other[2])
+            bounds[3] = max(bounds[3], other[3])
+        return a
+
+    def label_row(self, row: int, runs: list[list[int]]) -> list[tuple[int, int, int]]:
+        """Labels the runs of a row; returns them as (first, last, label)."""
+        labelled = []
+        above = self._previous
+        i = 0
+        for first, last in runs:
+            while i < len(above) and above[i][1] < first:
+                i += 1
+            label = None
+            j = i
+            while j < len(above) and above[j][0] <= last:
+                label = (
+                    above[j][2] if label is None else self._union(label, above[j][2])
+                )
+                j += 1
+            if label is None:
+                label = len(self._parent)
+                self._parent.append(label)
+                self._bounds.append([row, first, row, last])
+            else:
+                label = self._find(label)
+                bounds = self._bounds[label]
+                bounds[1] = min(bounds[1], first)
+                bounds[2] = row
+                bounds[3] = max(bounds[3], last)
+            labelled.append((first, last, label))
+        self._previous = labelled
+        return labelled
+
+    def regions(self) -> tuple[list[int], dict[int, _Region]]:
+        """The region of every label handed out, and the regions by root."""
+        roots = [self._find(label) for label in range(len(self._parent))]
+        return roots, {root: _Region(*self._bounds[root]) for root in set(roots)}
+
+
+class _Cell(NamedTuple):
+    text: str
+    row_span: int = 1
+    col_span: int = 1
+    # Anchor (row, column) of the merged range covering a non-anchor cell
+    anchor: tuple[int, int] | None = None
+
+
+def _row_cells(
+    values: Sequence[Any], merged: _MergedRow, region: _Region
+) -> list[_Cell]:
+    cells = []
+    for col in range(region.left, region.right + 1):
+        if (anchor := merged.shadows.get(col)) is not None:
+            cells.append(_Cell("", anchor=anchor))
+            continue
+        value = values[col] if col < len(values) else None
+        row_span, col_span = merged.anchors.get(col, (1, 1))
+        cells.append(_Cell("" if value is None else str(value), row_span, col_span))
+    return cells
+
+
+def _section_label(first_rows: list[list[_Cell]], num_cols: int) -> str | None:
+    """
+    The text of a merged label above a row of column headers, which Docling
+    turns into a text before the table (its first row being dropped).
+    """
+    if len(first_rows) < 2 or num_cols < 2:
+        return None
+    first, second = first_rows
+    texts = [
+        (col, cell)
+        for col, cell in enumerate(first)
+        if cell.anchor is None and cell.text.strip()
+    ]
+    if len(texts) != 1:
+        return None
+    col, label = texts[0]
+    if col != 0 or label.row_span != 1 or not 1 < label.col_span <= num_cols:
+        return None
+    headers = [
+        cell
+        for cell in second
+        if cell.anchor is None and cell.text.strip() and cell.col_span == 1
+    ]
+    return label.text if len(headers) >= 2 else None
+
+
+def _text_markdown(text: str) -> str:
+    """A text item the way Docling's Markdown serializer writes it."""
+    text = _TEXT_SERIALIZER._md_line_breaks(text)
+    return html.escape(MarkdownDocSerializer._escape_underscores(text), quote=False)
+
+
+class _Table:
+    """
+    The bounding rectangle of a region, streamed row by row into its own
+    spool file. Whether the region starts a table is only known once one of
+    its value cells has been scanned outside the earlier tables.
+    """
+
+    def __init__(self, region: _Region, table_format: str):
+        self.region = region
+        self.html = table_format.lower() == "html"
+        self.spool: IO[str] = tempfile.SpooledTemporaryFile(
+            max_size=_SPOOL_MAX_BYTES, mode="w+", encoding="utf-8"
+        )
+        # Position in the scan order of the tables, once the region is one
+        self.seq: int | None = None
+        self.label: str | None = None
+        self.top = region.top  # First row of the table (below its label)
+        self.decided = False  # Whether the label has been looked for
+        self.finished = False
+        self._rows = 0
+        self._first_rows: list[list[_Cell]] = []
+        # Texts of merged cells, repeated into covered cells in Markdown tables
+        self._merged_texts: dict[tuple[int, int], str] = {}
+
+    def add_row(self, row: int, values: Sequence[Any], merged: _MergedRow) -> None:
+        cells = _row_cells(values, merged, self.region)
+        if self.decided:
+            self._write_row(row, cells)
+            return
+
+        self._first_rows.append(cells)
+        if len(self._first_rows) < min(2, self.region.num_rows):
+            return
+        self.label = _section_label(self._first_rows, self.region.num_cols)
+        if self.label is not None:
+            del self._first_rows[0]
+            self.top += 1
+        self.decided = True
+        for i, cells in enumerate(
+            self._first_rows, start=row - len(self._first_rows) + 1
+        ):
+            self._write_row(i, cells)
+        self._first_rows = []
+
+    def _shows(self, anchor: tuple[int, int]) -> bool:
+        row, col = anchor
+        return row >= self.top and self.region.left <= col <= self.region.right
+
+    def _write_row(self, row: int, cells: list[_Cell]) -> None:
+        if self.html:
+            self._write_html_row(cells)
+        else:
+            self._write_markdown_row(row, cells)
+        self._rows += 1
+
+    def _write_html_row(self, cells: list[_Cell]) -> None:
+        # The first row is the column header, as in Docling's Excel backend
+        tag = "th" if self._rows == 0 else "td"
+        parts = ["<tr>"]
+        for cell in cells:
+            if cell.anchor is not None:
+                if not self._shows(cell.anchor):
+                    parts.append("<td></td>")  # The merged cell starts elsewhere
+                continue  # Covered by the anchor's row/col span
+            content = html.escape(cell.text.strip())
+            attrs = ""
+            if cell.row_span > 1:
+                attrs += f' rowspan="{cell.row_span}"'
+            if cell.col_span > 1:
+                attrs += f' colspan="{cell.col_span}"'
+            # ASCII has no right-to-left characters; checking it char by char
+            # would dominate the time of text-heavy sheets
+            if not content.isascii() and get_text_direction(content) == "rtl":
+                attrs += ' dir="rtl"'
+            parts.append(f"<{tag}{attrs}>{content}</{tag}>")
+        parts.append("</tr>")
+        self.spool.write("".join(parts))
+
+    def _write_markdown_row(self, row: int, cells: list[_Cell]) -> None:
+        texts = []
+        for col, cell in enumerate(cells, start=self.region.left):
+            if cell.anchor is not None:
+                text = self._merged_texts.get(cell.anchor, "")
+            else:
+                text = cell.text.strip()
+                if cell.row_span > 1 or cell.col_span > 1:
+                    self._merged_texts[(row, col)] = text
+            texts.append(text.replace("\n", " ").replace("|", "\\|"))
+        if self._rows:
+            self.spool.write("\n")
+        self.spool.write("| " + " | ".join(texts) + " |")
+        if self._rows == 0:
+            self.spool.write("\n|" + "|".join("---" for _ in texts) + "|")
+
+    def write_to(self, out: IO[str]) -> None:
+        """Copies the finished table into out and releases the spool."""
+        if self.html:
+            out.write("<table><tbody>")
+        self.spool.seek(0)
+        while chunk := self.spool.read(_SPOOL_MAX_BYTES):
+            out.write(chunk)
+        if self.html:
+            out.write("</tbody></table>")
+        self.spool.close()
+
+
+class _TableWriter:
+    """
+    Finds the tables of a sheet the way Docling's Excel backend does. Cells
+    are scanned row by row; a value cell outside the earlier tables starts a
+    table spanning the bounding rectangle of the region of filled (valued or
+    merged) cells it is connected to. The texts and tables of a sheet are
+    then ordered by their top row.
+
+    Each sheet is read twice: the first pass labels its regions and their
+    bounds, the second streams the rows of the regions into tables.
+    """
+
+    def __init__(self, out: IO[str], table_format: str):
+        self.out = out
+        self.table_format = table_format
+        self.tables_written = 0
+        self._items_written = 0
+
+    def write_sheet(
+        self,
+        read_rows: Callable[[], Iterable[Sequence[Any]]],
+        ranges: list[_MergedRange],
+    ) -> None:
+        labels = _RegionLabels()
+        merges = _MergeIndex(ranges)
+        for row, values in enumerate(read_rows()):
+            labels.label_row(row, _filled_runs(values, merges.row(row)))
+        roots, regions = labels.regions()
+
+        labels = _RegionLabels()
+        merges = _MergeIndex(ranges)
+        open_tables: dict[int, _Table] = {}  # By region, while rows cross them
+        undecided: list[_Table] = []
+        # Items (top row, scan order, part, item), Docling's order in a sheet
+        items: list[tuple[int, int, int, Any]] = []
+        seq = 0
+        for row, values in enumerate(read_rows()):
+            merged = merges.row(row)
+            for first, last, label in labels.label_row(
+                row, _filled_runs(values, merged)
+            ):
+                root = roots[label]
+                if (table := open_tables.get(root)) is None:
+                    table = open_tables[root] = _Table(regions[root], self.table_format)
+                if table.seq is None and self._starts_table(
+                    values[first : last + 1], first, merged, open_tables
+                ):
+                    table.seq = seq
+                    seq += 1
+                    undecided.append(table)
+
+            for root, table in list(open_tables.items()):
+                table.add_row(row, values, merged)
+                if table.region.bottom == row:
+                    del open_tables[root]
+                    table.finished = True
+                    if table.seq is None:
+                        table.spool.close()  # Inside earlier tables
+
+            for table in [table for table in undecided if table.decided]:
+                undecided.remove(table)
+                if table.label is not None:
+                    heapq.heappush(items, (table.region.top, table.seq, 0, table.label))
+                heapq.heappush(items, (table.top, table.seq, 1, table))
+
+            # Regions still to be decided on may yield items from their top row
+            pending = [t.region.top for t in open_tables.values() if not t.decided]
+            self._flush(items, min(pending, default=row + 1))
+        self._flush(items, None)
+
+    @staticmethod
+    def _starts_table(
+        values: Sequence[Any],
+        offset: int,
+        merged: _MergedRow,
+        open_tables: dict[int, _Table],
+    ) -> bool:
+        """Whether a value cell of the run is outside the earlier tables."""
+        for col, value in enumerate(values, start=offset):
+            if value is None or col in merged.shadows:
+                continue
+            if not any(
+                table.seq is not None and table.region.left <= col <= table.region.right
+                for table in open_tables.values()
+            ):
+                return True
+        return False
+
+    def _flush(self, items: list, before: int | None) -> None:
+        """Writes finished items at the front of the order, above row before."""
+        while items and (before is None or items[0][0] < before):
+            item = items[0][3]
+            if isinstance(item, _Table) and not item.finished:
+                break
+            heapq.heappop(items)
+            if self._items_written:
+                self.out.write("\n\n")
+            if isinstance(item, _Table):
+                item.write_to(self.out)
+                self.tables_written += 1
+            else:
+                self.out.write(_text_markdown(item))
+            self._items_written += 1
+
+
+def write_spreadsheet_markdown(
+    input_path: Path, out: IO[str], table_format: str
+) -> int:
+    """
+    Streams every visible sheet of an XLSX workbook into out as HTML or
+    Markdown tables, row by row. The workbook is opened in read-only mode, so
+    memory stays bounded by the width of the sheets rather than their length.
+    Returns the number of tables written.
+    """
+    workbook = load_workbook(filename=input_path, read_only=True, data_only=True)
+    writer = _TableWriter(out, table_format)
+    try:
+        with zipfile.ZipFile(input_path) as archive:
+            parts = _worksheet_parts(archive)
+            for worksheet in workbook.worksheets:
+                if worksheet.sheet_state != "visible":
+                    continue  # Docling leaves hidden sheets out of the Markdown
+                ranges = _read_merged_ranges(archive, parts.get(worksheet.title))
+                read_rows = partial(worksheet.iter_rows, values_only=True)
+                writer.write_sheet(read_rows, ranges)
+    finally:
+        workbook.close()
+
+    logger.info(
+        f"Streamed {writer.tables_written} tables from "
+        f"{len(workbook.sheetnames)} sheets"
+    )
+    return writer.tables_written
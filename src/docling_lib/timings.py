@@ -0,0 +1,82 @@
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Collector of the conversion running in the current context (thread or task)
+_current: ContextVar["StageTimings | None"] = ContextVar("stage_timings", default=None)
+
+
+class StageTimings:
+    """
+    Wall time spent in the named stages of one conversion, in seconds.
+
+    A stage that runs several times (once per page segment, once per Markdown
+    chunk) accumulates. Segments converted in parallel therefore add up to
+    more than the elapsed time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._stages[name] = self._stages.get(name, 0.0) + seconds
+
+    def add_docling(self, profiling: dict[str, Any]) -> None:
+        """
+        Adds Docling's own pipeline timings (layout, ocr, table_structure, ...)
+        as "docling.<stage>" entries.
+        """
+        for name, item in profiling.items():
+            self.add(f"docling.{name}", sum(item.times))
+
+    def as_dict(self) -> dict[str, float]:
+        """Returns the stages in the order they first ran, rounded to 0.1 ms."""
+        with self._lock:
+            return {name: round(seconds, 4) for name, seconds in self._stages.items()}
+
+
+def current_timings() -> StageTimings | None:
+    """Returns the collector of the current conversion, if any."""
+    return _current.get()
+
+
+@contextmanager
+def collect_timings(timings: StageTimings | None = None) -> Iterator[StageTimings]:
+    """Makes timings (or a new collector) receive the stages of this context."""
+    timings = timings or StageTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Times the block as stage name of the current conversion."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _current.get()
+        if timings is not None:
+            timings.add(name, time.perf_counter() - start)
+
+
+def timed_iter(iterable: Iterable[T], name: str) -> Iterator[T]:
+    """Yields from iterable, timing the production of every item as stage name."""
+    iterator = iter(iterable)
+    while True:
+        with stage(name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 import pytest
@@ -6,6 +7,39 @@ import requests
 TEST_DATA_DIR = Path(__file__).parent / "test_data"
 
 
+def _clear_converter_pool():
+    # The converter module (and Docling) is only loaded by tests that use it
+    converter = sys.modules.get("docling_lib.converter")
+    if converter is not None:
+        converter._converter_pool.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_converter_pool():
+    """Empties the shared converter pool before and after each test."""
+    _clear_converter_pool()
+    yield
+    _clear_converter_pool()
+
+
+@pytest.fixture
+def server_dirs(tmp_path, monkeypatch):
+    """
+    Points the server at empty upload and output directories below tmp_path,
+    which is also made the working directory, and returns both.
+    """
+    import docling_lib.server
+
+    upload_dir = tmp_path / "uploads"
+    output_dir = tmp_path / "output"
+    upload_dir.mkdir()
+    output_dir.mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(docling_lib.server, "UPLOAD_DIR", upload_dir)
+    monkeypatch.setattr(docling_lib.server, "OUTPUT_DIR", output_dir)
+    return upload_dir, output_dir
+
+
 @pytest.fixture(scope="session")
 def file_downloader():
     """
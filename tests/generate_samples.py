@@ -0,0 +1,427 @@
+"""
+Generates synthetic PDF, DOCX, PPTX and XLSX documents for scale testing,
+without network access (unlike download_samples.py).
+
+Every document has a set number of pages (slides for PPTX, sheets for XLSX),
+a table density (tables per page) and a total number of images and formulas
+spread evenly over the pages. The content is derived from --seed only, so the
+same arguments always produce the same documents.
+
+Usage:
+    python tests/generate_samples.py --format pdf --format docx \
+        --pages 10 100 1000 [--tables-per-page 0.5] [--images 20] \
+        [--formulas 10] [--seed 0] [--out tests/data/synthetic]
+"""
+
+import argparse
+import ctypes
+import datetime
+import io
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+FORMATS = ("pdf", "docx", "pptx", "xlsx")
+DEFAULT_OUTPUT_DIR = Path("tests/data/synthetic")
+
+# Fixed document metadata, so that regenerated files only differ if the content does
+_CREATED = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+_WORDS = (
+    "document conversion layout table figure formula page section model "
+    "pipeline markdown analysis result sample value report revision "
+    "structure content index metric baseline throughput latency memory"
+).split()
+_FORMULAS = (
+    "E = m c^2",
+    "a^2 + b^2 = c^2",
+    "x = (-b ± sqrt(b^2 - 4ac)) / 2a",
+    "f(x) = sum_(n=0)^∞ x^n / n!",
+    "∫_0^1 x^2 dx = 1/3",
+)
+_TABLE_ROWS = 5
+_TABLE_COLS = 4
+_PARAGRAPHS_PER_PAGE = 3
+_WORDS_PER_PARAGRAPH = 60
+
+
+@dataclass(frozen=True)
+class SampleSpec:
+    """Shape of a synthetic document."""
+
+    format: str = "pdf"  # One of FORMATS
+    pages: int = 10  # Pages (PDF, DOCX), slides (PPTX) or sheets (XLSX)
+    tables_per_page: float = 0.5
+    images: int = 0  # In the whole document
+    formulas: int = 0  # In the whole document
+    seed: int = 0
+
+    @property
+    def file_name(self) -> str:
+        return (
+            f"synthetic_{self.pages}p_{self.tables_per_page:g}t_"
+            f"{self.images}i_{self.formulas}f.{self.format}"
+        )
+
+
+@dataclass
+class _Page:
+    """What one page contains."""
+
+    tables: int = 0
+    images: int = 0
+    formulas: int = 0
+
+
+def _spread(count: int, pages: int) -> list[int]:
+    """Distributes count items as evenly as possible over pages."""
+    return [
+        (index + 1) * count // pages - index * count // pages for index in range(pages)
+    ]
+
+
+def plan_pages(spec: SampleSpec) -> list[_Page]:
+    """Returns the content of every page of spec."""
+    tables = _spread(round(spec.pages * spec.tables_per_page), spec.pages)
+    images = _spread(spec.images, spec.pages)
+    formulas = _spread(spec.formulas, spec.pages)
+    return [_Page(*counts) for counts in zip(tables, images, formulas, strict=True)]
+
+
+class _Content:
+    """Deterministic text, tables and pictures derived from a seed."""
+
+    def __init__(self, seed: int):
+        self._rng = random.Random(seed)
+        self._formulas = 0
+
+    def sentence(self, words: int) -> str:
+        text = " ".join(self._rng.choice(_WORDS) for _ in range(words))
+        return text.capitalize() + "."
+
+    def paragraph(self) -> str:
+        return " ".join(self.sentence(12) for _ in range(_WORDS_PER_PARAGRAPH // 12))
+
+    def table(self) -> list[list[str]]:
+        header = [f"Column {col + 1}" for col in range(_TABLE_COLS)]
+        rows = [
+            [self._rng.choice(_WORDS)]
+            + [str(self._rng.randint(0, 9999)) for _ in range(_TABLE_COLS - 1)]
+            for _ in range(_TABLE_ROWS - 1)
+        ]
+        return [header, *rows]
+
+    def formula(self) -> str:
+        formula = _FORMULAS[self._formulas % len(_FORMULAS)]
+        self._formulas += 1
+        return formula
+
+    def png(self, width: int = 240, height: int = 160) -> bytes:
+        image = Image.new("RGB", (width, height), "white")
+        draw = ImageDraw.Draw(image)
+        for _ in range(6):
+            x0, y0 = self._rng.randrange(width), self._rng.randrange(height)
+            x1, y1 = x0 + self._rng.randrange(20, 120), y0 + self._rng.randrange(20, 80)
+            color = tuple(self._rng.randrange(256) for _ in range(3))
+            if self._rng.random() < 0.5:
+                draw.rectangle((x0, y0, x1, y1), fill=color)
+            else:
+                draw.ellipse((x0, y0, x1, y1), fill=color)
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+
+# --- PDF ---
+
+_PDF_WIDTH, _PDF_HEIGHT, _PDF_MARGIN = 595, 842, 56  # A4 in points
+_PDF_LINE = 14
+_PDF_CHARS_PER_LINE = 90
+_PDF_CHUNK_PAGES = 50
+
+
+def _pdf_text(pdf, font, page, text: str, x: float, y: float, size: float = 10) -> None:
+    import pypdfium2.raw as pdfium_c
+
+    obj = pdfium_c.FPDFPageObj_CreateTextObj(pdf.raw, font, size)
+    buffer = ctypes.create_string_buffer((text + "\x00").encode("utf-16-le"))
+    pdfium_c.FPDFText_SetText(
+        obj, ctypes.cast(buffer, ctypes.POINTER(pdfium_c.FPDF_WCHAR))
+    )
+    pdfium_c.FPDFPageObj_Transform(obj, 1, 0, 0, 1, x, y)
+    pdfium_c.FPDFPage_InsertObject(page.raw, obj)
+
+
+def _pdf_rect(page, x: float, y: float, width: float, height: float) -> None:
+    import pypdfium2.raw as pdfium_c
+
+    obj = pdfium_c.FPDFPageObj_CreateNewRect(x, y, width, height)
+    pdfium_c.FPDFPageObj_SetStrokeColor(obj, 0, 0, 0, 255)
+    pdfium_c.FPDFPath_SetDrawMode(obj, 0, True)
+    pdfium_c.FPDFPage_InsertObject(page.raw, obj)
+
+
+def _wrap(text: str, width: int) -> list[str]:
+    lines, line = [], ""
+    for word in text.split():
+        if line and len(line) + 1 + len(word) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}".strip()
+    return lines + [line] if line else lines
+
+
+def _write_pdf_page(pdf, font, number: int, planned: _Page, content: _Content) -> None:
+    import pypdfium2 as pdfium
+
+    page = pdf.new_page(_PDF_WIDTH, _PDF_HEIGHT)
+    y = _PDF_HEIGHT - _PDF_MARGIN
+    _pdf_text(pdf, font, page, f"Section {number}", _PDF_MARGIN, y, size=16)
+    y -= 2 * _PDF_LINE
+
+    for _ in range(planned.formulas):
+        _pdf_text(pdf, font, page, content.formula(), _PDF_WIDTH / 3, y, size=12)
+        y -= 2 * _PDF_LINE
+
+    cell_width = (_PDF_WIDTH - 2 * _PDF_MARGIN) / _TABLE_COLS
+    for _ in range(planned.tables):
+        for row in content.table():
+            y -= _PDF_LINE + 4
+            for col, text in enumerate(row):
+                x = _PDF_MARGIN + col * cell_width
+                _pdf_rect(page, x, y - 4, cell_width, _PDF_LINE + 4)
+                _pdf_text(pdf, font, page, text, x + 4, y)
+        y -= 2 * _PDF_LINE
+
+    for _ in range(planned.images):
+        image = pdfium.PdfImage.new(pdf)
+        bitmap = pdfium.PdfBitmap.from_pil(Image.open(io.BytesIO(content.png())))
+        image.set_bitmap(bitmap)
+        y -= 160
+        image.set_matrix(pdfium.PdfMatrix().scale(240, 160).translate(_PDF_MARGIN, y))
+        page.insert_obj(image)
+        y -= _PDF_LINE
+
+    # Fill the rest of the page with body text
+    for _ in range(_PARAGRAPHS_PER_PAGE):
+        for line in _wrap(content.paragraph(), _PDF_CHARS_PER_LINE):
+            if y < _PDF_MARGIN + _PDF_LINE:
+                break
+            y -= _PDF_LINE
+            _pdf_text(pdf, font, page, line, _PDF_MARGIN, y)
+        y -= _PDF_LINE
+
+    page.gen_content()
+    page.close()
+
+
+def _write_pdf(spec: SampleSpec, path: Path, content: _Content) -> None:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+
+    # Generating a page's content gets slower the more objects the document
+    # has, so pages are generated in small documents and then merged
+    planned_pages = plan_pages(spec)
+    output = pdfium.PdfDocument.new()
+    try:
+        for first in range(0, len(planned_pages), _PDF_CHUNK_PAGES):
+            chunk = pdfium.PdfDocument.new()
+            font = pdfium_c.FPDFText_LoadStandardFont(chunk.raw, b"Helvetica")
+            try:
+                for number, planned in enumerate(
+                    planned_pages[first : first + _PDF_CHUNK_PAGES], start=first + 1
+                ):
+                    _write_pdf_page(chunk, font, number, planned, content)
+                output.import_pages(chunk)
+            finally:
+                pdfium_c.FPDFFont_Close(font)
+                chunk.close()
+        output.save(path)
+    finally:
+        output.close()
+
+
+# --- DOCX ---
+
+_OMML = (
+    '<m:oMathPara xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math">'
+    "<m:oMath><m:r><m:t>{}</m:t></m:r></m:oMath></m:oMathPara>"
+)
+
+
+def _write_docx(spec: SampleSpec, path: Path, content: _Content) -> None:
+    from xml.sax.saxutils import escape
+
+    from docx import Document
+    from docx.oxml import parse_xml
+    from docx.shared import Inches
+
+    document = Document()
+    document.core_properties.created = _CREATED
+    document.core_properties.modified = _CREATED
+    for number, planned in enumerate(plan_pages(spec), start=1):
+        if number > 1:
+            document.add_page_break()
+        document.add_heading(f"Section {number}", level=1)
+        for _ in range(planned.formulas):
+            document.add_paragraph()._p.append(
+                parse_xml(_OMML.format(escape(content.formula())))
+            )
+        for _ in range(planned.tables):
+            rows = content.table()
+            table = document.add_table(rows=len(rows), cols=len(rows[0]))
+            table.style = "Table Grid"
+            for row_cells, row in zip(table.rows, rows, strict=True):
+                for cell, text in zip(row_cells.cells, row, strict=True):
+                    cell.text = text
+        for _ in range(planned.images):
+            document.add_picture(io.BytesIO(content.png()), width=Inches(3))
+        for _ in range(_PARAGRAPHS_PER_PAGE):
+            document.add_paragraph(content.paragraph())
+    document.save(path)
+
+
+# --- PPTX ---
+
+
+def _write_pptx(spec: SampleSpec, path: Path, content: _Content) -> None:
+    from pptx import Presentation
+    from pptx.util import Emu, Inches, Pt
+
+    presentation = Presentation()
+    presentation.core_properties.created = _CREATED
+    presentation.core_properties.modified = _CREATED
+    layout = presentation.slide_layouts[5]  # Title only
+    for number, planned in enumerate(plan_pages(spec), start=1):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = f"Section {number}"
+        top = Inches(1.5)
+        for _ in range(planned.formulas):
+            box = slide.shapes.add_textbox(Inches(1), top, Inches(8), Inches(0.4))
+            box.text_frame.text = content.formula()
+            top += Inches(0.5)
+        for _ in range(planned.tables):
+            rows = content.table()
+            shape = slide.shapes.add_table(
+                len(rows),
+                len(rows[0]),
+                Inches(0.5),
+                top,
+                Inches(9),
+                Inches(0.3) * len(rows),
+            )
+            for row_index, row in enumerate(rows):
+                for col, text in enumerate(row):
+                    shape.table.cell(row_index, col).text = text
+            top += Inches(0.3) * len(rows) + Inches(0.2)
+        for index in range(planned.images):
+            slide.shapes.add_picture(
+                io.BytesIO(content.png()),
+                Inches(0.5 + 3 * (index % 3)),
+                top,
+                width=Inches(2.5),
+            )
+        if planned.images:
+            top += Inches(1.8)
+        box = slide.shapes.add_textbox(
+            Inches(0.5), top, Inches(9), Emu(Inches(7.5) - top)
+        )
+        box.text_frame.word_wrap = True
+        box.text_frame.text = content.paragraph()
+        box.text_frame.paragraphs[0].font.size = Pt(12)
+    presentation.save(path)
+
+
+# --- XLSX ---
+
+
+def _write_xlsx(spec: SampleSpec, path: Path, content: _Content) -> None:
+    from openpyxl import Workbook
+    from openpyxl.drawing.image import Image as SheetImage
+
+    workbook = Workbook()
+    workbook.properties.created = _CREATED.replace(tzinfo=None)
+    workbook.properties.modified = _CREATED.replace(tzinfo=None)
+    workbook.remove(workbook.active)
+    for number, planned in enumerate(plan_pages(spec), start=1):
+        sheet = workbook.create_sheet(f"Sheet {number}")
+        sheet.append([f"Section {number}"])
+        sheet.append([content.sentence(8)])
+        # Tables are separated by an empty row, as Docling detects them
+        data_rows = None
+        for _ in range(planned.tables):
+            sheet.append([])
+            for row in content.table():
+                sheet.append([int(v) if v.isdigit() else v for v in row])
+            data_rows = (sheet.max_row - _TABLE_ROWS + 2, sheet.max_row)
+        for _ in range(planned.formulas):
+            sheet.append([])
+            formula = (
+                f"=SUM(B{data_rows[0]}:B{data_rows[1]})" if data_rows else "=LEN(A2)"
+            )
+            sheet.append(["Total", formula])
+        for index in range(planned.images):
+            image = SheetImage(io.BytesIO(content.png()))
+            image.anchor = f"{chr(ord('H') + 4 * index)}2"
+            sheet.add_image(image)
+    workbook.save(path)
+
+
+_WRITERS = {
+    "pdf": _write_pdf,
+    "docx": _write_docx,
+    "pptx": _write_pptx,
+    "xlsx": _write_xlsx,
+}
+
+
+def generate(spec: SampleSpec, output_dir: Path = DEFAULT_OUTPUT_DIR) -> Path:
+    """Writes the document described by spec into output_dir and returns its path."""
+    if spec.format not in _WRITERS:
+        raise ValueError(f"Unsupported format: {spec.format}. Supported: {FORMATS}")
+    if spec.pages < 1:
+        raise ValueError("A document needs at least one page")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / spec.file_name
+    _WRITERS[spec.format](spec, path, _Content(spec.seed))
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic documents for scale testing."
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        action="append",
+        help="Format to generate (repeatable, default: pdf).",
+    )
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--tables-per-page", type=float, default=0.5)
+    parser.add_argument("--images", type=int, default=0, help="Images per document.")
+    parser.add_argument(
+        "--formulas", type=int, default=0, help="Formulas per document."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args()
+
+    for file_format in args.format or ["pdf"]:
+        for pages in args.pages:
+            spec = SampleSpec(
+                format=file_format,
+                pages=pages,
+                tables_per_page=args.tables_per_page,
+                images=args.images,
+                formulas=args.formulas,
+                seed=args.seed,
+            )
+            print(generate(spec, args.out))
+
+
+if __name__ == "__main__":
+    main()
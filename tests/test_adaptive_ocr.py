@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from docling_core.types.doc import DoclingDocument
+
+from docling_lib.converter import (
+    DocumentConversionOptions,
+    _convert_with_pool,
+    _plan_segments,
+)
+from docling_lib.ocr import OcrCostModel, OcrStats, pages_needing_ocr
+
+
+def test_pages_needing_ocr():
+    assert pages_needing_ocr([0.3, 0.0, 0.005, 0.02], 0.01) == [
+        False,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_cost_model_estimates_saving_once_both_kinds_were_seen():
+    model = OcrCostModel()
+
+    all_digital = OcrStats(pages=4, ocr_pages=0, text_seconds=4.0)
+    model.record(all_digital)
+    assert all_digital.estimated_seconds_saved is None
+
+    # 2 OCR pages at 3s/page, 2 text pages at 1s/page -> 2s saved per page
+    mixed = OcrStats(pages=4, ocr_pages=2, ocr_seconds=6.0, text_seconds=2.0)
+    model.record(mixed)
+    assert mixed.skipped_pages == 2
+    assert mixed.estimated_seconds_saved == pytest.approx(2 * (6.0 / 2 - 6.0 / 6))
+
+
+@patch("docling_lib.converter.text_coverage", return_value=[0.4, 0.0, 0.0, 0.3])
+def test_plan_groups_pages_by_ocr_need(mock_coverage, tmp_path):
+    options = DocumentConversionOptions(adaptive_ocr=True, ocr_min_coverage=0.01)
+
+    segments = _plan_segments(tmp_path / "mixed.pdf", options)
+
+    assert [(r, o.do_ocr) for r, o in segments] == [
+        ((1, 1), False),
+        ((2, 3), True),
+        ((4, 4), False),
+    ]
+
+
+@patch("docling_lib.converter.text_coverage")
+def test_adaptive_ocr_is_inactive_without_ocr(mock_coverage, tmp_path):
+    options = DocumentConversionOptions(adaptive_ocr=True, do_ocr=False)
+
+    assert _plan_segments(tmp_path / "doc.pdf", options) == []
+    mock_coverage.assert_not_called()
+
+
+@patch("docling_lib.converter._merge_documents")
+@patch("docling_lib.converter.text_coverage", return_value=[0.4, 0.0, 0.3])
+@patch("docling_lib.converter.DocumentConverter")
+def test_only_scanned_pages_are_converted_with_ocr(
+    MockDocumentConverter, mock_coverage, mock_merge, tmp_path
+):
+    pdf_path = tmp_path / "mixed.pdf"
+    ocr_flags = []
+
+    def _build(format_options):
+        pipeline_options = next(iter(format_options.values())).pipeline_options
+        converter = MagicMock()
+        converter.convert.side_effect = lambda path, page_range: (
+            ocr_flags.append((page_range, pipeline_options.do_ocr))
+            or MagicMock(document=MagicMock(spec=DoclingDocument))
+        )
+        return converter
+
+    MockDocumentConverter.side_effect = _build
+    options = DocumentConversionOptions(adaptive_ocr=True, shard_workers=1)
+
+    doc, stats = _convert_with_pool(pdf_path, options)
+
+    assert doc is mock_merge.return_value
+    assert sorted(ocr_flags) == [((1, 1), False), ((2, 2), True), ((3, 3), False)]
+    assert (stats.pages, stats.ocr_pages, stats.skipped_pages) == (3, 1, 2)
+
+
+def test_adaptive_ocr_threshold_is_part_of_the_output_signature():
+    assert (
+        DocumentConversionOptions(adaptive_ocr=True).output_signature()
+        != DocumentConversionOptions().output_signature()
+    )
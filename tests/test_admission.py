@@ -0,0 +1,150 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import docling_lib.server
+from docling_lib.admission import AdmissionController
+from docling_lib.overload import QueueFull, RetryAfterEstimator
+from docling_lib.server import app
+
+client = TestClient(app)
+
+
+def test_retry_after_follows_the_smoothed_duration():
+    estimator = RetryAfterEstimator(workers=2)
+    # Nothing finished yet: 5s assumed, shared by both workers
+    assert estimator.retry_after() == 3
+
+    estimator.record(10.0)
+    estimator.record(20.0)
+    assert estimator.average_seconds == 12.0
+    assert estimator.retry_after(ahead=3) == 18
+    # Capped, however long the queue
+    assert estimator.retry_after(ahead=1000) == 600
+
+
+def test_requests_wait_then_get_rejected():
+    async def _run():
+        controller = AdmissionController(max_in_flight=1, max_queue=1)
+        assert await controller.acquire() == 0.0
+
+        waiting = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.queue_depth == 1
+
+        # Slot and queue are full
+        with pytest.raises(QueueFull) as rejected:
+            await controller.acquire()
+        assert rejected.value.retry_after >= 1
+        assert controller.rejected == 1
+
+        await asyncio.sleep(0.01)
+        controller.release(held_seconds=2.0)
+        assert await waiting > 0
+        assert controller.in_flight == 1 and controller.queue_depth == 0
+        # Nobody is waiting for the slot, which is held 2s on average
+        assert controller.retry_after() == 2
+
+        controller.release()
+        assert controller.in_flight == 0
+
+    asyncio.run(_run())
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def _run():
+        controller = AdmissionController(max_in_flight=1, max_queue=2)
+        await controller.acquire()
+        first = asyncio.create_task(controller.acquire())
+        second = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        assert controller.queue_depth == 1
+
+        controller.release()
+        await second
+        assert controller.in_flight == 1
+
+    asyncio.run(_run())
+
+
+@patch("docling_lib.server.process_pdf")
+def test_convert_answers_429_when_saturated(mock_process, tmp_path, monkeypatch):
+    upload_dir = tmp_path / "uploads"
+    output_dir = tmp_path / "output"
+    upload_dir.mkdir()
+    output_dir.mkdir()
+    monkeypatch.setattr(docling_lib.server, "UPLOAD_DIR", upload_dir)
+    monkeypatch.setattr(docling_lib.server, "OUTPUT_DIR", output_dir)
+    controller = AdmissionController(max_in_flight=1, max_queue=0)
+    monkeypatch.setattr(docling_lib.server, "_admission", controller)
+
+    def _convert(input_path, request_output_dir):
+        md_path = request_output_dir / "processed_document.md"
+        md_path.write_text("# Doc")
+        return md_path
+
+    mock_process.side_effect = _convert
+    files = {"file": ("doc.docx", b"content", "application/octet-stream")}
+
+    # Another request holds the only slot
+    asyncio.run(controller.acquire())
+    response = client.post("/convert/", files=files)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    mock_process.assert_not_called()
+    assert list(upload_dir.iterdir()) == []
+
+    metrics = client.get("/metrics").text
+    assert "docling_admission_in_flight 1" in metrics
+    assert "docling_admission_queue_depth 0" in metrics
+    assert "docling_admission_rejected_total 1" in metrics
+
+    controller.release()
+    assert client.post("/convert/", files=files).status_code == 200
+    assert controller.in_flight == 0
+
+
+def test_rejected_upload_is_not_received(monkeypatch):
+    controller = AdmissionController(max_in_flight=1, max_queue=0)
+    monkeypatch.setattr(docling_lib.server, "_admission", controller)
+    body_reads = []
+    messages = []
+
+    async def _receive():
+        body_reads.append(1)
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def _send(message):
+        messages.append(message)
+
+    async def _run():
+        await controller.acquire()
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/convert/",
+            "raw_path": b"/convert/",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [
+                (b"content-type", b"multipart/form-data; boundary=x"),
+                (b"content-length", b"1000000"),
+            ],
+            "client": ("test", 1),
+            "server": ("test", 80),
+        }
+        await app(scope, _receive, _send)
+
+    asyncio.run(_run())
+
+    assert messages[0]["status"] == 429
+    assert body_reads == []
@@ -0,0 +1,215 @@
+import io
+import tarfile
+import zipfile
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import docling_lib.server
+from docling_lib.archive import archive_files, iter_tar, iter_zip
+from docling_lib.server import app
+
+
+@pytest.fixture
+def output_tree(tmp_path):
+    root = tmp_path / "out"
+    (root / "images").mkdir(parents=True)
+    (root / "processed_document.md").write_text("# Title\n\n![](images/fig.png)\n")
+    (root / "images" / "fig.png").write_bytes(b"\x89PNG" + bytes(range(256)) * 20)
+    return root
+
+
+def test_archive_files_skips_symlinks(output_tree, tmp_path):
+    outside = tmp_path / "secret.txt"
+    outside.write_text("secret")
+    (output_tree / "link.txt").symlink_to(outside)
+
+    names = [name for _, name in archive_files(output_tree)]
+    assert names == ["images/fig.png", "processed_document.md"]
+
+
+def test_iter_zip_round_trip(output_tree):
+    data = b"".join(iter_zip(output_tree, chunk_size=100))
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        assert (
+            archive.read("processed_document.md")
+            == (output_tree / "processed_document.md").read_bytes()
+        )
+        assert (
+            archive.read("images/fig.png")
+            == (output_tree / "images" / "fig.png").read_bytes()
+        )
+        assert archive.getinfo("images/fig.png").compress_type == zipfile.ZIP_STORED
+
+
+def test_iter_tar_round_trip(output_tree):
+    data = b"".join(iter_tar(output_tree, chunk_size=100))
+    assert len(data) % tarfile.BLOCKSIZE == 0
+    with tarfile.open(fileobj=io.BytesIO(data)) as archive:
+        assert archive.getnames() == ["images/fig.png", "processed_document.md"]
+        fig = archive.extractfile("images/fig.png").read()
+        assert fig == (output_tree / "images" / "fig.png").read_bytes()
+
+
+def _convert_with_image(input_path, request_output_dir):
+    (request_output_dir / "images").mkdir()
+    (request_output_dir / "images" / "fig.png").write_bytes(b"\x89PNG image")
+    md_path = request_output_dir / "processed_document.md"
+    md_path.write_text("# Converted\n\n![](images/fig.png)\n")
+    return md_path
+
+
+def _post(client, response_format):
+    return client.post(
+        f"/convert/?response_format={response_format}",
+        files={"file": ("doc.docx", b"content", "application/octet-stream")},
+    )
+
+
+@patch("docling_lib.server.process_pdf", side_effect=_convert_with_image)
+def test_convert_returns_inline_markdown(mock_process, server_dirs):
+    _, output_dir = server_dirs
+    response = _post(TestClient(app), "markdown")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/markdown")
+    assert response.text.startswith("# Converted")
+    # The output stays available for /download
+    output_id = response.headers["x-output-id"]
+    assert (output_dir / output_id / "images" / "fig.png").exists()
+
+
+@patch("docling_lib.server.process_pdf", side_effect=_convert_with_image)
+def test_convert_streams_zip(mock_process, server_dirs):
+    response = _post(TestClient(app), "zip")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    output_id = response.headers["x-output-id"]
+    assert f'filename="{output_id}.zip"' in response.headers["content-disposition"]
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert sorted(archive.namelist()) == ["images/fig.png", "processed_document.md"]
+        assert archive.read("images/fig.png") == b"\x89PNG image"
+
+
+@patch("docling_lib.server.process_pdf", side_effect=_convert_with_image)
+def test_convert_streams_tar(mock_process, server_dirs):
+    response = _post(TestClient(app), "tar")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-tar"
+    with tarfile.open(fileobj=io.BytesIO(response.content)) as archive:
+        assert (
+            archive.extractfile("processed_document.md")
+            .read()
+            .startswith(b"# Converted")
+        )
+
+
+@patch("docling_lib.server.process_pdf", side_effect=_convert_with_image)
+def test_convert_rejects_unknown_response_format(mock_process, server_dirs):
+    response = _post(TestClient(app), "rar")
+
+    assert response.status_code == 400
+    mock_process.assert_not_called()
+
+
+def test_iter_tar_zst_round_trip(output_tree):
+    zstandard = pytest.importorskip("zstandard")
+    from docling_lib.archive import iter_tar_zst
+
+    data = b"".join(iter_tar_zst(output_tree, chunk_size=100))
+    tar_data = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)).read()
+    assert tar_data == b"".join(iter_tar(output_tree))
+
+
+def _convert_once(client):
+    response = client.post(
+        "/convert/",
+        files={"file": ("doc.docx", b"content", "application/octet-stream")},
+    )
+    assert response.status_code == 200
+    return response.json()["output_id"]
+
+
+@patch("docling_lib.server.process_pdf", side_effect=_convert_with_image)
+def test_download_bundle_zip(mock_process, server_dirs):
+    client = TestClient(app)
+    output_id = _convert_once(client)
+
+    response = client.get(f"/download/{output_id}.zip")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert sorted(archive.namelist()) == ["images/fig.png", "processed_document.md"]
+
+
+@patch("docling_lib.server.process_pdf", side_effect=_convert_with_image)
+def test_download_bundle_tar_zst(mock_process, server_dirs):
+    zstandard = pytest.importorskip("zstandard")
+    client = TestClient(app)
+    output_id = _convert_once(client)
+
+    response = client.get(f"/download/{output_id}.tar.zst")
+
+    assert response.status_code == 200
+    tar_data = (
+        zstandard.ZstdDecompressor().stream_reader(io.BytesIO(response.content)).read()
+    )
+    with tarfile.open(fileobj=io.BytesIO(tar_data)) as archive:
+        assert archive.extractfile("images/fig.png").read() == b"\x89PNG image"
+
+
+@patch("docling_lib.server.process_pdf", side_effect=_convert_with_image)
+def test_convert_and_bundle_share_archive_formats(mock_process, server_dirs):
+    zstandard = pytest.importorskip("zstandard")
+    client = TestClient(app)
+
+    converted = _post(client, "tar.zst")
+    output_id = converted.headers["x-output-id"]
+    bundled = client.get(f"/download/{output_id}.tar")
+
+    assert converted.status_code == 200
+    assert f'filename="{output_id}.tar.zst"' in converted.headers["content-disposition"]
+    tar_data = (
+        zstandard.ZstdDecompressor().stream_reader(io.BytesIO(converted.content)).read()
+    )
+    assert bundled.status_code == 200
+    assert bundled.headers["content-type"] == "application/x-tar"
+    assert bundled.content == tar_data
+
+
+@patch("docling_lib.server.process_pdf", side_effect=_convert_with_image)
+def test_tar_zst_needs_zstandard(mock_process, server_dirs, monkeypatch):
+    client = TestClient(app)
+    output_id = _convert_once(client)
+    monkeypatch.setattr(docling_lib.server, "zstandard", None)
+
+    assert _post(client, "tar.zst").status_code == 501
+    assert client.get(f"/download/{output_id}.tar.zst").status_code == 501
+    assert mock_process.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "archive_name",
+    ["..zip", "%2E%2E.zip", "..%2F..%2Fetc.zip", ".zip", "missing.zip", "abc.rar"],
+)
+def test_download_bundle_rejects_paths_outside_requests(archive_name, server_dirs):
+    response = TestClient(app).get(f"/download/{archive_name}")
+
+    assert response.status_code == 404
+
+
+def test_download_bundle_rejects_symlinked_request_dir(server_dirs, tmp_path):
+    _, output_dir = server_dirs
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret.txt").write_text("secret")
+    (output_dir / "linked").symlink_to(outside)
+
+    response = TestClient(app).get("/download/linked.zip")
+
+    assert response.status_code == 404
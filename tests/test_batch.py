@@ -0,0 +1,251 @@
+import shutil
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from docling.datamodel.base_models import ConversionStatus
+from docling_core.types.doc import DoclingDocument
+
+import docling_lib.converter
+from docling_lib.cache import ConversionCache
+from docling_lib.converter import (
+    ConverterPool,
+    DocumentConversionOptions,
+    process_many,
+)
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+
+
+def _conv_result(path, name, status=ConversionStatus.SUCCESS, error=None):
+    doc = MagicMock(spec=DoclingDocument)
+    doc.name = name
+    result = MagicMock(status=status, document=doc)
+    result.input.file = path
+    result.errors = [MagicMock(error_message=error)] if error else []
+    return result
+
+
+def _pdf(tmp_path, name):
+    path = tmp_path / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"%PDF-1.4\n%%EOF")
+    return path
+
+
+@patch("docling_lib.converter.EnhancedMarkdownSerializer")
+@patch("docling_lib.converter.DocumentConverter")
+def test_process_many_reports_each_file_and_keeps_going(
+    MockDocumentConverter, MockSerializer, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    good = _pdf(tmp_path, "good.pdf")
+    broken = _pdf(tmp_path, "broken.pdf")
+    missing = tmp_path / "missing.pdf"
+
+    convert_all = MockDocumentConverter.return_value.convert_all
+    convert_all.side_effect = lambda paths, raises_on_error: iter(
+        [
+            _conv_result(good, "good"),
+            _conv_result(broken, "broken", ConversionStatus.FAILURE, "corrupt file"),
+        ]
+    )
+    MockSerializer.return_value.iter_chunks.side_effect = lambda: iter(["# Converted"])
+
+    results = {
+        r.input_path: r for r in process_many([good, missing, broken], Path("out"))
+    }
+
+    assert convert_all.call_args.args[0] == [good, broken]
+    assert convert_all.call_args.kwargs["raises_on_error"] is False
+    assert results[good].ok
+    assert results[good].output_path == Path("out") / "good" / "processed_document.md"
+    assert results[good].output_path.exists()
+    assert {"convert", "serialize", "markdown_write"} <= set(results[good].timings)
+    assert not results[good].cache_hit
+    assert results[good].total_seconds > 0
+    assert results[good].peak_rss_bytes > 0
+    assert not results[broken].ok
+    assert results[broken].error == "corrupt file"
+    assert results[missing].error == "Input file not found"
+
+
+@patch("docling_lib.converter._save_document")
+@patch("docling_lib.converter.DocumentConverter")
+def test_process_many_survives_save_errors_and_unique_dirs(
+    MockDocumentConverter, mock_save, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    first = _pdf(tmp_path, "a/report.pdf")
+    second = _pdf(tmp_path, "b/report.pdf")
+
+    MockDocumentConverter.return_value.convert_all.side_effect = (
+        lambda paths, raises_on_error: iter(
+            [_conv_result(first, "r1"), _conv_result(second, "r2")]
+        )
+    )
+
+    def _save(doc, output_dir, render):
+        if doc.name == "r1":
+            raise OSError("disk full")
+        return output_dir / render.md_output_name
+
+    mock_save.side_effect = _save
+
+    results = list(process_many([first, second], Path("out")))
+
+    assert [r.input_path for r in results] == [first, second]
+    assert results[0].error == "disk full"
+    assert results[1].output_path == Path("out") / "report_2" / "processed_document.md"
+
+
+@patch("docling_lib.converter._save_document")
+@patch("docling_lib.converter.DocumentConverter")
+def test_process_many_matches_results_by_input_path(
+    MockDocumentConverter, mock_save, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    first = _pdf(tmp_path, "first.pdf")
+    second = _pdf(tmp_path, "second.pdf")
+    skipped = _pdf(tmp_path, "skipped.pdf")
+
+    # Docling reorders the results and never returns one of the inputs
+    MockDocumentConverter.return_value.convert_all.side_effect = (
+        lambda paths, raises_on_error: iter(
+            [_conv_result(second, "second"), _conv_result(first, "first")]
+        )
+    )
+    mock_save.side_effect = lambda doc, output_dir, render: (
+        output_dir / f"{doc.name}.md"
+    )
+
+    results = {
+        r.input_path: r for r in process_many([first, second, skipped], Path("out"))
+    }
+
+    assert results[first].output_path == Path("out") / "first" / "first.md"
+    assert results[second].output_path == Path("out") / "second" / "second.md"
+    assert results[skipped].error == "No conversion result returned"
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_process_many_streams_spreadsheets_without_docling(
+    MockDocumentConverter, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    xlsx = tmp_path / "sheet.xlsx"
+    shutil.copy(TEST_DATA_DIR / "real_sample.xlsx", xlsx)
+
+    options = DocumentConversionOptions(stream_spreadsheets=True)
+    [result] = list(process_many([xlsx], Path("out"), options))
+
+    assert result.ok
+    MockDocumentConverter.return_value.convert_all.assert_not_called()
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_process_many_stops_on_unexpected_results(
+    MockDocumentConverter, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    first = _pdf(tmp_path, "first.pdf")
+    second = _pdf(tmp_path, "second.pdf")
+    renamed = tmp_path / "renamed.pdf"
+
+    # Results that match no input must not keep the batch waiting forever
+    MockDocumentConverter.return_value.convert_all.side_effect = (
+        lambda paths, raises_on_error: iter(lambda: _conv_result(renamed, "x"), None)
+    )
+
+    results = list(process_many([first, second], Path("out")))
+
+    assert [r.input_path for r in results] == [first, second]
+    assert all(r.error == "No conversion result returned" for r in results)
+
+
+@patch("docling_lib.converter._save_document")
+@patch("docling_lib.converter.DocumentConverter")
+def test_process_many_holds_a_slot_only_while_converting(
+    MockDocumentConverter, mock_save, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    pool = ConverterPool(workers=1)
+    monkeypatch.setattr(docling_lib.converter, "_converter_pool", pool)
+    first = _pdf(tmp_path, "first.pdf")
+    second = _pdf(tmp_path, "second.pdf")
+
+    MockDocumentConverter.return_value.convert_all.side_effect = (
+        lambda paths, raises_on_error: iter(
+            [_conv_result(first, "first"), _conv_result(second, "second")]
+        )
+    )
+    mock_save.side_effect = lambda doc, output_dir, render: (
+        output_dir / f"{doc.name}.md"
+    )
+
+    results = process_many([first, second], Path("out"))
+    next(results)
+
+    # Another request gets the only slot while the batch is between documents
+    other_converted = threading.Event()
+
+    def _other_request():
+        with pool.slot():
+            other_converted.set()
+
+    threading.Thread(target=_other_request, daemon=True).start()
+    assert other_converted.wait(timeout=5)
+    assert len(list(results)) == 1
+    # One slot per converted document, plus the other request's
+    assert pool.stats.checkouts == 3
+    assert pool.stats.builds == 1
+
+
+@patch("docling_lib.converter._convert_segments")
+@patch("docling_lib.converter._plan_segments")
+@patch("docling_lib.converter._save_document")
+def test_process_many_plans_segments_once_per_file(
+    mock_save, mock_plan, mock_convert_segments, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    pdf = _pdf(tmp_path, "scanned.pdf")
+    options = DocumentConversionOptions(adaptive_ocr=True)
+    segments = [((1, 1), options)]
+    mock_plan.return_value = segments
+    ocr_stats = MagicMock()
+    mock_convert_segments.return_value = (MagicMock(spec=DoclingDocument), ocr_stats)
+    mock_save.side_effect = lambda doc, output_dir, render: (
+        output_dir / render.md_output_name
+    )
+
+    [result] = list(process_many([pdf], Path("out"), options))
+
+    assert result.ok
+    # Planning reads every page for text coverage: the plan is reused
+    mock_plan.assert_called_once()
+    assert mock_convert_segments.call_args.args[1] is segments
+    assert result.ocr is ocr_stats
+
+
+@patch("docling_lib.converter.EnhancedMarkdownSerializer")
+@patch("docling_lib.converter.DocumentConverter")
+def test_process_many_reports_cache_hits(
+    MockDocumentConverter, MockSerializer, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    cache = ConversionCache(tmp_path / "cache", max_bytes=1024 * 1024, ttl_seconds=60)
+    monkeypatch.setattr(docling_lib.converter, "_default_cache", cache)
+    pdf = _pdf(tmp_path, "report.pdf")
+
+    MockDocumentConverter.return_value.convert_all.side_effect = (
+        lambda paths, raises_on_error: iter([_conv_result(pdf, "report")])
+    )
+    MockSerializer.return_value.iter_chunks.side_effect = lambda: iter(["# Report"])
+
+    [first] = list(process_many([pdf], Path("first")))
+    [second] = list(process_many([pdf], Path("second")))
+
+    assert first.ok and not first.cache_hit
+    assert second.cache_hit
+    assert second.output_path == Path("second") / "report" / "processed_document.md"
+    assert second.timing_record()["cache_hit"] is True
@@ -0,0 +1,215 @@
+import shutil
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from docling_lib.cache import ConversionCache
+
+SIGNATURE = {
+    "image_scale": 2.0,
+    "do_ocr": True,
+    "do_formula": True,
+    "table_format": "html",
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ConversionCache(tmp_path / "cache", max_bytes=1024 * 1024, ttl_seconds=3600)
+
+
+def _make_output(output_dir, content="# Converted"):
+    """Creates a fake conversion output (markdown + one image)."""
+    images_dir = output_dir / "images"
+    images_dir.mkdir(parents=True)
+    (images_dir / "image_1.png").write_bytes(b"png-bytes")
+    md_path = output_dir / "processed_document.md"
+    md_path.write_text(content, encoding="utf-8")
+    return md_path
+
+
+def test_make_key_depends_on_content_and_options(cache, tmp_path):
+    a = tmp_path / "a.pdf"
+    b = tmp_path / "b.pdf"
+    a.write_bytes(b"same bytes")
+    b.write_bytes(b"same bytes")
+
+    assert cache.make_key(a, SIGNATURE) == cache.make_key(b, SIGNATURE)
+    assert cache.make_key(a, SIGNATURE) != cache.make_key(
+        a, {**SIGNATURE, "table_format": "markdown"}
+    )
+
+    b.write_bytes(b"other bytes")
+    assert cache.make_key(a, SIGNATURE) != cache.make_key(b, SIGNATURE)
+
+
+def test_restore_miss_then_hit(cache, tmp_path):
+    md_path = _make_output(tmp_path / "first")
+
+    assert cache.restore("k1", tmp_path / "miss", "out.md") is None
+    cache.store("k1", md_path, [tmp_path / "first" / "images"])
+
+    restored = cache.restore("k1", tmp_path / "second", "renamed.md")
+
+    assert restored == tmp_path / "second" / "renamed.md"
+    assert restored.read_text(encoding="utf-8") == "# Converted"
+    assert (tmp_path / "second" / "images" / "image_1.png").read_bytes() == b"png-bytes"
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.stores == 1
+
+
+def test_expired_entry_is_a_miss(cache, tmp_path):
+    md_path = _make_output(tmp_path / "out")
+    cache.store("k1", md_path, [])
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+
+    assert cache.restore("k1", tmp_path / "again", "out.md") is None
+    assert cache.stats.expirations == 1
+    assert not (cache.cache_dir / "k1").exists()
+
+
+def test_lru_eviction_respects_size_cap(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=2500, ttl_seconds=3600)
+    for i in range(3):
+        md_path = tmp_path / f"doc{i}.md"
+        md_path.write_text("x" * 1000, encoding="utf-8")
+        cache.store(f"k{i}", md_path, [])
+        if i == 1:
+            # Read k0 so that k1 becomes the least recently used entry
+            assert cache.restore("k0", tmp_path / "read", "out.md") is not None
+
+    assert (cache.cache_dir / "k0").exists()
+    assert not (cache.cache_dir / "k1").exists()
+    assert (cache.cache_dir / "k2").exists()
+    assert cache.stats.evictions == 1
+    assert cache.size_bytes() <= 2500
+
+
+def test_eviction_uses_the_index_not_the_disk(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=5000, ttl_seconds=3600)
+    md_path = tmp_path / "doc.md"
+    md_path.write_text("x" * 1000, encoding="utf-8")
+
+    with patch.object(cache, "_read_meta", side_effect=AssertionError("scanned")):
+        for i in range(20):
+            cache.store(f"k{i}", md_path, [])
+
+    assert cache.stats.evictions == 15
+    assert sorted(p.name for p in cache.cache_dir.iterdir()) == [
+        f"k{i}" for i in range(15, 20)
+    ]
+    assert cache.size_bytes() == 5000
+
+
+def test_index_is_rebuilt_from_disk(cache, tmp_path):
+    md_path = _make_output(tmp_path / "out")
+    cache.store("k1", md_path, [tmp_path / "out" / "images"])
+
+    reopened = ConversionCache(cache.cache_dir, cache.max_bytes, cache.ttl_seconds)
+
+    assert reopened.size_bytes() == cache.size_bytes() > 0
+    assert reopened.restore("k1", tmp_path / "again", "out.md") is not None
+
+
+@pytest.mark.parametrize(
+    "meta", ['{"created_at": 1.0}', '{"created_at": 1.0, "size": "x"}', "[]", '{"cre']
+)
+def test_entries_with_a_corrupt_meta_file_are_skipped(cache, tmp_path, meta):
+    cache.store("good", _make_output(tmp_path / "good"), [])
+    cache.store("corrupt", _make_output(tmp_path / "corrupt"), [])
+    (cache.cache_dir / "corrupt" / "meta.json").write_text(meta, encoding="utf-8")
+
+    reopened = ConversionCache(cache.cache_dir, cache.max_bytes, cache.ttl_seconds)
+
+    assert reopened.restore("good", tmp_path / "again", "out.md") is not None
+    assert reopened.restore("corrupt", tmp_path / "other", "out.md") is None
+    # Storing the result again replaces the corrupt entry
+    reopened.store("corrupt", _make_output(tmp_path / "stored"), [])
+    assert reopened.restore("corrupt", tmp_path / "third", "out.md") is not None
+
+
+def test_entries_of_other_instances_are_found(cache, tmp_path):
+    # e.g. stored by a worker process of the process backend
+    other = ConversionCache(cache.cache_dir, cache.max_bytes, cache.ttl_seconds)
+    other.store("k1", _make_output(tmp_path / "out"), [])
+
+    assert cache.restore("k1", tmp_path / "again", "out.md") is not None
+    assert cache.size_bytes() == other.size_bytes()
+
+
+def test_pinned_entry_survives_eviction(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=1500, ttl_seconds=3600)
+    md_path = tmp_path / "doc.md"
+    md_path.write_text("x" * 1000, encoding="utf-8")
+    cache.store("k0", md_path, [])
+
+    copyfile = shutil.copyfile
+
+    def _store_while_copying(src, dst):
+        # Another conversion is stored while k0 is being restored
+        if Path(src).parent.name == "k0":
+            cache.store("k1", md_path, [])
+        return copyfile(src, dst)
+
+    with patch("docling_lib.cache.shutil.copyfile", side_effect=_store_while_copying):
+        restored = cache.restore("k0", tmp_path / "out", "out.md")
+
+    assert restored.read_text(encoding="utf-8") == "x" * 1000
+    # k0 was pinned, so the only entry that could make room was k1
+    assert not (cache.cache_dir / "k1").exists()
+    assert cache.stats.evictions == 1
+    cache.store("k2", md_path, [])
+    assert not (cache.cache_dir / "k0").exists()
+    assert (cache.cache_dir / "k2").exists()
+
+
+def test_store_skips_entries_larger_than_cap(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=10, ttl_seconds=3600)
+    md_path = tmp_path / "big.md"
+    md_path.write_text("x" * 100, encoding="utf-8")
+
+    cache.store("big", md_path, [])
+
+    assert cache.restore("big", tmp_path / "out", "big.md") is None
+    assert cache.stats.stores == 0
+
+
+def test_clear_removes_all_entries(cache, tmp_path):
+    md_path = _make_output(tmp_path / "out")
+    cache.store("k1", md_path, [])
+    cache.clear()
+    assert cache.size_bytes() == 0
+
+
+def test_page_results_round_trip_and_expire(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=1024 * 1024, ttl_seconds=3600)
+    key = cache.make_page_key("ab" * 32, SIGNATURE)
+
+    assert key != cache.make_page_key("ab" * 32, {**SIGNATURE, "do_ocr": False})
+    assert cache.restore_page(key) is None
+    cache.store_pages([(key, '{"page": 1}')])
+
+    assert cache.restore_page(key) == '{"page": 1}'
+    assert (cache.stats.page_hits, cache.stats.page_misses) == (1, 1)
+
+    cache.ttl_seconds = -1
+    assert cache.restore_page(key) is None
+    assert cache.stats.expirations == 1
+
+
+def test_page_entries_are_evicted_without_scanning(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=100 * 10, ttl_seconds=3600)
+    keys = [cache.make_page_key(f"{i:064x}", SIGNATURE) for i in range(500)]
+
+    with patch.object(cache, "_read_meta", side_effect=AssertionError("scanned")):
+        for start in range(0, len(keys), 50):
+            cache.store_pages([(key, "p" * 100) for key in keys[start : start + 50]])
+
+    assert cache.stats.evictions == 490
+    assert cache.size_bytes() == 1000
+    assert cache.restore_page(keys[-1]) == "p" * 100
+    assert cache.restore_page(keys[0]) is None
@@ -98,6 +98,137 @@ def test_main_with_custom_image_dir(mock_process_pdf, tmp_path, pdf_downloader,
     )
 
 
+@patch("docling_lib.cli.process_pdf")
+def test_main_with_no_cache(mock_process_pdf, tmp_path):
+    """
+    Given: The --no-cache flag is provided.
+    When: main() is called.
+    Then: It should call process_pdf with use_cache disabled.
+    """
+    pdf_path = tmp_path / "doc.pdf"
+    mock_process_pdf.return_value = tmp_path / "processed_document.md"
+
+    result = main([str(pdf_path), "-o", str(tmp_path), "--no-cache"])
+
+    assert result == 0
+    assert mock_process_pdf.call_args.kwargs["options"].use_cache is False
+
+
+@patch("docling_lib.cli.process_pdf")
+def test_main_with_image_format(mock_process_pdf, tmp_path):
+    """
+    Given: --image-format and --image-quality are provided.
+    When: main() is called.
+    Then: The image settings should be passed to process_pdf.
+    """
+    pdf_path = tmp_path / "doc.pdf"
+    mock_process_pdf.return_value = tmp_path / "processed_document.md"
+
+    result = main(
+        [
+            str(pdf_path),
+            "-o",
+            str(tmp_path),
+            "--image-format",
+            "webp",
+            "--image-quality",
+            "70",
+        ]
+    )
+
+    options = mock_process_pdf.call_args.kwargs["options"]
+    assert result == 0
+    assert options.image_format == "webp"
+    assert options.image_quality == 70
+
+
+@patch("docling_lib.cli.process_pdf")
+def test_main_with_text_only(mock_process_pdf, tmp_path):
+    """
+    Given: The --text-only flag is provided.
+    When: main() is called.
+    Then: It should call process_pdf with text_only enabled.
+    """
+    pdf_path = tmp_path / "doc.pdf"
+    mock_process_pdf.return_value = tmp_path / "processed_document.md"
+
+    result = main([str(pdf_path), "-o", str(tmp_path), "--text-only"])
+
+    assert result == 0
+    assert mock_process_pdf.call_args.kwargs["options"].text_only is True
+
+
+
+@patch("docling_lib.cli.process_pdf")
+def test_main_with_save_document(mock_process_pdf, tmp_path):
+    """
+    Given: The --save-document and --table-format flags are provided.
+    When: main() is called.
+    Then: It should ask process_pdf to store the document JSON as well.
+    """
+    pdf_path = tmp_path / "doc.pdf"
+    mock_process_pdf.return_value = tmp_path / "processed_document.md"
+
+    result = main(
+        [
+            str(pdf_path),
+            "-o",
+            str(tmp_path),
+            "--save-document",
+            "--table-format",
+            "markdown",
+        ]
+    )
+
+    assert result == 0
+    options = mock_process_pdf.call_args.kwargs["options"]
+    assert options.save_document_json is True
+    assert options.table_format == "markdown"
+
+
+@patch("docling_lib.cli.process_pdf")
+def test_main_with_stream_spreadsheets(mock_process_pdf, tmp_path):
+    mock_process_pdf.return_value = tmp_path / "processed_document.md"
+
+    result = main(
+        [str(tmp_path / "book.xlsx"), "-o", str(tmp_path), "--stream-spreadsheets"]
+    )
+
+    assert result == 0
+    assert mock_process_pdf.call_args.kwargs["options"].stream_spreadsheets is True
+
+
+@patch("docling_lib.cli.process_pdf")
+def test_main_with_timings(mock_process_pdf, tmp_path):
+    mock_process_pdf.return_value = tmp_path / "processed_document.md"
+
+    result = main(
+        [str(tmp_path / "doc.pdf"), "-o", str(tmp_path), "--timings", "sidecar"]
+    )
+
+    assert result == 0
+    assert mock_process_pdf.call_args.kwargs["options"].timings_output == "sidecar"
+
+
+@patch("docling_lib.cli.process_pdf")
+@patch("docling_lib.cli.rerender")
+def test_main_rerender(mock_rerender, mock_process_pdf, tmp_path):
+    """
+    Given: The --rerender flag without an input file.
+    When: main() is called.
+    Then: It should re-render the output directory instead of converting.
+    """
+    mock_rerender.return_value = tmp_path / "processed_document.md"
+
+    result = main(["--rerender", "-o", str(tmp_path), "--image-format", "webp"])
+
+    assert result == 0
+    mock_process_pdf.assert_not_called()
+    output_dir, options = mock_rerender.call_args.args
+    assert output_dir == tmp_path
+    assert options.image_format == "webp"
+
+
 # --- Tests for entry_point() ---
 
 
@@ -10,14 +10,6 @@ from docling_lib.converter import process_pdf
 
 # --- Fixtures ---
 
-@pytest.fixture(autouse=True)
-def reset_shared_converter():
-    """Resets the shared default converter before and after each test."""
-    import docling_lib.converter as converter_mod
-    converter_mod._default_pdf_converter = None
-    yield
-    converter_mod._default_pdf_converter = None
-
 @pytest.fixture
 def pdf_downloader(tmp_path):
     """Fixture to provide a path to a real PDF, downloading if necessary."""
@@ -52,7 +44,7 @@ def test_process_pdf_calls_docling_api_correctly(
     MockDocumentConverter.return_value.convert.return_value.document = mock_doc
     
     mock_serializer_instance = MockSerializer.return_value
-    mock_serializer_instance.serialize.return_value.text = "# Mocked Markdown"
+    mock_serializer_instance.iter_chunks.return_value = iter(["# Mocked Markdown"])
 
     output_dir = tmp_path
     expected_md_path = output_dir / "processed_document.md"
@@ -130,14 +122,16 @@ def test_process_pdf_with_explicit_converter(
     
     # We need to mock EnhancedMarkdownSerializer to avoid Pydantic issues with the mock_doc
     with patch("docling_lib.converter.EnhancedMarkdownSerializer") as MockSerializer:
-        MockSerializer.return_value.serialize.return_value.text = "Explicit Content"
+        MockSerializer.return_value.iter_chunks.return_value = iter(
+            ["Explicit Content"]
+        )
         
         result = process_pdf(pdf_path, tmp_path, converter=mock_explicit_converter)
     
     assert result is not None
     mock_explicit_converter.convert.assert_called_once_with(pdf_path)
-    # The DocumentConverter (Docling's own) is instantiated once by our shared wrapper.
-    assert MockDocumentConverter.call_count == 1
+    # The explicit converter only takes a pool slot: no pooled converter is built
+    assert MockDocumentConverter.call_count == 0
 
 
 @patch("docling_lib.converter.EnhancedMarkdownSerializer")
@@ -152,7 +146,7 @@ def test_process_pdf_unexpected_workflow_error(
     pdf_path = tmp_path / "test.pdf"
     pdf_path.touch()
 
-    MockSerializer.return_value.serialize.side_effect = Exception("Crash")
+    MockSerializer.return_value.iter_chunks.side_effect = Exception("Crash")
 
     with caplog.at_level(logging.ERROR):
         result = process_pdf(pdf_path, tmp_path)
@@ -172,3 +166,71 @@ def test_process_pdf_path_traversal_prevention(tmp_path, pdf_downloader, monkeyp
     
     result = process_pdf(pdf_path, malicious_dir)
     assert result is None
+
+
+@patch("docling_lib.converter.DocumentConverter")
+@patch("docling_lib.converter.EnhancedMarkdownSerializer")
+def test_process_pdf_uses_conversion_cache(
+    MockSerializer, MockDocumentConverter, tmp_path, monkeypatch
+):
+    """
+    Verify that a repeated conversion of the same bytes and options is served
+    from the cache, and that use_cache=False bypasses it.
+    """
+    import docling_lib.converter as converter_mod
+    from docling_lib.cache import ConversionCache
+    from docling_lib.converter import DocumentConversionOptions
+
+    monkeypatch.chdir(tmp_path)
+    cache = ConversionCache(tmp_path / "cache", max_bytes=1024 * 1024, ttl_seconds=60)
+    monkeypatch.setattr(converter_mod, "_default_cache", cache)
+
+    pdf_path = tmp_path / "test.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF")
+
+    mock_doc = MagicMock(spec=DoclingDocument)
+    mock_doc.name = "Cached Doc"
+    mock_convert = MockDocumentConverter.return_value.convert
+    mock_convert.return_value.document = mock_doc
+    MockSerializer.return_value.iter_chunks.side_effect = lambda: iter(["# Cached"])
+
+    first = process_pdf(pdf_path, tmp_path / "first")
+    second = process_pdf(pdf_path, tmp_path / "second")
+
+    assert mock_convert.call_count == 1
+    assert second == tmp_path / "second" / "processed_document.md"
+    assert second.read_text(encoding="utf-8") == first.read_text(encoding="utf-8")
+    assert cache.stats.hits == 1
+
+    process_pdf(
+        pdf_path, tmp_path / "third", options=DocumentConversionOptions(use_cache=False)
+    )
+    assert mock_convert.call_count == 2
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_process_xlsx_uses_streaming_fast_path(
+    MockDocumentConverter, tmp_path, monkeypatch
+):
+    """
+    Verify that XLSX workbooks are streamed without a Docling converter with
+    stream_spreadsheets=True, and go through the Docling pipeline by default.
+    """
+    from docling_lib.converter import DocumentConversionOptions
+
+    monkeypatch.chdir(tmp_path)
+    xlsx_path = Path(__file__).parent / "test_data" / "real_sample.xlsx"
+
+    result_path = process_pdf(
+        xlsx_path,
+        tmp_path / "out",
+        options=DocumentConversionOptions(stream_spreadsheets=True),
+    )
+
+    MockDocumentConverter.assert_not_called()
+    text = result_path.read_text(encoding="utf-8")
+    assert text.startswith("---\ntitle: real_sample\n---\n\n<table><tbody>")
+    assert "<td>Alice</td>" in text
+
+    process_pdf(xlsx_path, tmp_path / "docling")
+    MockDocumentConverter.return_value.convert.assert_called_once()
@@ -0,0 +1,190 @@
+import threading
+import time
+from unittest.mock import patch
+
+from docling_lib.converter import (
+    ConverterPool,
+    DocumentConversionOptions,
+    PipelineConfig,
+    RenderConfig,
+)
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_pool_reuses_converters_for_alternating_options(MockDocumentConverter):
+    """Alternating between two option sets should build each converter once."""
+    pool = ConverterPool(workers=1, max_configs=2)
+    fast = DocumentConversionOptions(do_ocr=False, do_formula=False)
+    accurate = DocumentConversionOptions()
+
+    for _ in range(3):
+        with pool.checkout(fast):
+            pass
+        with pool.checkout(accurate):
+            pass
+
+    assert MockDocumentConverter.call_count == 2
+    assert pool.stats.builds == 2
+    assert pool.stats.hits == 4
+    assert pool.stats.evictions == 0
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_pool_ignores_document_specific_options(MockDocumentConverter):
+    """File and directory names must not trigger a rebuild."""
+    pool = ConverterPool(workers=1, max_configs=2)
+
+    with pool.checkout(DocumentConversionOptions(md_output_name="a.md")) as first:
+        pass
+    with pool.checkout(DocumentConversionOptions(image_dir_name="figures")) as second:
+        pass
+
+    assert first is second
+    assert pool.stats.builds == 1
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_pool_evicts_least_recently_used(MockDocumentConverter):
+    pool = ConverterPool(workers=1, max_configs=2)
+    opts_a = DocumentConversionOptions(image_scale=1.0)
+    opts_b = DocumentConversionOptions(image_scale=2.0)
+    opts_c = DocumentConversionOptions(image_scale=3.0)
+
+    with pool.checkout(opts_a) as conv_a:
+        pass
+    with pool.checkout(opts_b):
+        pass
+    with pool.checkout(opts_a):  # a is now the most recently used
+        pass
+    with pool.checkout(opts_c):  # evicts b
+        pass
+
+    assert len(pool) == 2
+    assert pool.stats.evictions == 1
+    with pool.checkout(opts_a) as again:
+        assert again is conv_a
+    with pool.checkout(opts_b):
+        pass
+    assert pool.stats.builds == 4
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_pool_table_format_never_rebuilds(MockDocumentConverter):
+    """table_format is a render option and must not load new models."""
+    pool = ConverterPool(workers=1, max_configs=2)
+
+    with pool.checkout(DocumentConversionOptions(table_format="html")) as html:
+        pass
+    with pool.checkout(DocumentConversionOptions(table_format="markdown")) as markdown:
+        pass
+
+    assert html is markdown
+    assert MockDocumentConverter.call_count == 1
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_pool_runs_workers_concurrently(MockDocumentConverter):
+    """Two workers should hand out two distinct converters at the same time."""
+    pool = ConverterPool(workers=2, max_configs=2)
+    options = DocumentConversionOptions()
+    barrier = threading.Barrier(2, timeout=5)
+    checked_out = []
+
+    def _worker():
+        with pool.checkout(options) as converter:
+            checked_out.append(converter)
+            barrier.wait()  # Fails unless both checkouts overlap
+
+    threads = [threading.Thread(target=_worker) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(checked_out) == 2
+    assert checked_out[0] is not checked_out[1]
+    assert len(pool) == 2
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_pool_blocks_when_all_workers_busy(MockDocumentConverter):
+    pool = ConverterPool(workers=1, max_configs=2)
+    options = DocumentConversionOptions()
+    release = threading.Event()
+    second_started = threading.Event()
+
+    def _holder():
+        with pool.checkout(options):
+            release.wait(timeout=5)
+
+    def _waiter():
+        with pool.checkout(options):
+            second_started.set()
+
+    holder = threading.Thread(target=_holder)
+    holder.start()
+    time.sleep(0.05)
+    waiter = threading.Thread(target=_waiter)
+    waiter.start()
+
+    assert not second_started.wait(timeout=0.1)
+    release.set()
+    assert second_started.wait(timeout=5)
+    holder.join()
+    waiter.join()
+    assert pool.stats.builds == 1
+    assert pool.stats.checkouts == 2
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_pool_slot_limits_workers_without_building(MockDocumentConverter):
+    """Explicit converters take a slot but never build a pooled converter."""
+    pool = ConverterPool(workers=1, max_configs=2)
+    release = threading.Event()
+    second_started = threading.Event()
+
+    def _holder():
+        with pool.slot():
+            release.wait(timeout=5)
+
+    def _waiter():
+        with pool.checkout(DocumentConversionOptions()):
+            second_started.set()
+
+    holder = threading.Thread(target=_holder)
+    holder.start()
+    time.sleep(0.05)
+    waiter = threading.Thread(target=_waiter)
+    waiter.start()
+
+    assert not second_started.wait(timeout=0.1)
+    release.set()
+    assert second_started.wait(timeout=5)
+    holder.join()
+    waiter.join()
+    assert pool.stats.builds == 1
+    assert pool.stats.checkouts == 2
+
+
+def test_options_split_into_pipeline_and_render_parts():
+    options = DocumentConversionOptions(
+        image_dir_name="figs",
+        md_output_name="out.md",
+        image_scale=1.5,
+        table_format="markdown",
+        do_formula=False,
+        do_ocr=False,
+    )
+
+    assert options.pipeline == PipelineConfig(
+        image_scale=1.5, do_formula=False, do_ocr=False
+    )
+    assert options.render == RenderConfig(
+        image_dir_name="figs", md_output_name="out.md", table_format="markdown"
+    )
+    # Render-only changes keep the same pipeline part (and pool key)
+    assert (
+        DocumentConversionOptions(table_format="html").pipeline
+        == DocumentConversionOptions(table_format="markdown").pipeline
+    )
+    assert "md_output_name" not in options.output_signature()
@@ -0,0 +1,103 @@
+import zipfile
+
+import pypdfium2 as pdfium
+import pytest
+from generate_samples import SampleSpec, generate, plan_pages
+from openpyxl import load_workbook
+
+from docling_lib.pages import count_pages, page_fingerprints
+
+
+def test_plan_spreads_content_evenly():
+    pages = plan_pages(SampleSpec(pages=4, tables_per_page=0.5, images=6, formulas=1))
+
+    assert [p.tables for p in pages] == [0, 1, 0, 1]
+    assert [p.images for p in pages] == [1, 2, 1, 2]
+    assert sum(p.formulas for p in pages) == 1
+
+
+def test_generate_pdf(tmp_path):
+    spec = SampleSpec(format="pdf", pages=5, tables_per_page=1, images=3, formulas=2)
+
+    path = generate(spec, tmp_path)
+
+    assert count_pages(path) == 5
+    pdf = pdfium.PdfDocument(path)
+    try:
+        images = sum(
+            1
+            for page in pdf
+            for obj in page.get_objects()
+            if obj.type == pdfium.raw.FPDF_PAGEOBJ_IMAGE
+        )
+    finally:
+        pdf.close()
+    assert images == 3
+
+
+def test_generate_is_reproducible(tmp_path):
+    spec = SampleSpec(format="pdf", pages=3, tables_per_page=1, images=2, seed=7)
+
+    first = page_fingerprints(generate(spec, tmp_path / "a"))
+    second = page_fingerprints(generate(spec, tmp_path / "b"))
+    other_seed = page_fingerprints(
+        generate(SampleSpec(format="pdf", pages=3, seed=8), tmp_path / "c")
+    )
+
+    assert first == second
+    assert first != other_seed
+
+
+def test_generate_docx(tmp_path):
+    docx = pytest.importorskip("docx")
+    spec = SampleSpec(format="docx", pages=4, tables_per_page=0.5, images=2, formulas=3)
+
+    document = docx.Document(generate(spec, tmp_path))
+
+    assert len(document.tables) == 2
+    assert len(document.inline_shapes) == 2
+    body = document.element.xml
+    assert body.count("<m:oMathPara") == 3
+    assert body.count('w:type="page"') == 3
+
+
+def test_generate_pptx(tmp_path):
+    pptx = pytest.importorskip("pptx")
+    spec = SampleSpec(format="pptx", pages=3, tables_per_page=1, images=3)
+
+    presentation = pptx.Presentation(generate(spec, tmp_path))
+
+    shapes = [shape for slide in presentation.slides for shape in slide.shapes]
+    assert len(presentation.slides) == 3
+    assert sum(shape.has_table for shape in shapes) == 3
+    assert (
+        sum(
+            shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE
+            for shape in shapes
+        )
+        == 3
+    )
+
+
+def test_generate_xlsx(tmp_path):
+    spec = SampleSpec(format="xlsx", pages=2, tables_per_page=2, images=2, formulas=2)
+
+    path = generate(spec, tmp_path)
+
+    workbook = load_workbook(path)
+    assert len(workbook.worksheets) == 2
+    formulas = [
+        cell.value
+        for sheet in workbook.worksheets
+        for row in sheet.iter_rows()
+        for cell in row
+        if isinstance(cell.value, str) and cell.value.startswith("=")
+    ]
+    assert len(formulas) == 2
+    with zipfile.ZipFile(path) as archive:
+        assert len([n for n in archive.namelist() if n.startswith("xl/media/")]) == 2
+
+
+def test_generate_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        generate(SampleSpec(format="odt"), tmp_path)
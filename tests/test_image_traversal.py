@@ -24,7 +24,7 @@ def test_process_pdf_image_dir_traversal(tmp_path, monkeypatch):
         mock_conv.convert.return_value.document = mock_doc
 
         mock_serializer = mock_serializer_class.return_value
-        mock_serializer.serialize.return_value.text = "mocked markdown"
+        mock_serializer.iter_chunks.return_value = iter(["mocked markdown"])
 
         options = DocumentConversionOptions(image_dir_name=image_dir_name)
         result = process_pdf(pdf_path, output_dir, options=options)
@@ -53,7 +53,7 @@ def test_process_pdf_md_output_traversal(tmp_path, monkeypatch):
         mock_conv.convert.return_value.document = mock_doc
 
         mock_serializer = mock_serializer_class.return_value
-        mock_serializer.serialize.return_value.text = "mocked markdown"
+        mock_serializer.iter_chunks.return_value = iter(["mocked markdown"])
 
         options = DocumentConversionOptions(md_output_name=md_output_name)
         result = process_pdf(pdf_path, output_dir, options=options)
@@ -0,0 +1,88 @@
+import pytest
+from docling_core.types.doc import DoclingDocument, ImageRef
+from PIL import Image
+
+from docling_lib.converter import RenderConfig, _save_document
+from docling_lib.images import ImageExporter
+
+
+def _image(color, mode="RGB", size=(32, 32)):
+    return Image.new(mode, size, color)
+
+
+def test_export_deduplicates_identical_images(tmp_path):
+    logo = _image((255, 0, 0))
+    exporter = ImageExporter(tmp_path, workers=2)
+
+    paths = exporter.export([logo, _image((0, 255, 0)), logo.copy()])
+
+    assert paths[0] == paths[2]
+    assert paths[0] != paths[1]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        {paths[0].name, paths[1].name}
+    )
+    assert exporter.stats.written == 2
+    assert exporter.stats.deduplicated == 1
+
+
+@pytest.mark.parametrize(
+    "image_format, suffix, pil_format",
+    [
+        ("png", ".png", "PNG"),
+        ("webp", ".webp", "WEBP"),
+        ("jpeg", ".jpg", "JPEG"),
+        ("JPEG", ".jpg", "JPEG"),
+    ],
+)
+def test_export_formats(tmp_path, image_format, suffix, pil_format):
+    exporter = ImageExporter(tmp_path, image_format=image_format, quality=50)
+
+    [path] = exporter.export([_image((10, 20, 30, 128), mode="RGBA")])
+
+    assert path.suffix == suffix
+    with Image.open(path) as written:
+        assert written.format == pil_format
+        assert written.size == (32, 32)
+
+
+def test_lower_quality_produces_smaller_files(tmp_path):
+    noisy = Image.effect_noise((128, 128), 64).convert("RGB")
+    high = ImageExporter(tmp_path / "high", image_format="jpeg", quality=95)
+    low = ImageExporter(tmp_path / "low", image_format="jpeg", quality=20)
+    (tmp_path / "high").mkdir()
+    (tmp_path / "low").mkdir()
+
+    [high_path] = high.export([noisy])
+    [low_path] = low.export([noisy])
+
+    assert low_path.stat().st_size < high_path.stat().st_size
+
+
+def test_export_keeps_input_order_and_skips_empty_input(tmp_path):
+    exporter = ImageExporter(tmp_path)
+    images = [_image((i, i, i)) for i in range(5)]
+
+    paths = exporter.export(images)
+
+    assert exporter.export([]) == []
+    for image, path in zip(images, paths, strict=True):
+        with Image.open(path) as written:
+            assert written.getpixel((0, 0)) == image.getpixel((0, 0))
+
+
+def test_unsupported_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported image format"):
+        ImageExporter(tmp_path, image_format="gif")
+
+
+def test_save_document_writes_each_picture_once_and_links_it(tmp_path):
+    doc = DoclingDocument(name="slides")
+    logo = _image((255, 0, 0))
+    for _ in range(2):
+        doc.add_picture(image=ImageRef.from_pil(logo, dpi=72))
+
+    md_path = _save_document(doc, tmp_path, RenderConfig(image_format="webp"))
+
+    [written] = list((tmp_path / "images").iterdir())
+    assert written.suffix == ".webp"
+    assert md_path.read_text(encoding="utf-8").count(f"images/{written.name}") == 2
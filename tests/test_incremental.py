@@ -0,0 +1,174 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    ProvenanceItem,
+    Size,
+    TableCell,
+    TableData,
+)
+
+from docling_lib.cache import ConversionCache
+from docling_lib.converter import (
+    DocumentConversionOptions,
+    _convert_with_pool,
+    _merge_documents,
+    _plan_segments,
+)
+
+
+@pytest.fixture
+def page_cache(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=1024 * 1024, ttl_seconds=3600)
+    with patch("docling_lib.converter._default_cache", cache):
+        yield cache
+
+
+def _prov(page_no, text=""):
+    return ProvenanceItem(
+        page_no=page_no,
+        bbox=BoundingBox(l=0, t=10, r=100, b=0),
+        charspan=(0, len(text)),
+    )
+
+
+def _page_doc(page_no, text):
+    """A page holding a paragraph, a heading, a picture and a table."""
+    doc = DoclingDocument(name="report")
+    doc.add_page(page_no=page_no, size=Size(width=200, height=200))
+    doc.add_text(label=DocItemLabel.TEXT, text=text, prov=_prov(page_no, text))
+    doc.add_heading(text=f"{text} notes", prov=_prov(page_no, f"{text} notes"))
+    doc.add_picture(prov=_prov(page_no))
+    cell = TableCell(
+        text=text,
+        start_row_offset_idx=0,
+        end_row_offset_idx=1,
+        start_col_offset_idx=0,
+        end_col_offset_idx=1,
+    )
+    doc.add_table(
+        data=TableData(num_rows=1, num_cols=1, table_cells=[cell]), prov=_prov(page_no)
+    )
+    return doc
+
+
+def _convert_revision(MockDocumentConverter, pdf_path, pages):
+    """Converts a revision whose pages are (fingerprint, text) pairs."""
+    converted = []
+
+    def _convert(path, page_range):
+        first, _ = page_range
+        converted.append(first)
+        return MagicMock(document=_page_doc(first, pages[first - 1][1]))
+
+    MockDocumentConverter.return_value.convert.side_effect = _convert
+    options = DocumentConversionOptions(incremental=True, shard_workers=1)
+    with (
+        patch("docling_lib.converter.count_pages", return_value=len(pages)),
+        patch(
+            "docling_lib.converter.page_fingerprints",
+            return_value=[fingerprint for fingerprint, _ in pages],
+        ),
+        patch("docling_lib.converter._merge_documents") as mock_merge,
+    ):
+        _convert_with_pool(pdf_path, options)
+    return converted, mock_merge.call_args.args[0]
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_new_revision_only_converts_changed_pages(
+    MockDocumentConverter, page_cache, tmp_path
+):
+    pdf_path = tmp_path / "report.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF")
+
+    converted, _ = _convert_revision(
+        MockDocumentConverter, pdf_path, [("a", "Intro"), ("b", "Body"), ("c", "End")]
+    )
+    assert converted == [1, 2, 3]
+
+    converted, docs = _convert_revision(
+        MockDocumentConverter,
+        pdf_path,
+        [("new", "Preface"), ("a", "Intro"), ("b2", "Fixed body"), ("c", "End")],
+    )
+
+    assert sorted(converted) == [1, 3]
+    assert [doc.texts[0].text for doc in docs] == [
+        "Preface",
+        "Intro",
+        "Fixed body",
+        "End",
+    ]
+    # Reused pages are moved to their position in the new revision
+    assert [list(doc.pages) for doc in docs] == [[1], [2], [3], [4]]
+    assert [doc.texts[0].prov[0].page_no for doc in docs] == [1, 2, 3, 4]
+    assert page_cache.stats.page_hits == 2
+
+
+@patch("docling_lib.converter.DocumentConverter")
+def test_merged_revision_renumbers_references_and_provenance(
+    MockDocumentConverter, page_cache, tmp_path
+):
+    pdf_path = tmp_path / "report.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF")
+    _convert_revision(MockDocumentConverter, pdf_path, [("a", "Intro"), ("b", "Body")])
+    _, docs = _convert_revision(
+        MockDocumentConverter,
+        pdf_path,
+        [("new", "Preface"), ("a", "Intro"), ("b", "Body")],
+    )
+
+    merged = _merge_documents(docs)
+
+    assert sorted(merged.pages) == [1, 2, 3]
+    assert [t.self_ref for t in merged.texts] == [f"#/texts/{i}" for i in range(6)]
+    assert [p.self_ref for p in merged.pictures] == [
+        f"#/pictures/{i}" for i in range(3)
+    ]
+    assert [t.self_ref for t in merged.tables] == [f"#/tables/{i}" for i in range(3)]
+    headings = [t.text for t in merged.texts if t.label == DocItemLabel.SECTION_HEADER]
+    assert headings == ["Preface notes", "Intro notes", "Body notes"]
+    # The body refers to the renumbered items, page by page
+    assert [child.cref for child in merged.body.children] == [
+        ref
+        for page in range(3)
+        for ref in (
+            f"#/texts/{2 * page}",
+            f"#/texts/{2 * page + 1}",
+            f"#/pictures/{page}",
+            f"#/tables/{page}",
+        )
+    ]
+    # Provenance follows the page each item now occupies, cached or not
+    assert [t.prov[0].page_no for t in merged.texts] == [1, 1, 2, 2, 3, 3]
+    assert [p.prov[0].page_no for p in merged.pictures] == [1, 2, 3]
+    assert [t.prov[0].page_no for t in merged.tables] == [1, 2, 3]
+    assert [t.data.table_cells[0].text for t in merged.tables] == [
+        "Preface",
+        "Intro",
+        "Body",
+    ]
+
+
+def test_incremental_conversion_needs_the_cache(tmp_path):
+    options = DocumentConversionOptions(incremental=True)
+
+    with patch("docling_lib.converter._default_cache", None):
+        assert _plan_segments(tmp_path / "doc.pdf", options) == []
+
+    assert "incremental" in options.output_signature()
+    assert "incremental" not in DocumentConversionOptions().output_signature()
+
+
+@patch("docling_lib.converter.count_pages", return_value=1)
+def test_incremental_conversion_splits_pdfs_into_pages(
+    mock_count, page_cache, tmp_path
+):
+    options = DocumentConversionOptions(incremental=True)
+
+    assert _plan_segments(tmp_path / "doc.pdf", options) == [((1, 1), options)]
+    assert _plan_segments(tmp_path / "doc.docx", options) == []
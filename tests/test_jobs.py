@@ -0,0 +1,231 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import docling_lib.server
+from docling_lib.jobs import Job, JobManager
+from docling_lib.pages import write_sample_pdf
+from docling_lib.progress import advance_pages
+from docling_lib.server import app
+
+
+@pytest.fixture(autouse=True)
+def job_settings(monkeypatch):
+    monkeypatch.setattr(docling_lib.server, "WARMUP_ENABLED", False)
+    monkeypatch.setattr(docling_lib.server, "JOB_WORKERS", 1)
+
+
+def _wait_for_status(client, job_id, statuses, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    body = client.get(f"/jobs/{job_id}").json()
+    while body["status"] not in statuses and time.monotonic() < deadline:
+        time.sleep(0.01)
+        body = client.get(f"/jobs/{job_id}").json()
+    return body
+
+
+def _submit(client, name="doc.docx", content=b"content"):
+    response = client.post(
+        "/jobs", files={"file": (name, content, "application/octet-stream")}
+    )
+    assert response.status_code == 202
+    return response.json()
+
+
+@patch("docling_lib.server.process_pdf")
+def test_job_lifecycle(mock_process, server_dirs):
+    upload_dir, _ = server_dirs
+    release = threading.Event()
+
+    def _convert(input_path, request_output_dir):
+        release.wait(5)
+        md_path = request_output_dir / "processed_document.md"
+        md_path.write_text("# Converted")
+        return md_path
+
+    mock_process.side_effect = _convert
+
+    with TestClient(app) as client:
+        first = _submit(client)
+        second = _submit(client)
+        assert first["status"] == "queued"
+        assert first["status_url"] == f"/jobs/{first['job_id']}"
+
+        running = _wait_for_status(client, first["job_id"], {"running"})
+        assert running["progress"]["stage"] == "converting"
+        # Pages are only counted for PDFs
+        assert running["progress"]["pages_total"] is None
+        # One worker: the second job waits behind the first
+        queued = client.get(f"/jobs/{second['job_id']}").json()
+        assert queued["status"] == "queued"
+        assert queued["progress"]["queue_position"] == 1
+
+        release.set()
+        done = _wait_for_status(client, first["job_id"], {"succeeded", "failed"})
+        assert done["status"] == "succeeded"
+        assert done["progress"]["stage"] == "done"
+        assert set(done["timings"]) == {
+            "queued_seconds",
+            "conversion_seconds",
+            "total_seconds",
+        }
+        assert done["result"]["output_id"] == first["job_id"]
+
+        download = client.get(done["result"]["download_url"])
+        assert download.status_code == 200
+        assert download.text == "# Converted"
+
+        assert (
+            _wait_for_status(client, second["job_id"], {"succeeded"})["status"]
+            == "succeeded"
+        )
+
+    # The uploads are removed once converted
+    assert list(upload_dir.iterdir()) == []
+
+
+@patch("docling_lib.server.process_pdf")
+def test_pdf_job_reports_converted_pages(mock_process, server_dirs, tmp_path):
+    pdf_path = tmp_path / "report.pdf"
+    write_sample_pdf(pdf_path, "Page text", pages=4)
+    release = threading.Event()
+
+    def _convert(input_path, request_output_dir):
+        advance_pages(1)
+        release.wait(5)
+        md_path = request_output_dir / "processed_document.md"
+        md_path.write_text("# Converted")
+        return md_path
+
+    mock_process.side_effect = _convert
+
+    with TestClient(app) as client:
+        job_id = _submit(client, "report.pdf", pdf_path.read_bytes())["job_id"]
+        running = _wait_for_status(client, job_id, {"running"})
+        deadline = time.monotonic() + 5
+        while running["progress"]["pages_done"] != 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+            running = client.get(f"/jobs/{job_id}").json()
+
+        assert running["progress"]["pages_done"] == 1
+        assert running["progress"]["pages_total"] == 4
+        assert running["progress"]["percent"] == 25.0
+
+        release.set()
+        done = _wait_for_status(client, job_id, {"succeeded", "failed"})
+
+    assert done["status"] == "succeeded"
+    assert done["progress"]["pages_done"] == 4
+    assert done["progress"]["percent"] == 100.0
+
+
+@patch("docling_lib.server.process_pdf", return_value=None)
+def test_failed_job(mock_process, server_dirs):
+    _, output_dir = server_dirs
+    with TestClient(app) as client:
+        job = _submit(client, "slides.pptx")
+        done = _wait_for_status(client, job["job_id"], {"succeeded", "failed"})
+
+    assert done["status"] == "failed"
+    assert done["error"] == "Conversion failed."
+    assert done["result"] is None
+    # Nothing to download: the empty output dir is removed
+    assert not (output_dir / job["job_id"]).exists()
+
+
+@patch("docling_lib.server.process_pdf")
+def test_full_job_queue_rejects_uploads_and_shutdown_removes_queued_ones(
+    mock_process, server_dirs, monkeypatch
+):
+    upload_dir, output_dir = server_dirs
+    monkeypatch.setattr(docling_lib.server, "JOB_QUEUE_SIZE", 1)
+    release = threading.Event()
+
+    def _convert(input_path, request_output_dir):
+        release.wait(5)
+        md_path = request_output_dir / "processed_document.md"
+        md_path.write_text("# Converted")
+        return md_path
+
+    mock_process.side_effect = _convert
+
+    with TestClient(app) as client:
+        running = _submit(client)
+        _wait_for_status(client, running["job_id"], {"running"})
+        queued = _submit(client)
+
+        rejected = client.post(
+            "/jobs",
+            files={"file": ("doc.docx", b"content", "application/octet-stream")},
+        )
+        assert rejected.status_code == 429
+        assert int(rejected.headers["Retry-After"]) >= 1
+        # The rejected upload was never stored
+        assert len(list(upload_dir.iterdir())) == 2
+
+        # Lets the running job finish while the server shuts down
+        threading.Timer(0.2, release.set).start()
+
+    assert mock_process.call_count == 1
+    assert list(upload_dir.iterdir()) == []
+    assert not (output_dir / queued["job_id"]).exists()
+
+
+@patch("docling_lib.server.process_pdf")
+def test_memory_budget_is_checked_when_the_job_starts(
+    mock_process, server_dirs, monkeypatch
+):
+    upload_dir, _ = server_dirs
+    monkeypatch.setattr(
+        docling_lib.server._memory_budget, "has_headroom", lambda: False
+    )
+    monkeypatch.setattr(docling_lib.server, "MEMORY_BUDGET_WAIT", 0)
+
+    with TestClient(app) as client:
+        job = _submit(client)
+        done = _wait_for_status(client, job["job_id"], {"succeeded", "failed"})
+
+    assert done["status"] == "failed"
+    assert done["error"] == "The server is low on memory. Please retry later."
+    mock_process.assert_not_called()
+    assert list(upload_dir.iterdir()) == []
+
+
+def test_job_validation_and_unknown_job(server_dirs):
+    with TestClient(app) as client:
+        rejected = client.post(
+            "/jobs", files={"file": ("notes.txt", b"text", "text/plain")}
+        )
+        missing = client.get("/jobs/0123456789abcdef")
+
+    assert rejected.status_code == 400
+    assert missing.status_code == 404
+
+
+def test_job_manager_forgets_oldest_finished_jobs(tmp_path):
+    async def _runner(job):
+        return {"markdown_file": job.filename}
+
+    async def _run():
+        manager = JobManager(_runner, workers=1, history_size=2, max_queued=10)
+        manager.start()
+        jobs = [
+            manager.submit(
+                Job(str(i), f"{i}.pdf", "pdf", tmp_path / f"{i}.pdf", tmp_path)
+            )
+            for i in range(4)
+        ]
+        while not all(job.done for job in jobs):
+            await asyncio.sleep(0.01)
+        await manager.stop()
+        return manager
+
+    manager = asyncio.run(_run())
+
+    assert manager.get("0") is None and manager.get("1") is None
+    assert manager.get("3").result == {"markdown_file": "3.pdf"}
+    assert manager.counts()["succeeded"] == 2
@@ -0,0 +1,99 @@
+import time
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+import docling_lib.server
+from docling_lib.memory import MemoryBudget, PeakRssSampler, rss_bytes
+from docling_lib.server import app
+
+client = TestClient(app)
+
+
+def _deferred_count() -> float:
+    return sum(value for _, _, value in docling_lib.server.MEMORY_DEFERRED.samples())
+
+
+def test_rss_bytes_of_current_process():
+    usage = rss_bytes()
+    assert usage is not None and usage > 1024 * 1024
+
+
+def test_peak_sampler_keeps_the_maximum():
+    readings = iter([100, 300, 200])
+
+    def _measure():
+        return next(readings, 150)
+
+    with PeakRssSampler(measure=_measure, interval=0.001) as memory:
+        time.sleep(0.05)
+
+    assert memory.start_bytes == 100
+    assert memory.peak_bytes == 300
+
+
+def test_peak_sampler_without_measurement():
+    with PeakRssSampler(measure=lambda: None) as memory:
+        pass
+    assert memory.peak_bytes is None
+
+
+def test_memory_budget():
+    assert MemoryBudget(0, measure=lambda: 10**12).has_headroom()
+    assert MemoryBudget(100, measure=lambda: 50).has_headroom()
+    assert not MemoryBudget(100, measure=lambda: 150).has_headroom()
+    # Usage that cannot be measured never blocks conversions
+    assert MemoryBudget(100, measure=lambda: None).has_headroom()
+
+
+@patch("docling_lib.server.process_pdf")
+def test_convert_rejected_over_memory_budget(mock_process, tmp_path, monkeypatch):
+    monkeypatch.setattr(docling_lib.server, "UPLOAD_DIR", tmp_path)
+    monkeypatch.setattr(docling_lib.server, "MEMORY_BUDGET_WAIT", 0)
+    monkeypatch.setattr(
+        docling_lib.server, "_memory_budget", MemoryBudget(100, measure=lambda: 150)
+    )
+
+    response = client.post(
+        "/convert/", files={"file": ("a.docx", b"docx", "application/octet-stream")}
+    )
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    mock_process.assert_not_called()
+    # The upload was not stored
+    assert list(tmp_path.iterdir()) == []
+
+
+@patch("docling_lib.server.process_pdf")
+def test_convert_deferred_until_memory_is_freed(mock_process, tmp_path, monkeypatch):
+    upload_dir = tmp_path / "uploads"
+    output_dir = tmp_path / "output"
+    upload_dir.mkdir()
+    output_dir.mkdir()
+    monkeypatch.setattr(docling_lib.server, "UPLOAD_DIR", upload_dir)
+    monkeypatch.setattr(docling_lib.server, "OUTPUT_DIR", output_dir)
+    monkeypatch.setattr(docling_lib.server, "_MEMORY_POLL_SECONDS", 0)
+    # Over budget for the first checks, then below it
+    readings = iter([150, 150, 150, 150])
+    monkeypatch.setattr(
+        docling_lib.server,
+        "_memory_budget",
+        MemoryBudget(100, measure=lambda: next(readings, 50)),
+    )
+
+    def _convert(input_path, request_output_dir):
+        md_path = request_output_dir / "processed_document.md"
+        md_path.write_text("# Doc")
+        return md_path
+
+    mock_process.side_effect = _convert
+    deferred = _deferred_count()
+
+    response = client.post(
+        "/convert/", files={"file": ("a.docx", b"docx", "application/octet-stream")}
+    )
+
+    assert response.status_code == 200
+    assert mock_process.call_count == 1
+    assert _deferred_count() == deferred + 1
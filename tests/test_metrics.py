@@ -0,0 +1,127 @@
+import re
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from docling_lib.metrics import Counter, Gauge, Histogram, Registry
+from docling_lib.pages import write_sample_pdf
+from docling_lib.server import app
+
+client = TestClient(app)
+
+_SAMPLE_RE = re.compile(r"^(\w+(?:\{.*\})?) (\S+)$")
+
+
+def _scrape() -> dict[str, float]:
+    """Scrapes /metrics and returns {'name{labels}': value}."""
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = {}
+    for line in response.text.splitlines():
+        if line.startswith("#") or not line:
+            continue
+        match = _SAMPLE_RE.match(line)
+        assert match, f"Malformed sample line: {line!r}"
+        samples[match.group(1)] = float(match.group(2))
+    return samples
+
+
+def _delta(before: dict, after: dict, key: str) -> float:
+    return after.get(key, 0.0) - before.get(key, 0.0)
+
+
+def test_registry_renders_text_format():
+    registry = Registry()
+    counter = registry.register(Counter("jobs_total", "Jobs.", ["kind"]))
+    gauge = registry.register(Gauge("running", "Running jobs."))
+    histogram = registry.register(
+        Histogram("latency_seconds", "Latency.", buckets=(1, 5))
+    )
+
+    counter.inc(kind='say "hi"\n')
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+    histogram.observe(0.5)
+    histogram.observe(3)
+    histogram.observe(10)
+
+    text = registry.render()
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{kind="say \\"hi\\"\\n"} 1' in text
+    assert "running 1" in text
+    assert "# TYPE latency_seconds histogram" in text
+    # Buckets are cumulative
+    assert 'latency_seconds_bucket{le="1"} 1' in text
+    assert 'latency_seconds_bucket{le="5"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "latency_seconds_sum 13.5" in text
+    assert "latency_seconds_count 3" in text
+
+
+def test_metric_rejects_wrong_labels():
+    counter = Counter("jobs_total", "Jobs.", ["kind"])
+    with pytest.raises(ValueError):
+        counter.inc()
+    with pytest.raises(ValueError):
+        counter.inc(-1, kind="a")
+
+
+@patch("docling_lib.server.process_pdf")
+def test_metrics_after_conversion(mock_process, server_dirs, tmp_path):
+    def _convert(input_path, request_output_dir):
+        md_path = request_output_dir / "processed_document.md"
+        md_path.write_text("# Sample")
+        return md_path
+
+    mock_process.side_effect = _convert
+    pdf_path = tmp_path / "sample.pdf"
+    write_sample_pdf(pdf_path, "Metrics sample")
+    upload = pdf_path.read_bytes()
+
+    before = _scrape()
+    response = client.post(
+        "/convert/", files={"file": ("sample.pdf", upload, "application/pdf")}
+    )
+    assert response.status_code == 200
+    after = _scrape()
+
+    pdf = '{file_type="pdf"}'
+    assert (
+        _delta(
+            before, after, 'docling_conversions_total{file_type="pdf",status="success"}'
+        )
+        == 1
+    )
+    assert _delta(before, after, f"docling_conversion_duration_seconds_count{pdf}") == 1
+    assert _delta(before, after, f"docling_conversion_pages_per_second_count{pdf}") == 1
+    assert _delta(before, after, f"docling_upload_size_bytes_sum{pdf}") == len(upload)
+    assert after["docling_conversions_in_progress"] == 0
+
+
+@patch("docling_lib.server.process_pdf", return_value=None)
+def test_metrics_count_errors(mock_process, server_dirs):
+    before = _scrape()
+    rejected = client.post(
+        "/convert/", files={"file": ("notes.txt", b"text", "text/plain")}
+    )
+    failed = client.post(
+        "/convert/",
+        files={"file": ("slides.pptx", b"pptx", "application/octet-stream")},
+    )
+    after = _scrape()
+
+    assert rejected.status_code == 400
+    assert failed.status_code == 500
+    assert _delta(before, after, 'docling_errors_total{status_code="400"}') == 1
+    assert _delta(before, after, 'docling_errors_total{status_code="500"}') == 1
+    assert (
+        _delta(
+            before,
+            after,
+            'docling_conversions_total{file_type="pptx",status="failure"}',
+        )
+        == 1
+    )
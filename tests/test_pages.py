@@ -0,0 +1,124 @@
+import ctypes
+
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+import pytest
+
+from docling_lib.pages import (
+    count_pages,
+    page_fingerprints,
+    page_ranges,
+    page_runs,
+    text_coverage,
+    write_sample_pdf,
+)
+
+
+@pytest.mark.parametrize(
+    "page_count, shard_pages, expected",
+    [
+        (10, 10, [(1, 10)]),
+        (25, 10, [(1, 10), (11, 20), (21, 25)]),
+        (3, 1, [(1, 1), (2, 2), (3, 3)]),
+        (0, 5, []),
+    ],
+)
+def test_page_ranges(page_count, shard_pages, expected):
+    assert page_ranges(page_count, shard_pages) == expected
+
+
+def test_page_ranges_rejects_non_positive_shard():
+    with pytest.raises(ValueError):
+        page_ranges(10, 0)
+
+
+def test_count_pages(tmp_path):
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(7):
+        pdf.new_page(200, 200)
+    pdf_path = tmp_path / "seven.pdf"
+    pdf.save(pdf_path)
+    pdf.close()
+
+    assert count_pages(pdf_path) == 7
+
+
+@pytest.mark.parametrize(
+    "flags, max_pages, expected",
+    [
+        ([], 0, []),
+        ([True, True, False], 0, [((1, 2), True), ((3, 3), False)]),
+        (
+            [False, False, False, True, False],
+            2,
+            [((1, 2), False), ((3, 3), False), ((4, 4), True), ((5, 5), False)],
+        ),
+    ],
+)
+def test_page_runs(flags, max_pages, expected):
+    assert page_runs(flags, max_pages) == expected
+
+
+def _add_text(pdf, page, text):
+    obj = pdfium_c.FPDFPageObj_NewTextObj(pdf.raw, b"Helvetica", 24)
+    buffer = ctypes.create_string_buffer((text + "\x00").encode("utf-16-le"))
+    pdfium_c.FPDFText_SetText(
+        obj, ctypes.cast(buffer, ctypes.POINTER(pdfium_c.FPDF_WCHAR))
+    )
+    pdfium_c.FPDFPageObj_Transform(obj, 1, 0, 0, 1, 20, 100)
+    pdfium_c.FPDFPage_InsertObject(page.raw, obj)
+    pdfium_c.FPDFPage_GenerateContent(page.raw)
+
+
+def test_text_coverage(tmp_path):
+    pdf = pdfium.PdfDocument.new()
+    _add_text(pdf, pdf.new_page(200, 200), "A born-digital line")
+    pdf.new_page(200, 200)  # No text layer, like a scanned page
+    pdf_path = tmp_path / "mixed.pdf"
+    pdf.save(pdf_path)
+    pdf.close()
+
+    digital, scanned = text_coverage(pdf_path)
+
+    assert 0.0 < digital < 1.0
+    assert scanned == 0.0
+
+
+def _text_pdf(path, texts):
+    pdf = pdfium.PdfDocument.new()
+    for text in texts:
+        _add_text(pdf, pdf.new_page(200, 200), text)
+    pdf.save(path)
+    pdf.close()
+    return path
+
+
+def test_page_fingerprints_follow_page_content(tmp_path):
+    first = page_fingerprints(_text_pdf(tmp_path / "v1.pdf", ["one", "two", "three"]))
+    second = page_fingerprints(
+        _text_pdf(tmp_path / "v2.pdf", ["preface", "one", "TWO", "three"])
+    )
+
+    assert len(set(first)) == 3
+    # Unchanged pages keep their fingerprint even when they move
+    assert second[1] == first[0]
+    assert second[3] == first[2]
+    assert second[2] != first[1]
+
+
+def test_write_sample_pdf(tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+
+    write_sample_pdf(pdf_path, "Warm-up")
+
+    assert count_pages(pdf_path) == 1
+    assert text_coverage(pdf_path)[0] > 0
+
+
+def test_write_sample_pdf_with_several_pages(tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+
+    write_sample_pdf(pdf_path, "First line\nSecond line", pages=3)
+
+    assert count_pages(pdf_path) == 3
+    assert all(coverage > 0 for coverage in text_coverage(pdf_path))
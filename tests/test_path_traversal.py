@@ -26,7 +26,7 @@ def test_save_markdown_path_traversal_vulnerability(tmp_path):
     # Mock EnhancedMarkdownSerializer to avoid real serialization
     with patch("docling_lib.converter.EnhancedMarkdownSerializer") as MockSerializer:
         mock_instance = MockSerializer.return_value
-        mock_instance.serialize.return_value.text = "# Mock Markdown Content"
+        mock_instance.iter_chunks.return_value = iter(["# Mock Markdown Content"])
 
         output_dir = tmp_path / "output"
         output_dir.mkdir()
@@ -63,7 +63,7 @@ def test_save_markdown_image_dir_traversal(tmp_path):
     doc.name = "test_doc"
 
     with patch("docling_lib.converter.EnhancedMarkdownSerializer") as MockSerializer:
-        MockSerializer.return_value.serialize.return_value.text = "content"
+        MockSerializer.return_value.iter_chunks.return_value = iter(["content"])
 
         output_dir = tmp_path / "output"
         output_dir.mkdir()
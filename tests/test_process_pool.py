@@ -0,0 +1,163 @@
+import os
+import sys
+from concurrent.futures import Future
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
+from fastapi.testclient import TestClient
+
+import docling_lib.server
+from docling_lib import process_pool
+from docling_lib.converter import DocumentConversionOptions
+from docling_lib.process_pool import ProcessPoolConverter
+
+
+@patch("docling_lib.process_pool.ProcessPoolExecutor")
+def test_pool_configures_spawned_preloading_workers(MockExecutor):
+    options = DocumentConversionOptions(do_ocr=False)
+
+    ProcessPoolConverter(
+        workers=3, max_tasks_per_child=10, preload_options=options, threads_per_worker=2
+    )
+
+    kwargs = MockExecutor.call_args.kwargs
+    assert kwargs["max_workers"] == 3
+    assert kwargs["max_tasks_per_child"] == 10
+    assert kwargs["mp_context"].get_start_method() == "spawn"
+    assert kwargs["initializer"] is process_pool._init_worker
+    preload_options, threads, started = kwargs["initargs"]
+    assert (preload_options, threads, started.value) == (options, 2, 0)
+
+
+@patch("docling_lib.process_pool.ProcessPoolExecutor")
+def test_pool_starts_every_worker_and_waits_for_them(MockExecutor):
+    startup = MagicMock()
+    MockExecutor.return_value.submit.return_value = startup
+
+    ProcessPoolConverter(workers=3)
+
+    assert (
+        MockExecutor.return_value.submit.call_args_list
+        == [call(process_pool._await_workers, 3)] * 3
+    )
+    assert startup.result.call_count == 3
+
+
+@patch("docling_lib.process_pool.ProcessPoolExecutor")
+def test_pool_can_start_without_waiting(MockExecutor):
+    startup = MagicMock()
+    MockExecutor.return_value.submit.return_value = startup
+
+    pool = ProcessPoolConverter(workers=2, wait=False)
+
+    startup.result.assert_not_called()
+    pool.wait_until_started(timeout=5)
+    assert startup.result.call_count == 2
+
+
+@patch("docling_lib.process_pool.ProcessPoolExecutor")
+def test_pool_shares_the_cores_among_the_workers(MockExecutor, monkeypatch):
+    monkeypatch.setattr(process_pool.os, "cpu_count", lambda: 8)
+
+    assert ProcessPoolConverter(workers=3).threads_per_worker == 2
+    assert ProcessPoolConverter(workers=16).threads_per_worker == 1
+
+
+@patch("docling_lib.process_pool.ProcessPoolExecutor")
+def test_pool_without_recycling(MockExecutor):
+    ProcessPoolConverter(workers=1, max_tasks_per_child=0)
+    assert MockExecutor.call_args.kwargs["max_tasks_per_child"] is None
+
+
+@patch("docling_lib.process_pool.ProcessPoolExecutor")
+def test_submit_sends_paths_and_options(MockExecutor):
+    pool = ProcessPoolConverter(workers=1)
+    options = DocumentConversionOptions(table_format="markdown")
+
+    pool.submit(Path("in.pdf"), Path("out"), options)
+
+    assert MockExecutor.return_value.submit.call_args_list[1:] == [
+        call(process_pool._run_job, Path("in.pdf"), Path("out"), options)
+    ]
+
+
+@patch("docling_lib.process_pool.process_pdf")
+def test_run_job_calls_process_pdf(mock_process_pdf):
+    mock_process_pdf.return_value = Path("out/processed_document.md")
+
+    result = process_pool._run_job(Path("in.pdf"), Path("out"), None)
+
+    assert result == Path("out/processed_document.md")
+    mock_process_pdf.assert_called_once_with(Path("in.pdf"), Path("out"), options=None)
+
+
+@patch("docling_lib.process_pool._limit_threads")
+@patch("docling_lib.converter._converter_pool")
+def test_init_worker_preloads_converter(mock_pool, mock_limit_threads, monkeypatch):
+    converter = MagicMock()
+    mock_pool.checkout.return_value.__enter__.return_value = converter
+    options = DocumentConversionOptions()
+    started = MagicMock(value=0)
+    monkeypatch.setattr(process_pool, "_started_workers", None)
+
+    process_pool._init_worker(options, 2, started)
+
+    mock_limit_threads.assert_called_once_with(2)
+    mock_pool.checkout.assert_called_once_with(options)
+    converter.preload.assert_called_once()
+    assert started.value == 1
+    assert process_pool._started_workers is started
+
+
+def test_limit_threads_caps_torch_and_openmp(monkeypatch):
+    torch = MagicMock()
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    for name in process_pool._THREAD_ENV_VARS:
+        monkeypatch.setenv(name, "64")
+
+    process_pool._limit_threads(3)
+
+    assert {os.environ[name] for name in process_pool._THREAD_ENV_VARS} == {"3"}
+    torch.set_num_threads.assert_called_once_with(3)
+
+
+def test_await_workers_returns_once_all_have_started(monkeypatch):
+    started = MagicMock(value=1)
+    monkeypatch.setattr(process_pool, "_started_workers", started)
+
+    def _sleep(seconds):
+        started.value += 1
+
+    monkeypatch.setattr(process_pool.time, "sleep", _sleep)
+
+    assert process_pool._await_workers(3) == os.getpid()
+    assert started.value == 3
+
+
+def test_server_uses_process_backend(tmp_path, monkeypatch):
+    upload_dir = tmp_path / "uploads"
+    output_dir = tmp_path / "output"
+    upload_dir.mkdir()
+    output_dir.mkdir()
+    monkeypatch.setattr(docling_lib.server, "UPLOAD_DIR", upload_dir)
+    monkeypatch.setattr(docling_lib.server, "OUTPUT_DIR", output_dir)
+    monkeypatch.setattr(docling_lib.server, "CONVERSION_BACKEND", "process")
+
+    def _submit(input_path, request_output_dir, options=None):
+        res = request_output_dir / "processed_document.md"
+        res.write_text("# From worker")
+        future = Future()
+        future.set_result(res)
+        return future
+
+    backend = MagicMock()
+    backend.submit.side_effect = _submit
+    monkeypatch.setattr(docling_lib.server, "_process_backend", backend)
+
+    client = TestClient(docling_lib.server.app)
+    files = {"file": ("doc.pdf", b"%PDF-1.4", "application/pdf")}
+    response = client.post("/convert/", files=files)
+
+    assert response.status_code == 200
+    assert response.json()["markdown_file"] == "processed_document.md"
+    backend.submit.assert_called_once()
@@ -0,0 +1,104 @@
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+import docling_lib.server
+from docling_lib.server import app
+
+
+def _wait_until_settled(client, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    response = client.get("/ready")
+    while response.json()["status"] == "warming_up" and time.monotonic() < deadline:
+        time.sleep(0.01)
+        response = client.get("/ready")
+    return response
+
+
+@patch("docling_lib.server.process_pdf")
+def test_ready_after_warm_up(mock_process, server_dirs):
+    upload_dir, output_dir = server_dirs
+    seen = []
+
+    def _convert(input_path, request_output_dir, options):
+        # The warm-up input is a real PDF and must bypass the cache
+        seen.append((input_path.read_bytes()[:5], options.use_cache))
+        request_output_dir.mkdir(parents=True)
+        md_path = request_output_dir / "processed_document.md"
+        md_path.write_text("Docling warm-up document")
+        return md_path
+
+    mock_process.side_effect = _convert
+
+    with TestClient(app) as client:
+        response = _wait_until_settled(client)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert response.json()["warmup_seconds"] >= 0
+    assert seen == [(b"%PDF-", False)]
+    # The warm-up files are removed afterwards
+    assert list(upload_dir.iterdir()) == []
+    assert list(output_dir.iterdir()) == []
+
+
+@patch("docling_lib.server.process_pdf", return_value=None)
+def test_not_ready_when_warm_up_fails(mock_process, server_dirs):
+    with TestClient(app) as client:
+        response = _wait_until_settled(client)
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "failed"
+
+
+@patch("docling_lib.server.process_pdf")
+def test_ready_at_once_without_warm_up(mock_process, server_dirs, monkeypatch):
+    monkeypatch.setattr(docling_lib.server, "WARMUP_ENABLED", False)
+
+    with TestClient(app) as client:
+        response = client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready", "warmup_seconds": None}
+    mock_process.assert_not_called()
+
+
+def test_ready_waits_for_every_process_worker(server_dirs, monkeypatch):
+    monkeypatch.setattr(docling_lib.server, "CONVERSION_BACKEND", "process")
+    monkeypatch.setattr(docling_lib.server, "WARMUP_ENABLED", False)
+    startup = [Future(), Future()]
+    monkeypatch.setattr(
+        docling_lib.server, "_process_backend", MagicMock(startup=startup)
+    )
+
+    with TestClient(app) as client:
+        assert client.get("/").status_code == 200
+        startup[0].set_result(1)
+        response = _wait_until_settled(client, timeout=0.2)
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+
+        startup[1].set_result(2)
+        response = _wait_until_settled(client)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
+def test_not_ready_when_a_process_worker_fails_to_start(server_dirs, monkeypatch):
+    monkeypatch.setattr(docling_lib.server, "CONVERSION_BACKEND", "process")
+    monkeypatch.setattr(docling_lib.server, "WARMUP_ENABLED", False)
+    startup = [Future()]
+    startup[0].set_exception(BrokenProcessPool("model download failed"))
+    monkeypatch.setattr(
+        docling_lib.server, "_process_backend", MagicMock(startup=startup)
+    )
+
+    with TestClient(app) as client:
+        response = _wait_until_settled(client)
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "failed"
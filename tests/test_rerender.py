@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+from docling_core.types.doc import DoclingDocument, ImageRef, TableCell, TableData
+from PIL import Image
+
+from docling_lib.config import DOCUMENT_JSON_NAME
+from docling_lib.converter import DocumentConversionOptions, _save_document, rerender
+
+
+def _document() -> DoclingDocument:
+    doc = DoclingDocument(name="Doc")
+    doc.add_text(label="text", text="Hello")
+    table = TableData(num_rows=2, num_cols=1)
+    for row, text in enumerate(["Header", "Value"]):
+        table.table_cells.append(
+            TableCell(
+                text=text,
+                start_row_offset_idx=row,
+                end_row_offset_idx=row + 1,
+                start_col_offset_idx=0,
+                end_col_offset_idx=1,
+                column_header=row == 0,
+            )
+        )
+    doc.add_table(data=table)
+    doc.add_picture(image=ImageRef.from_pil(Image.new("RGB", (16, 16), "red"), dpi=72))
+    return doc
+
+
+def _convert(output_dir, **options):
+    render = DocumentConversionOptions(save_document_json=True, **options).render
+    return _save_document(_document(), output_dir, render)
+
+
+def test_save_document_json_references_exported_images(tmp_path):
+    _convert(tmp_path)
+
+    stored = json.loads((tmp_path / DOCUMENT_JSON_NAME).read_text(encoding="utf-8"))
+    [picture] = stored["pictures"]
+    assert picture["image"]["uri"].startswith("images/")
+    assert (tmp_path / picture["image"]["uri"]).is_file()
+
+
+def test_rerender_changes_render_options_without_touching_the_json(
+    tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    _convert(tmp_path)
+    stored = (tmp_path / DOCUMENT_JSON_NAME).read_bytes()
+
+    md_path = rerender(
+        Path("."),
+        DocumentConversionOptions(table_format="markdown", image_format="webp"),
+    )
+
+    content = md_path.read_text(encoding="utf-8")
+    assert "<table>" not in content
+    assert "| Header" in content
+    assert "Hello" in content
+    assert list((tmp_path / "images").glob("*.webp"))
+    assert (tmp_path / DOCUMENT_JSON_NAME).read_bytes() == stored
+
+
+def test_rerender_without_stored_document_fails(tmp_path, caplog, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert rerender(Path(".")) is None
+    assert "No stored document" in caplog.text
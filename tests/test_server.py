@@ -73,6 +73,30 @@ def test_convert_file(mock_process, tmp_path, monkeypatch):
     assert download_res.text == "# Mocked Results"
 
 
+@patch("docling_lib.server.process_pdf")
+def test_convert_file_text_only(mock_process, tmp_path, monkeypatch):
+    upload_dir = tmp_path / "uploads"
+    output_dir = tmp_path / "output"
+    upload_dir.mkdir()
+    output_dir.mkdir()
+
+    monkeypatch.setattr(docling_lib.server, "UPLOAD_DIR", upload_dir)
+    monkeypatch.setattr(docling_lib.server, "OUTPUT_DIR", output_dir)
+
+    def side_effect(input_path, request_output_dir, options):
+        res = request_output_dir / "processed_document.md"
+        res.write_text("<!-- image -->")
+        return res
+
+    mock_process.side_effect = side_effect
+
+    files = {"file": ("test.pdf", b"%PDF-1.4", "application/pdf")}
+    response = client.post("/convert/?text_only=true", files=files)
+
+    assert response.status_code == 200
+    assert mock_process.call_args.kwargs["options"].text_only is True
+
+
 @patch("docling_lib.server.process_pdf")
 def test_convert_file_failure(mock_process, tmp_path, monkeypatch):
     upload_dir = tmp_path / "uploads"
@@ -1,7 +1,7 @@
 import pytest
 from fastapi import HTTPException
 import docling_lib.server
-from docling_lib.server import _validate_extension, _create_output_dir
+from docling_lib.server import _anchor_in_output_dir, _validate_extension, _create_output_dir
 
 @pytest.mark.parametrize("filename, expected_ext", [
     ("test.pdf", ".pdf"),
@@ -46,3 +46,21 @@ async def test_create_output_dir(tmp_path, monkeypatch):
     assert request_output_dir == tmp_path / request_id
     assert request_output_dir.exists()
     assert request_output_dir.is_dir()
+
+@pytest.mark.parametrize("request_id, filename, expected", [
+    ("abc", None, "abc"),
+    ("abc", "doc.md", "abc/doc.md"),
+    ("abc", "images/fig.png", "abc/images/fig.png"),
+    (".", None, None),
+    ("..", None, None),
+    ("..", "abc/doc.md", None),
+    ("abc", "../other/doc.md", None),
+    ("abc", "/etc/passwd", None),
+])
+def test_anchor_in_output_dir(tmp_path, monkeypatch, request_id, filename, expected):
+    """Download paths must stay inside a request directory below OUTPUT_DIR."""
+    monkeypatch.setattr(docling_lib.server, "OUTPUT_DIR", tmp_path)
+
+    anchored = _anchor_in_output_dir(request_id, filename)
+
+    assert anchored == (None if expected is None else tmp_path.resolve() / expected)
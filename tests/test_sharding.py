@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock, patch
+
+from docling_core.types.doc import DocItemLabel, DoclingDocument
+
+from docling_lib.converter import (
+    DocumentConversionOptions,
+    PDFConverter,
+    _merge_documents,
+    process_pdf,
+)
+from docling_lib.progress import ConversionProgress, collect_progress
+
+
+def _shard_doc(page_range):
+    doc = MagicMock(spec=DoclingDocument)
+    doc.name = "big"
+    doc.page_range = page_range
+    return doc
+
+
+@patch("docling_lib.converter._save_document")
+@patch("docling_lib.converter._merge_documents")
+@patch("docling_lib.converter.count_pages", return_value=25)
+@patch("docling_lib.converter.DocumentConverter")
+def test_process_pdf_converts_shards_and_merges_in_order(
+    MockDocumentConverter, mock_count, mock_merge, mock_save, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    pdf_path = tmp_path / "big.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF")
+
+    MockDocumentConverter.return_value.convert.side_effect = lambda path, page_range: (
+        MagicMock(document=_shard_doc(page_range))
+    )
+    mock_save.return_value = tmp_path / "out" / "processed_document.md"
+
+    options = DocumentConversionOptions(shard_pages=10, shard_workers=3)
+    result = process_pdf(pdf_path, tmp_path / "out", options=options)
+
+    assert result == tmp_path / "out" / "processed_document.md"
+    merged_docs = mock_merge.call_args.args[0]
+    assert [d.page_range for d in merged_docs] == [(1, 10), (11, 20), (21, 25)]
+    mock_save.assert_called_once_with(
+        mock_merge.return_value, tmp_path / "out", options.render
+    )
+
+
+@patch("docling_lib.converter._save_document")
+@patch("docling_lib.converter._merge_documents")
+@patch("docling_lib.converter.count_pages", return_value=25)
+@patch("docling_lib.converter.DocumentConverter")
+def test_shards_report_converted_pages(
+    MockDocumentConverter, mock_count, mock_merge, mock_save, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    pdf_path = tmp_path / "big.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF")
+    progress = ConversionProgress()
+    done_before_shard = []
+
+    def _convert(path, page_range):
+        done_before_shard.append(progress.pages_done)
+        return MagicMock(document=_shard_doc(page_range))
+
+    MockDocumentConverter.return_value.convert.side_effect = _convert
+    mock_save.return_value = tmp_path / "out" / "processed_document.md"
+
+    options = DocumentConversionOptions(shard_pages=10, shard_workers=1)
+    with collect_progress(progress):
+        process_pdf(pdf_path, tmp_path / "out", options=options)
+
+    # Worker threads report into the progress of the calling conversion
+    assert done_before_shard == [0, 10, 20]
+    assert progress.pages_done == 25
+
+
+@patch("docling_lib.converter.count_pages", return_value=5)
+@patch("docling_lib.converter.DocumentConverter")
+def test_short_pdf_is_not_sharded(MockDocumentConverter, mock_count, tmp_path):
+    pdf_path = tmp_path / "short.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF")
+    converter = PDFConverter(DocumentConversionOptions(shard_pages=10))
+
+    with patch.object(converter, "_save_markdown") as mock_save:
+        converter.convert(pdf_path, tmp_path)
+
+    MockDocumentConverter.return_value.convert.assert_called_once_with(pdf_path)
+    mock_save.assert_called_once()
+
+
+@patch("docling_lib.converter.count_pages")
+@patch("docling_lib.converter.DocumentConverter")
+def test_non_pdf_inputs_are_never_sharded(MockDocumentConverter, mock_count, tmp_path):
+    docx_path = tmp_path / "doc.docx"
+    docx_path.write_bytes(b"dummy")
+    converter = PDFConverter(DocumentConversionOptions(shard_pages=1))
+
+    with patch.object(converter, "_save_markdown"):
+        converter.convert(docx_path, tmp_path)
+
+    mock_count.assert_not_called()
+
+
+def test_merge_documents_keeps_page_order_and_name():
+    first = DoclingDocument(name="report")
+    first.add_text(label=DocItemLabel.TEXT, text="page one")
+    second = DoclingDocument(name="report")
+    second.add_text(label=DocItemLabel.TEXT, text="page two")
+
+    merged = _merge_documents([first, second])
+
+    assert merged.name == "report"
+    markdown = merged.export_to_markdown()
+    assert markdown.index("page one") < markdown.index("page two")
+    assert [t.self_ref for t in merged.texts] == ["#/texts/0", "#/texts/1"]
+
+
+def test_sharding_is_part_of_the_output_signature():
+    assert (
+        DocumentConversionOptions(shard_pages=0).output_signature()
+        != DocumentConversionOptions(shard_pages=50).output_signature()
+    )
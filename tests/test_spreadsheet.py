@@ -0,0 +1,322 @@
+import io
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+from docling_lib.spreadsheet import write_spreadsheet_markdown
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+
+
+def _write(tmp_path, build):
+    wb = Workbook()
+    build(wb)
+    path = tmp_path / "book.xlsx"
+    wb.save(path)
+    return path
+
+
+def _convert(path, table_format="html"):
+    out = io.StringIO()
+    count = write_spreadsheet_markdown(path, out, table_format)
+    return count, out.getvalue()
+
+
+def test_single_table_html(tmp_path):
+    def build(wb):
+        ws = wb.active
+        ws.append(["ID", "Name"])
+        ws.append([1, "Alice & Bob"])
+
+    count, text = _convert(_write(tmp_path, build))
+
+    assert count == 1
+    assert text == (
+        "<table><tbody><tr><th>ID</th><th>Name</th></tr>"
+        "<tr><td>1</td><td>Alice &amp; Bob</td></tr></tbody></table>"
+    )
+
+
+def test_single_table_markdown(tmp_path):
+    def build(wb):
+        ws = wb.active
+        ws.append(["ID", "Name"])
+        ws.append([1, "a|b"])
+
+    _, text = _convert(_write(tmp_path, build), "markdown")
+
+    assert text == "| ID | Name |\n|---|---|\n| 1 | a\\|b |"
+
+
+def test_tables_are_split_and_kept_in_start_order(tmp_path):
+    def build(wb):
+        ws = wb.active
+        # Left table runs 3 rows, right table only 1: the right one closes
+        # first but must still be written after the left one.
+        ws["A1"], ws["B1"], ws["D1"] = "L1", "L2", "R1"
+        ws["A2"], ws["B2"] = "a", "b"
+        ws["A3"], ws["B3"] = "c", "d"
+        # Separated by an empty row
+        ws["A5"] = "Below"
+        second = wb.create_sheet("second")
+        second["B2"] = "Other sheet"
+
+    count, text = _convert(_write(tmp_path, build))
+
+    tables = text.split("\n\n")
+    assert count == 4
+    assert tables[0].startswith("<table><tbody><tr><th>L1</th><th>L2</th></tr>")
+    assert "<tr><td>c</td><td>d</td></tr>" in tables[0]
+    assert tables[1] == "<table><tbody><tr><th>R1</th></tr></tbody></table>"
+    assert "Below" in tables[2]
+    assert "Other sheet" in tables[3]
+
+
+@pytest.mark.parametrize(
+    "table_format, expected",
+    [
+        (
+            "html",
+            '<table><tbody><tr><th colspan="2">Merged</th><th>Plain</th></tr>'
+            "<tr><td>a</td><td>b</td><td>c</td></tr></tbody></table>",
+        ),
+        (
+            "markdown",
+            "| Merged | Merged | Plain |\n|---|---|---|\n| a | b | c |",
+        ),
+    ],
+)
+def test_merged_cells(tmp_path, table_format, expected):
+    def build(wb):
+        ws = wb.active
+        ws["A1"], ws["C1"] = "Merged", "Plain"
+        ws.merge_cells("A1:B1")
+        ws["A2"], ws["B2"], ws["C2"] = "a", "b", "c"
+
+    _, text = _convert(_write(tmp_path, build), table_format)
+
+    assert text == expected
+
+
+def test_merged_label_above_headers_becomes_text(tmp_path):
+    def build(wb):
+        ws = wb.active
+        ws["A1"] = "Sales_2024 <EU>"
+        ws.merge_cells("A1:B1")
+        ws["A2"], ws["B2"] = "Month", "Total"
+        ws["A3"], ws["B3"] = "Jan", 10
+
+    count, text = _convert(_write(tmp_path, build))
+
+    assert count == 1
+    assert text == (
+        "Sales\\_2024 &lt;EU&gt;\n\n"
+        "<table><tbody><tr><th>Month</th><th>Total</th></tr>"
+        "<tr><td>Jan</td><td>10</td></tr></tbody></table>"
+    )
+
+
+def test_table_spans_the_bounding_rectangle_of_its_region(tmp_path):
+    def build(wb):
+        ws = wb.active
+        # An L-shaped region: A1:A3 and B3:C3; "inner" touches no other cell
+        # but lies inside the rectangle, so it belongs to the same table
+        ws["A1"], ws["A2"], ws["A3"] = "a1", "a2", "a3"
+        ws["B3"], ws["C3"] = "b3", "c3"
+        ws["C1"] = "inner"
+        # Merged cells connect "right" to the cells below them
+        ws["E1"] = "right"
+        ws.merge_cells("E2:E3")
+        ws["E4"] = "e4"
+
+    count, text = _convert(_write(tmp_path, build))
+
+    tables = text.split("\n\n")
+    assert count == 2
+    assert tables[0] == (
+        "<table><tbody><tr><th>a1</th><th></th><th>inner</th></tr>"
+        "<tr><td>a2</td><td></td><td></td></tr>"
+        "<tr><td>a3</td><td>b3</td><td>c3</td></tr></tbody></table>"
+    )
+    assert tables[1] == (
+        "<table><tbody><tr><th>right</th></tr>"
+        '<tr><td rowspan="2"></td></tr><tr></tr>'
+        "<tr><td>e4</td></tr></tbody></table>"
+    )
+
+
+def test_items_are_ordered_by_top_row(tmp_path):
+    def build(wb):
+        ws = wb.active
+        # "late" starts the scan in row 2 but its region reaches up to row 1
+        # through merged cells, so it comes before "next" (row 2)
+        ws["B2"] = "late"
+        ws.merge_cells("B1:C1")
+        ws["E2"] = "next"
+
+    _, text = _convert(_write(tmp_path, build))
+
+    assert text.split("\n\n") == [
+        '<table><tbody><tr><th colspan="2"></th></tr>'
+        "<tr><td>late</td><td></td></tr></tbody></table>",
+        "<table><tbody><tr><th>next</th></tr></tbody></table>",
+    ]
+
+
+def test_merged_cells_are_read_per_sheet(tmp_path):
+    def build(wb):
+        wb.active["A1"] = "Plain"
+        other = wb.create_sheet("R&D <2024>")
+        other["A1"] = "Wide"
+        other.merge_cells("A1:C1")
+
+    _, text = _convert(_write(tmp_path, build))
+
+    assert text == (
+        "<table><tbody><tr><th>Plain</th></tr></tbody></table>\n\n"
+        '<table><tbody><tr><th colspan="3">Wide</th></tr></tbody></table>'
+    )
+
+
+def test_empty_workbook_writes_nothing(tmp_path):
+    count, text = _convert(_write(tmp_path, lambda wb: None))
+
+    assert count == 0
+    assert text == ""
+
+
+def _plain_tables(wb):
+    ws = wb.active
+    ws.append(["ID", "Name", "Score"])
+    ws.append([1, "Alice & Bob", 3.5])
+    ws.append([2, "Carol", None])
+    ws.append([3, "<b>", 7])
+    ws["E1"], ws["E2"] = "Side", "x"
+    ws["A7"], ws["B7"] = "Below", "table"
+    other = wb.create_sheet("Second")
+    other["B2"], other["C2"] = "Other", "Sheet"
+    other["B3"], other["C3"] = 10, 20
+
+
+def _merged_header(wb):
+    ws = wb.active
+    ws["A1"] = "Merged"
+    ws.merge_cells("A1:B1")
+    ws["A2"], ws["B2"] = "a", "b"
+
+
+def _scattered_regions(wb):
+    ws = wb.active
+    ws["A1"], ws["A2"], ws["A3"] = "a1", "a2", "a3"
+    ws["B3"], ws["C3"] = "b3", "c3"
+    ws["C1"] = "inner"
+    ws["F2"] = "late"
+    ws.merge_cells("F1:G1")
+    ws.merge_cells("E3:E4")
+    ws["E5"] = "e5"
+    ws["A6"] = "Title"
+    ws.merge_cells("A6:B6")
+    ws.merge_cells("C6:C7")
+    ws["A7"], ws["B7"] = "x", "y"
+
+
+def _hidden_and_rtl_sheets(wb):
+    wb.active["A1"], wb.active["B1"] = "שלום", "x\ny_z"
+    hidden = wb.create_sheet("hidden")
+    hidden["A1"] = "secret"
+    hidden.sheet_state = "hidden"
+
+
+def _docling_and_streamed_markdown(path, tmp_path, monkeypatch, table_format):
+    pytest.importorskip("docling")
+    from docling_lib.converter import DocumentConversionOptions, process_pdf
+
+    monkeypatch.chdir(tmp_path)
+
+    def _markdown(stream):
+        options = DocumentConversionOptions(
+            stream_spreadsheets=stream, table_format=table_format, use_cache=False
+        )
+        return process_pdf(path, tmp_path / str(stream), options=options).read_text(
+            encoding="utf-8"
+        )
+
+    return _markdown(stream=False), _markdown(stream=True)
+
+
+@pytest.mark.parametrize(
+    "build, table_format",
+    [
+        (_plain_tables, "html"),
+        pytest.param(
+            _plain_tables,
+            "markdown",
+            marks=pytest.mark.xfail(
+                strict=True, reason="Docling pads Markdown table columns"
+            ),
+        ),
+        (_merged_header, "html"),
+        (_scattered_regions, "html"),
+        (_hidden_and_rtl_sheets, "html"),
+    ],
+)
+def test_streamed_markdown_matches_docling(tmp_path, monkeypatch, build, table_format):
+    """
+    The streaming path must produce the same Markdown as the Docling pipeline;
+    it stays opt-in (stream_spreadsheets=True) until every case here passes.
+    """
+    path = _write(tmp_path, build)
+
+    docling, streamed = _docling_and_streamed_markdown(
+        path, tmp_path, monkeypatch, table_format
+    )
+
+    assert streamed == docling
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "real_sample.xlsx",
+        "sample7_financial.xlsx",
+        "meti_gijutsu_matrix.xlsx",
+        "meti_gattai_matrix.xlsx",
+    ],
+)
+def test_streamed_workbook_matches_docling(tmp_path, monkeypatch, name):
+    docling, streamed = _docling_and_streamed_markdown(
+        TEST_DATA_DIR / name, tmp_path, monkeypatch, "html"
+    )
+
+    assert streamed == docling
+
+
+def test_streaming_memory_stays_below_the_output_size(tmp_path):
+    """
+    100k rows are streamed with a peak far below the size of the Markdown
+    (openpyxl's read-only parser still keeps ~100 bytes per row).
+    """
+
+    def build(wb):
+        ws = wb.active
+        ws.append(["Text"])
+        for _ in range(100_000):
+            ws.append(["lorem ipsum " * 40])
+
+    path = _write(tmp_path, build)
+    md_path = tmp_path / "book.md"
+
+    tracemalloc.start()
+    try:
+        with open(md_path, "w", encoding="utf-8") as out:
+            count = write_spreadsheet_markdown(path, out, "html")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    size = md_path.stat().st_size
+    assert count == 1
+    assert size > 40_000_000
+    assert peak < size / 3
@@ -0,0 +1,60 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Import-time budgets in seconds. The server budget is dominated by FastAPI
+# itself; both are far below the several seconds Docling and torch need.
+STARTUP_BUDGETS = {
+    "docling_lib.cli": 0.5,
+    "docling_lib.server": 2.0,
+}
+
+# Modules that must only be imported once a conversion runs
+HEAVY_MODULES = ["docling", "docling_core", "torch", "openpyxl", "PIL", "pypdfium2"]
+
+_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted({{name.split(".")[0] for name in sys.modules}} & set({heavy!r}))
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def _import_in_fresh_interpreter(module):
+    # Runs this interpreter on a fixed snippet, with no untrusted input
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _SNIPPET.format(module=module, heavy=HEAVY_MODULES)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", list(STARTUP_BUDGETS))
+def test_startup_does_not_import_docling(module):
+    result = _import_in_fresh_interpreter(module)
+
+    assert result["loaded"] == []
+
+
+@pytest.mark.parametrize("module, budget", list(STARTUP_BUDGETS.items()))
+def test_startup_time_within_budget(module, budget):
+    # Best of three, to keep a busy machine from failing the test
+    seconds = min(_import_in_fresh_interpreter(module)["seconds"] for _ in range(3))
+
+    assert seconds < budget, f"import {module} took {seconds:.2f}s (budget {budget}s)"
+
+
+def test_cli_help_without_docling(capsys):
+    from docling_lib.cli import main
+
+    with pytest.raises(SystemExit) as e:
+        main(["--help"])
+
+    assert e.value.code == 0
+    assert "--rerender" in capsys.readouterr().out
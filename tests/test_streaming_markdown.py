@@ -0,0 +1,158 @@
+import tracemalloc
+from unittest.mock import MagicMock, patch
+
+import pytest
+from docling_core.transforms.serializer.markdown import MarkdownParams
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    GroupLabel,
+    ProvenanceItem,
+    Size,
+    TableCell,
+    TableData,
+)
+from docling_core.types.doc.document import BaseMeta, SummaryMetaField
+
+from docling_lib.converter import (
+    EnhancedMarkdownSerializer,
+    RenderConfig,
+    _save_document,
+)
+
+
+def _sample_document() -> DoclingDocument:
+    doc = DoclingDocument(name="streamed")
+    doc.add_heading(text="Introduction")
+    doc.add_text(label=DocItemLabel.TEXT, text="First paragraph.")
+    bullets = doc.add_group(label=GroupLabel.LIST, name="bullets")
+    doc.add_list_item(text="one", parent=bullets)
+    doc.add_list_item(text="two", parent=bullets)
+    table = TableData(num_rows=1, num_cols=2)
+    for col, text in enumerate(["a", "b"]):
+        table.table_cells.append(
+            TableCell(
+                text=text,
+                start_row_offset_idx=0,
+                end_row_offset_idx=1,
+                start_col_offset_idx=col,
+                end_col_offset_idx=col + 1,
+            )
+        )
+    doc.add_table(data=table)
+    doc.add_text(label=DocItemLabel.TEXT, text="Last paragraph.")
+    return doc
+
+
+@pytest.mark.parametrize("table_format", ["html", "markdown"])
+def test_iter_chunks_matches_full_serialization(table_format):
+    doc = _sample_document()
+
+    full = EnhancedMarkdownSerializer(doc=doc, table_format=table_format).serialize()
+    chunks = list(
+        EnhancedMarkdownSerializer(doc=doc, table_format=table_format).iter_chunks()
+    )
+
+    assert len(chunks) > 1
+    assert "\n\n".join(chunks) == full.text
+
+
+def _paged_document() -> DoclingDocument:
+    """Nested groups spanning two pages, with metadata on the body."""
+
+    def _prov(page_no):
+        return ProvenanceItem(
+            page_no=page_no, bbox=BoundingBox(l=0, t=0, r=1, b=1), charspan=(0, 1)
+        )
+
+    doc = DoclingDocument(name="paged")
+    for page_no in (1, 2):
+        doc.add_page(page_no=page_no, size=Size(width=100, height=100))
+    doc.add_heading(text="Introduction", prov=_prov(1))
+    bullets = doc.add_group(label=GroupLabel.LIST, name="bullets")
+    doc.add_list_item(text="one", parent=bullets, prov=_prov(1))
+    nested = doc.add_group(label=GroupLabel.LIST, name="nested", parent=bullets)
+    doc.add_list_item(text="one.a", parent=nested, prov=_prov(2))
+    section = doc.add_group(label=GroupLabel.SECTION, name="section")
+    doc.add_text(label=DocItemLabel.TEXT, text="Inside.", parent=section, prov=_prov(2))
+    # A top-level list that starts on a new page
+    doc.add_page(page_no=3, size=Size(width=100, height=100))
+    steps = doc.add_group(label=GroupLabel.LIST, name="steps")
+    doc.add_list_item(text="step", parent=steps, prov=_prov(3))
+    doc.body.meta = BaseMeta(summary=SummaryMetaField(text="A summary."))
+    return doc
+
+
+@pytest.mark.parametrize("placeholder", ["<!-- page break -->", ""])
+def test_iter_chunks_matches_serialization_with_page_breaks(placeholder):
+    doc = _paged_document()
+    params = MarkdownParams(page_break_placeholder=placeholder)
+
+    full = EnhancedMarkdownSerializer(doc=doc, params=params).serialize()
+    chunks = list(EnhancedMarkdownSerializer(doc=doc, params=params).iter_chunks())
+
+    assert "one.a" in full.text and "step" in full.text
+    assert "A summary." in full.text
+    assert "\n\n".join(chunks) == full.text
+
+
+def _long_document(paragraphs: int) -> DoclingDocument:
+    doc = DoclingDocument(name="long")
+    for index in range(paragraphs):
+        bullets = doc.add_group(label=GroupLabel.LIST, name=f"list {index}")
+        doc.add_list_item(text=f"Item {index}", parent=bullets)
+        doc.add_text(label=DocItemLabel.TEXT, text=f"Paragraph {index} " * 8)
+    return doc
+
+
+def _peak_streaming_memory(doc: DoclingDocument) -> tuple[int, int]:
+    """Returns the output size and the peak memory of iter_chunks()."""
+    tracemalloc.start()
+    try:
+        chunks = EnhancedMarkdownSerializer(doc=doc).iter_chunks()
+        size = sum(len(chunk) for chunk in chunks)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size, peak
+
+
+def test_iter_chunks_memory_does_not_grow_with_the_document():
+    small_size, small_peak = _peak_streaming_memory(_long_document(500))
+    large_size, large_peak = _peak_streaming_memory(_long_document(4000))
+
+    assert large_size > 7 * small_size
+    # Serializing the whole document would need several times its size
+    assert large_peak < large_size / 4
+    assert large_peak < 2 * small_peak
+
+
+def test_save_document_streams_chunks_after_frontmatter(tmp_path):
+    doc = MagicMock(spec=DoclingDocument)
+    doc.name = "Doc"
+
+    with patch("docling_lib.converter.EnhancedMarkdownSerializer") as MockSerializer:
+        MockSerializer.return_value.iter_chunks.return_value = iter(["# A", "b", "c"])
+        md_path = _save_document(doc, tmp_path, RenderConfig())
+
+    assert (
+        md_path.read_text(encoding="utf-8") == "---\ntitle: Doc\n---\n\n# A\n\nb\n\nc"
+    )
+    MockSerializer.return_value.serialize.assert_not_called()
+
+
+def test_failed_serialization_leaves_no_partial_file(tmp_path):
+    doc = MagicMock(spec=DoclingDocument)
+    doc.name = "Doc"
+
+    def _chunks():
+        yield "# Partial"
+        raise RuntimeError("serializer crashed")
+
+    with patch("docling_lib.converter.EnhancedMarkdownSerializer") as MockSerializer:
+        MockSerializer.return_value.iter_chunks.return_value = _chunks()
+        with pytest.raises(RuntimeError):
+            _save_document(doc, tmp_path, RenderConfig())
+
+    assert list(tmp_path.glob("*.md*")) == []
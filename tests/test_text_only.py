@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from docling.datamodel.base_models import InputFormat
+from docling_core.types.doc import DoclingDocument, ImageRefMode
+
+from docling_lib.converter import (
+    DocumentConversionOptions,
+    PDFConverter,
+    _save_document,
+)
+
+
+@pytest.mark.parametrize("text_only, expected", [(False, True), (True, False)])
+@patch("docling_lib.converter.DocumentConverter")
+def test_text_only_disables_image_generation(
+    MockDocumentConverter, text_only, expected
+):
+    PDFConverter(DocumentConversionOptions(text_only=text_only))
+
+    _, init_kwargs = MockDocumentConverter.call_args
+    pipeline_opts = init_kwargs["format_options"][InputFormat.PDF].pipeline_options
+    assert pipeline_opts.generate_picture_images is expected
+    assert pipeline_opts.generate_page_images is False
+
+
+def test_text_only_is_a_separate_pipeline_and_cache_entry():
+    default = DocumentConversionOptions()
+    text_only = DocumentConversionOptions(text_only=True)
+
+    assert default.pipeline != text_only.pipeline
+    assert default.output_signature() != text_only.output_signature()
+
+
+def test_save_document_text_only_writes_placeholders_only(tmp_path):
+    doc = MagicMock(spec=DoclingDocument)
+    doc.name = "Doc"
+    render = DocumentConversionOptions(text_only=True).render
+
+    with (
+        patch("docling_lib.converter.EnhancedMarkdownSerializer") as MockSerializer,
+        patch("docling_lib.converter._export_images") as mock_export,
+    ):
+        MockSerializer.return_value.iter_chunks.return_value = iter(["<!-- image -->"])
+        md_path = _save_document(doc, tmp_path, render)
+
+    assert md_path.exists()
+    assert not (tmp_path / "images").exists()
+    mock_export.assert_not_called()
+    params = MockSerializer.call_args.kwargs["params"]
+    assert params.image_mode == ImageRefMode.PLACEHOLDER
@@ -0,0 +1,137 @@
+import json
+import logging
+from unittest.mock import MagicMock, patch
+
+from docling_core.types.doc import DoclingDocument
+
+from docling_lib.converter import (
+    DocumentConversionOptions,
+    process_document,
+    process_pdf,
+)
+from docling_lib.timings import StageTimings, collect_timings, stage, timed_iter
+
+
+def test_stages_accumulate_only_while_collecting():
+    with stage("ignored"):
+        pass
+
+    with collect_timings() as timings:
+        for _ in range(2):
+            with stage("convert"):
+                pass
+        assert list(timed_iter(["a", "b"], "serialize")) == ["a", "b"]
+        timings.add_docling({"layout": MagicMock(times=[0.25, 0.5])})
+
+    stages = timings.as_dict()
+    assert list(stages) == ["convert", "serialize", "docling.layout"]
+    assert stages["docling.layout"] == 0.75
+
+
+def test_collector_can_be_resumed_in_another_context():
+    timings = StageTimings()
+    with collect_timings(timings):
+        with stage("convert"):
+            pass
+    with collect_timings(timings):
+        with stage("markdown_write"):
+            pass
+
+    assert list(timings.as_dict()) == ["convert", "markdown_write"]
+
+
+def _convert(tmp_path, monkeypatch, MockDocumentConverter, MockSerializer, **options):
+    monkeypatch.chdir(tmp_path)
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF")
+    doc = MagicMock(spec=DoclingDocument)
+    doc.name = "doc"
+    MockDocumentConverter.return_value.convert.return_value = MagicMock(
+        document=doc,
+        timings={"layout": MagicMock(times=[0.5]), "ocr": MagicMock(times=[])},
+    )
+    MockSerializer.return_value.iter_chunks.return_value = iter(["# Title", "Body"])
+    return process_document(
+        pdf_path,
+        tmp_path / "out",
+        DocumentConversionOptions(text_only=True, use_cache=False, **options),
+    )
+
+
+@patch("docling_lib.converter.EnhancedMarkdownSerializer")
+@patch("docling_lib.converter.DocumentConverter")
+def test_process_document_reports_stage_timings(
+    MockDocumentConverter, MockSerializer, tmp_path, monkeypatch, caplog
+):
+    with caplog.at_level(logging.INFO, logger="docling_lib.converter"):
+        result = _convert(
+            tmp_path,
+            monkeypatch,
+            MockDocumentConverter,
+            MockSerializer,
+            timings_output="sidecar",
+        )
+
+    assert result.ok and not result.cache_hit
+    for name in [
+        "validate",
+        "checkout_wait",
+        "converter_init",
+        "convert",
+        "serialize",
+        "markdown_write",
+    ]:
+        assert name in result.timings
+    assert result.timings["docling.layout"] == 0.5
+    assert result.total_seconds >= result.timings["convert"]
+    assert result.peak_rss_bytes > 0
+
+    sidecar = json.loads(
+        (tmp_path / "out" / "timings.json").read_text(encoding="utf-8")
+    )
+    assert sidecar == result.timing_record()
+    [record] = [
+        r.conversion_timings for r in caplog.records if hasattr(r, "conversion_timings")
+    ]
+    assert record["stages"] == result.timings
+
+
+@patch("docling_lib.converter.EnhancedMarkdownSerializer")
+@patch("docling_lib.converter.DocumentConverter")
+def test_timings_in_frontmatter(
+    MockDocumentConverter, MockSerializer, tmp_path, monkeypatch
+):
+    result = _convert(
+        tmp_path,
+        monkeypatch,
+        MockDocumentConverter,
+        MockSerializer,
+        timings_output="frontmatter",
+    )
+
+    content = result.output_path.read_text(encoding="utf-8")
+    frontmatter = content.split("---")[1]
+    assert "timings:\n" in frontmatter
+    assert "  docling.layout: 0.5\n" in frontmatter
+    assert not (tmp_path / "out" / "timings.json").exists()
+
+
+def test_process_document_reports_failures(tmp_path):
+    result = process_document(tmp_path / "missing.pdf", tmp_path / "out")
+
+    assert not result.ok
+    assert result.error
+    assert "validate" in result.timings
+    assert process_pdf(tmp_path / "missing.pdf", tmp_path / "out") is None
+
+
+def test_unknown_timings_output_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF")
+
+    result = process_document(
+        pdf_path, tmp_path / "out", DocumentConversionOptions(timings_output="yaml")
+    )
+
+    assert "Unsupported timings output" in result.error
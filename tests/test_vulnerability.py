@@ -1,18 +1,8 @@
 from unittest.mock import patch
 
-import pytest
-
 from docling_lib.converter import process_pdf
 
 
-@pytest.fixture(autouse=True)
-def reset_shared_converter():
-    """Resets the shared default converter before and after each test."""
-    import docling_lib.converter as converter_mod
-    converter_mod._default_pdf_converter = None
-    yield
-    converter_mod._default_pdf_converter = None
-
 @patch('docling_lib.converter.DocumentConverter')
 def test_process_pdf_with_directory_vulnerability_fixed(
     MockDocumentConverter, tmp_path, monkeypatch